@@ -0,0 +1,86 @@
+"""
+clean_text 벤치마크
+
+기존 순차 re.sub 방식과 단일 패턴 TextCleaner의 제목당 처리 시간을 비교한다.
+
+    python benchmarks/bench_clean_text.py --count 1000000
+"""
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from text_cleaner import TextCleaner
+
+
+def legacy_clean_text(text: str) -> str:
+    """기존 clean_text (패턴 6개를 순차 적용)"""
+    patterns = [
+        r'\s*\[[^\]]*\]',
+        r'\([^)]*\)',
+        r'[\^&,]+',
+        r'\b(폴리|무지|패턴|없음|제거|유니섹스)\b',
+        r'\s{2,}',
+        r'^\s+|\s+$'
+    ]
+
+    result = text
+    for pattern in patterns:
+        result = re.sub(pattern, ' ', result)
+
+    result = ' '.join(result.split())
+
+    return result.strip()
+
+
+def make_titles(count, seed=0):
+    """실제 상품명과 비슷한 형태의 제목 생성"""
+    rng = random.Random(seed)
+    brands = ['ADIDAS', '나이키', 'US폴로아센', '[S] 더엣지', 'THE EDGE', '후아유']
+    colors = ['블랙', '네이비', '스카이블루', '검정색', '화이트&블랙']
+    patterns = ['무지', '스트라이프', '체크', '도트무늬', '패턴 없음', '']
+    materials = ['면', '폴리', '면혼방', '코튼^폴리', '린넨, 면']
+    categories = ['맨투맨', '니트카라티', '셔츠(in&out)', '빅로고카라티셔츠', '유니섹스 후드']
+    return [
+        ' '.join([
+            rng.choice(brands), rng.choice(colors), rng.choice(patterns),
+            rng.choice(materials), rng.choice(categories)
+        ])
+        for _ in range(count)
+    ]
+
+
+def measure(func, titles):
+    """전체 처리 시간(초) 측정"""
+    start = time.perf_counter()
+    for title in titles:
+        func(title)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=1000000, help='제목 개수')
+    args = parser.parse_args()
+
+    titles = make_titles(args.count)
+    cleaner = TextCleaner()
+
+    # 결과가 같은지 먼저 확인
+    mismatches = sum(1 for title in titles if legacy_clean_text(title) != cleaner.clean(title))
+
+    legacy = measure(legacy_clean_text, titles)
+    compiled = measure(cleaner.clean, titles)
+
+    print(f"제목 수: {args.count:,} (결과 불일치 {mismatches}건)")
+    print(f"기존 clean_text : {legacy:8.3f}s  ({legacy / args.count * 1e6:6.2f} µs/제목)")
+    print(f"TextCleaner     : {compiled:8.3f}s  ({compiled / args.count * 1e6:6.2f} µs/제목)")
+    print(f"속도 향상       : {legacy / compiled:6.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+"""
+제목 생성 파이프라인 벤치마크
+
+합성 상품 시트와 유의어 사전(benchmarks/synthetic.py)으로 유의어 사전 로드,
+상품 시트 읽기, 제목 생성, 엑셀 쓰기/저장 시간을 각각 측정해 JSON으로 저장한다.
+--baseline으로 이전 결과 파일을 주면 같은 조건의 결과끼리 비교한다.
+
+    python benchmarks/bench_pipeline.py --rows 10000 100000 --entries 1000 \\
+        --output bench_result.json --baseline bench_baseline.json
+"""
+import argparse
+import json
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import openpyxl
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from excel_io import read_sheet_frame
+from frame_encoding import encode_frame
+from synonyms_manager import load_synonym_dict_from_sheets
+from transform import generate_titles
+from title_generator import available_backends
+from synthetic import CATEGORIES, make_dataset
+
+# 결과 비교 기준 (같은 조건인지 판단하는 항목)
+RESULT_KEY = ('rows', 'entries', 'versions', 'backend')
+
+
+class _FrameModel:
+    """generate_titles에 넘길 최소한의 모델 (화면 갱신 없음)"""
+
+    def __init__(self, df):
+        self._df = df
+
+    def update_cell(self, row, col, value):
+        pass
+
+    def update_cells(self, rows, col, values):
+        pass
+
+
+def read_catalog(path):
+    """앱과 같은 방식으로 상품 시트를 문자열 DataFrame으로 읽기"""
+    df, _ = read_sheet_frame(path)
+    return encode_frame(df)
+
+
+def _timed(func, *args, **kwargs):
+    """(결과, 소요 시간(초))"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def run_case(data_dir, rows, entries, versions, backend, seed=0):
+    """
+    조건 하나의 단계별 시간 측정
+
+    Returns:
+        dict: 조건 값과 단계별 시간(timings), 처리 속도
+    """
+    catalog_path, synonym_path = make_dataset(data_dir, rows, entries, seed)
+
+    synonym_dict, load_seconds = _timed(
+        load_synonym_dict_from_sheets, str(synonym_path), compiled=True, pre_clean=True
+    )
+    df, read_seconds = _timed(read_catalog, catalog_path)
+
+    # 제목을 쓰고 저장하는 파일은 원본을 복사해서 사용 (원본은 다음 실행에 재사용)
+    with tempfile.TemporaryDirectory() as work_dir:
+        target = Path(work_dir) / catalog_path.name
+        shutil.copyfile(catalog_path, target)
+        stats = generate_titles(
+            str(target), 'Sheet1', CATEGORIES, synonym_dict, list(range(len(df))),
+            versions, None, None, _FrameModel(df), collect_stats=True, backend=backend
+        )
+
+    timings = {'load_dictionary': load_seconds, 'read_catalog': read_seconds}
+    timings.update({name: seconds for name, (seconds, _) in stats.stages.items()})
+    return {
+        'rows': rows,
+        'entries': entries,
+        'versions': versions,
+        'backend': backend,
+        'timings': timings,
+        'titles': stats.titles,
+        'titles_per_sec': stats.titles_per_sec,
+        'rows_per_sec': stats.rows_per_sec,
+    }
+
+
+def compare(results, baseline, max_regression, min_seconds=0.05):
+    """
+    기준 결과와 비교해 출력
+
+    두 결과 모두 min_seconds보다 짧은 단계는 측정 오차가 크므로 느려짐으로 보지 않는다.
+
+    Returns:
+        list: 허용 범위를 넘게 느려진 (조건, 단계, 배율) 목록
+    """
+    base_by_key = {tuple(result[key] for key in RESULT_KEY): result for result in baseline}
+    regressions = []
+    for result in results:
+        key = tuple(result[key] for key in RESULT_KEY)
+        base = base_by_key.get(key)
+        if base is None:
+            print(f"{key}: 기준 결과 없음")
+            continue
+        print(f"\n{dict(zip(RESULT_KEY, key))}")
+        for stage, seconds in result['timings'].items():
+            base_seconds = base['timings'].get(stage)
+            if not base_seconds:
+                continue
+            ratio = seconds / base_seconds
+            flag = ''
+            if ratio > 1 + max_regression and max(seconds, base_seconds) >= min_seconds:
+                regressions.append((key, stage, ratio))
+                flag = '  << 느려짐'
+            print(f"  {stage:<26}{base_seconds:9.3f}s → {seconds:9.3f}s  ({ratio:5.2f}x){flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000], help='상품 시트 행 수 (여러 개 가능)')
+    parser.add_argument('--entries', type=int, nargs='+', default=[1000],
+                        help='카테고리당 유의어 원본 항목 수 (여러 개 가능)')
+    parser.add_argument('--versions', type=int, default=3, help='생성할 버전 수')
+    parser.add_argument('--backend', choices=available_backends(), nargs='+', default=['vectorized'],
+                        help='제목 생성 백엔드 (여러 개 가능)')
+    parser.add_argument('--seed', type=int, default=0, help='합성 데이터 시드')
+    parser.add_argument('--data-dir', default='bench_data', help='합성 데이터 폴더 (재사용)')
+    parser.add_argument('--output', help='결과 JSON 경로')
+    parser.add_argument('--baseline', help='비교할 기준 결과 JSON 경로')
+    parser.add_argument('--max-regression', type=float, default=0.2,
+                        help='허용할 최대 느려짐 비율 (0.2 = 20%%, 넘으면 종료 코드 1)')
+    parser.add_argument('--min-seconds', type=float, default=0.05,
+                        help='이보다 짧은 단계는 느려짐 판정에서 제외')
+    args = parser.parse_args()
+
+    results = []
+    for entries in args.entries:
+        for rows in args.rows:
+            for backend in args.backend:
+                result = run_case(args.data_dir, rows, entries, args.versions, backend, args.seed)
+                results.append(result)
+                timings = ', '.join(f"{name} {seconds:.3f}s" for name, seconds in result['timings'].items())
+                print(f"[{backend}] {rows:,}행 / 사전 {entries:,}항목: {timings} "
+                      f"({result['titles_per_sec']:,.0f}제목/초)")
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'pandas': pd.__version__,
+            'openpyxl': openpyxl.__version__,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'seed': args.seed,
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.max_regression, args.min_seconds)
+        if regressions:
+            print(f"\n허용 범위({args.max_regression:.0%})를 넘게 느려진 단계 {len(regressions)}개")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
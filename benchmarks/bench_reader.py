@@ -0,0 +1,91 @@
+"""
+엑셀 읽기 엔진 벤치마크 (openpyxl 읽기 전용 vs 시트 XML 직접 스트리밍)
+
+합성 상품 시트와 유의어 사전(benchmarks/synthetic.py)으로 엔진별 상품 시트 읽기와
+유의어 사전 로드 시간을 측정하고, 두 엔진의 결과가 같은지 확인한다.
+유의어 사전 캐시(synonym_cache)에 저장한 뒤 다시 불러오는 시간도 함께 측정한다.
+
+    python benchmarks/bench_reader.py --rows 100000 200000 --entries 1000
+"""
+import argparse
+import shutil
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from excel_io import ENGINES, read_sheet_frame
+from synonyms_manager import load_synonym_dict_from_sheets
+from synthetic import make_dataset
+
+
+def _best_of(repeat, func, *args, **kwargs):
+    """(마지막 결과, 가장 짧은 소요 시간(초))"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return result, best
+
+
+def run_case(data_dir, rows, entries, repeat=1, seed=0):
+    """
+    조건 하나의 엔진별 읽기 시간 측정
+
+    Returns:
+        dict: {엔진: {'read_catalog': 초, 'load_dictionary': 초}}
+    """
+    catalog_path, synonym_path = make_dataset(data_dir, rows, entries, seed)
+    timings = {}
+    frames, dictionaries = {}, {}
+    for engine in ENGINES:
+        (frames[engine], _), read_seconds = _best_of(
+            repeat, read_sheet_frame, str(catalog_path), engine=engine
+        )
+        dictionaries[engine], load_seconds = _best_of(
+            repeat, load_synonym_dict_from_sheets, str(synonym_path), engine=engine
+        )
+        timings[engine] = {'read_catalog': read_seconds, 'load_dictionary': load_seconds}
+
+    # 캐시 적중 (첫 로드로 캐시를 만든 뒤 측정)
+    cache_dir = Path(data_dir) / 'synonym_cache'
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    load_synonym_dict_from_sheets(str(synonym_path), cache_dir=str(cache_dir))
+    dictionaries['cache'], load_seconds = _best_of(
+        repeat, load_synonym_dict_from_sheets, str(synonym_path), cache_dir=str(cache_dir)
+    )
+    timings['cache'] = {'load_dictionary': load_seconds}
+
+    reference = next(iter(ENGINES))
+    for engine in ENGINES:
+        assert frames[engine].equals(frames[reference]), f"{engine}: 상품 시트 결과가 다름"
+    for engine in dictionaries:
+        assert dictionaries[engine] == dictionaries[reference], f"{engine}: 유의어 사전 결과가 다름"
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[100000], help='상품 시트 행 수 (여러 개 가능)')
+    parser.add_argument('--entries', type=int, default=1000, help='카테고리당 유의어 원본 항목 수')
+    parser.add_argument('--repeat', type=int, default=1, help='반복 횟수 (가장 짧은 시간 사용)')
+    parser.add_argument('--seed', type=int, default=0, help='합성 데이터 시드')
+    parser.add_argument('--data-dir', default='bench_data', help='합성 데이터 폴더 (재사용)')
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        timings = run_case(args.data_dir, rows, args.entries, args.repeat, args.seed)
+        print(f"{rows:,}행 / 사전 {args.entries:,}항목")
+        base = timings['openpyxl']
+        for engine, stages in timings.items():
+            summary = ', '.join(
+                f"{stage} {seconds:.3f}s ({base[stage] / seconds:.1f}x)" for stage, seconds in stages.items()
+            )
+            print(f"  [{engine}] {summary}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+"""
+합성 상품 시트/유의어 사전 생성기
+
+실제 데이터처럼 일부 값이 많이 반복되도록(지프 분포) 상품 시트와 유의어 사전 엑셀 파일을
+만든다. 같은 시드면 항상 같은 파일이 만들어지므로 벤치마크 결과를 서로 비교할 수 있다.
+
+    python benchmarks/synthetic.py --rows 100000 --entries 5000 --out bench_data
+"""
+import argparse
+import itertools
+import random
+from pathlib import Path
+
+import openpyxl
+
+CATEGORIES = ['브랜드', '색상', '패턴', '소재', '카테고리']
+
+# 상품 시트 컬럼 (상품명_N 열은 M열부터 추가됨)
+CATALOG_COLUMNS = ['상품코드'] + CATEGORIES + ['상품명']
+
+_SYLLABLES = (
+    '가나다라마바사아자차카타파하고노도로모보소오조초코토포호'
+    '그느드르므브스으즈츠크트프흐기니디리미비시이지치키티피히'
+)
+_LATIN = ['NBA', 'NIKE', 'ADIDAS', 'POLO', 'EDGE', 'MLB', 'FILA', 'KANGOL', 'LEE', 'GAP']
+_NOISE = ['[S] ', '(국내) ', '', '', '', '', '', '']
+
+
+def _make_word(rng, seen, min_len=2, max_len=4):
+    """겹치지 않는 한글 단어 생성"""
+    while True:
+        word = ''.join(rng.choice(_SYLLABLES) for _ in range(rng.randint(min_len, max_len)))
+        if rng.random() < 0.1:
+            word = f"{rng.choice(_LATIN)} {word}"
+        if word not in seen:
+            seen.add(word)
+            return word
+
+
+def make_synonym_entries(entries, seed=0):
+    """
+    카테고리별 유의어 항목 생성
+
+    Args:
+        entries: 카테고리당 원본 항목 수
+        seed: 난수 시드
+
+    Returns:
+        dict: {카테고리: [(원본, [유의어, ...]), ...]}
+    """
+    rng = random.Random(seed)
+    result = {}
+    for category in CATEGORIES:
+        seen = set()
+        rows = []
+        for _ in range(entries):
+            orig = _make_word(rng, seen)
+            synonyms = [orig] if rng.random() < 0.3 else []
+            for _ in range(rng.randint(1, 5)):
+                synonyms.append(rng.choice(_NOISE) + _make_word(rng, seen))
+            rows.append((orig, synonyms))
+        result[category] = rows
+    return result
+
+
+def write_synonym_workbook(path, entries, seed=0):
+    """
+    유의어 사전 엑셀 파일 생성 (카테고리별 시트, A열=원본, B열부터 유의어)
+
+    유의어가 많은 행은 네 번째부터 E열에 쉼표로 구분한 유의어를 넣어 실제 사전의 형태를 흉내 낸다.
+
+    Args:
+        path: 저장할 파일 경로
+        entries: 카테고리당 원본 항목 수
+        seed: 난수 시드
+
+    Returns:
+        dict: make_synonym_entries의 결과 (상품 시트 생성에 사용)
+    """
+    synonym_entries = make_synonym_entries(entries, seed)
+    wb = openpyxl.Workbook(write_only=True)
+    for category, rows in synonym_entries.items():
+        ws = wb.create_sheet(category)
+        ws.append(['원본', '유의어1', '유의어2', '유의어3', 'GPT 유의어'])
+        for orig, synonyms in rows:
+            head, tail = synonyms[:3], synonyms[3:]
+            head += [None] * (3 - len(head))
+            ws.append([orig] + head + ([', '.join(tail)] if tail else []))
+    wb.save(path)
+    return synonym_entries
+
+
+def _zipf_picker(rng, values, exponent=1.1):
+    """앞쪽 값일수록 자주 뽑히는 선택 함수 (지프 분포)"""
+    weights = [1 / (rank ** exponent) for rank in range(1, len(values) + 1)]
+    cumulative = list(itertools.accumulate(weights))
+    return lambda: rng.choices(values, cum_weights=cumulative)[0]
+
+
+def iter_catalog_rows(rows, synonym_entries, seed=0, unmatched_ratio=0.1, empty_ratio=0.05):
+    """
+    상품 시트 행 생성
+
+    Args:
+        rows: 행 수
+        synonym_entries: make_synonym_entries의 결과
+        seed: 난수 시드
+        unmatched_ratio: 사전에 없는 값의 비율
+        empty_ratio: 빈 값의 비율
+
+    Yields:
+        list: CATALOG_COLUMNS 순서의 행 값
+    """
+    rng = random.Random(seed + 1)
+    pickers = {}
+    for category in CATEGORIES:
+        keys = [orig for orig, _ in synonym_entries[category]]
+        rng.shuffle(keys)
+        # 사전에 없는 값도 적은 수의 값이 반복되도록 작은 풀에서 뽑음
+        unmatched = [f"미등록{category}{i}" for i in range(max(1, len(keys) // 20))]
+        pickers[category] = (_zipf_picker(rng, keys), _zipf_picker(rng, unmatched))
+
+    for row_idx in range(rows):
+        values = []
+        for category in CATEGORIES:
+            matched, unmatched = pickers[category]
+            draw = rng.random()
+            if draw < empty_ratio:
+                values.append('')
+            elif draw < empty_ratio + unmatched_ratio:
+                values.append(unmatched())
+            else:
+                values.append(matched())
+        yield [f"P{row_idx:08d}"] + values + [' '.join(filter(None, values))]
+
+
+def write_catalog_workbook(path, rows, synonym_entries, seed=0):
+    """
+    상품 시트 엑셀 파일 생성 (첫 시트 'Sheet1', 1행은 헤더)
+
+    Args:
+        path: 저장할 파일 경로
+        rows: 행 수
+        synonym_entries: make_synonym_entries의 결과
+        seed: 난수 시드
+    """
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet('Sheet1')
+    ws.append(CATALOG_COLUMNS)
+    for row in iter_catalog_rows(rows, synonym_entries, seed):
+        ws.append(row)
+    wb.save(path)
+
+
+def make_dataset(directory, rows, entries, seed=0):
+    """
+    벤치마크용 상품 시트와 유의어 사전 생성 (이미 있으면 재사용)
+
+    Args:
+        directory: 파일을 만들 폴더
+        rows: 상품 시트 행 수
+        entries: 카테고리당 유의어 원본 항목 수
+        seed: 난수 시드
+
+    Returns:
+        tuple: (상품 시트 경로, 유의어 사전 경로)
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    synonym_path = directory / f"synonyms_{entries}_{seed}.xlsx"
+    catalog_path = directory / f"catalog_{rows}_{entries}_{seed}.xlsx"
+
+    synonym_entries = None
+    if not synonym_path.exists():
+        synonym_entries = write_synonym_workbook(synonym_path, entries, seed)
+    if not catalog_path.exists():
+        write_catalog_workbook(
+            catalog_path, rows, synonym_entries or make_synonym_entries(entries, seed), seed
+        )
+    return catalog_path, synonym_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=10000, help='상품 시트 행 수')
+    parser.add_argument('--entries', type=int, default=1000, help='카테고리당 유의어 원본 항목 수')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    parser.add_argument('--out', default='bench_data', help='파일을 만들 폴더')
+    args = parser.parse_args()
+
+    catalog_path, synonym_path = make_dataset(args.out, args.rows, args.entries, args.seed)
+    print(f"상품 시트: {catalog_path}")
+    print(f"유의어 사전: {synonym_path}")
+
+
+if __name__ == '__main__':
+    main()
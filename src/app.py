@@ -3,7 +3,6 @@
 import os
 import json
 import platform
-import openpyxl
 
 # 운영체제별 플랫폼 자동 설정
 if platform.system() == "Windows":
@@ -20,8 +19,16 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 
 from synonyms_manager import load_synonym_dict_from_sheets
+from text_cleaner import set_stopwords, get_stopwords
 from transform import generate_titles
 from dataframe_model import DataFrameModel
+from frame_encoding import encode_frame, frame_memory, format_memory
+from excel_io import open_workbook
+from save_worker import SaveWorker
+from title_generator.config import (
+    SAMPLE_SEED, TITLE_TEMPLATES, DEFAULT_TEMPLATE, TITLE_BACKEND, EXCEL_ENGINE, SAVE_MODE,
+    SYNONYM_CACHE_DIR
+)
 
 
 class MainWindow(QMainWindow):
@@ -36,6 +43,13 @@ class MainWindow(QMainWindow):
         self.current_sheet = ""
         self.settings_file = "settings.json"
         self.last_directory = ""
+        self.title_template = DEFAULT_TEMPLATE
+        self.backend = TITLE_BACKEND  # 제목 생성 백엔드
+        self.workers = None  # 병렬 생성 프로세스 수 (None이면 CPU 수)
+        self.excel_engine = EXCEL_ENGINE  # 엑셀 읽기 엔진 ('openpyxl', 'xml')
+        self.save_mode = SAVE_MODE  # 제목 저장 방식 ('openpyxl', 'patch')
+        self._save_worker = None  # 백그라운드 저장 스레드
+        self._run_stats = None  # 저장이 끝나면 표시할 실행 통계
         
         # 체크박스 매핑(브랜드, 색상, 패턴, 소재, 카테고리)
         self.checkbox_mapping = {}
@@ -106,6 +120,11 @@ class MainWindow(QMainWindow):
         self.chk_overwrite.setChecked(True)
         settings_group.addWidget(self.chk_overwrite)
 
+        # 무작위 조합 체크박스 (버전마다 서로 다른 조합을 무작위 추출)
+        self.chk_random = QCheckBox("무작위 조합")
+        self.chk_random.setChecked(False)
+        settings_group.addWidget(self.chk_random)
+
         # 실행 버튼
         self.btn_transform = QPushButton("실행")
         self.btn_transform.clicked.connect(self.transform_data)
@@ -185,11 +204,20 @@ class MainWindow(QMainWindow):
             if selected_file:
                 self.load_excel_file(selected_file)
                 try:
-                    self.synonym_dict = load_synonym_dict_from_sheets(selected_file)
+                    self.synonym_dict = load_synonym_dict_from_sheets(
+                        selected_file, compiled=True, pre_clean=True, groups=True, compact=True,
+                        engine=self.excel_engine, cache_dir=SYNONYM_CACHE_DIR
+                    )
                     if self.synonym_dict:
                         self.status_bar.showMessage(
                             f"유의어 사전 로드 완료: {len(self.synonym_dict)}개 단어"
                         )
+                        report = self.synonym_dict.clean_report
+                        if report['modified']:
+                            self.update_log(
+                                f"유의어 정리: {len(report['modified'])}개 수정, "
+                                f"{len(report['emptied'])}개 비워짐"
+                            )
                     else:
                         self.show_message(
                             "경고",
@@ -204,60 +232,37 @@ class MainWindow(QMainWindow):
     def load_excel_file(self, path: str):
         """엑셀 파일 로드 및 시트 선택"""
         try:
-            wb = None
-            wb_values = None
-            try:
-                # 수식 보존을 위해 data_only=False로 읽기
-                wb = openpyxl.load_workbook(path)
-                # 수식 결과를 얻기 위해 data_only=True로 다시 읽기
-                wb_values = openpyxl.load_workbook(path, data_only=True)
-                
-                if len(wb.sheetnames) > 1:
+            # 읽기 전용/값만 모드로 한 번만 열기 (수식 보존 워크북은 제목 저장 시에만 열림)
+            with open_workbook(path, self.excel_engine) as reader:
+                sheetnames = reader.sheetnames
+                if len(sheetnames) > 1:
                     sheet_name, ok = QInputDialog.getItem(
                         self,
                         "시트 선택",
                         "처리할 시트를 선택하세요:",
-                        wb.sheetnames,
+                        sheetnames,
                         0,
                         False
                     )
                     if not ok:
-                        wb.close()
                         return
                 else:
-                    sheet_name = wb.sheetnames[0]
+                    sheet_name = sheetnames[0]
 
-                ws = wb[sheet_name]
-                
-                # 데이터를 직접 읽어서 DataFrame 생성
-                data = []
-                headers = []
-                for cell in ws[1]:
-                    headers.append(cell.value)
-                
-                ws_values = wb_values[sheet_name]
-                
-                for row in ws_values.iter_rows(min_row=2):
-                    row_data = []
-                    for cell in row:
-                        value = cell.value if cell.value is not None else ''
-                        row_data.append(str(value))
-                    data.append(row_data)
-                
-                df = pd.DataFrame(data, columns=headers)
+                # 행 값으로 바로 DataFrame 생성
+                df = reader.read_frame(sheet_name)
 
-                self._df = df
-                self._model.setDataFrame(df)
-                self.file_path = path
-                self.current_sheet = sheet_name
-                self.label_file.setText(f"불러온 파일: {path} ({sheet_name})")
-                self.status_bar.showMessage(f"{len(df)} 행 로드 완료")
+            # 속성 컬럼은 카테고리형, 나머지 텍스트는 Arrow 문자열로 변환
+            memory_before = frame_memory(df)
+            df = encode_frame(df)
+            self.update_log(format_memory(memory_before, frame_memory(df)))
 
-            finally:
-                if wb:
-                    wb.close()
-                if wb_values:
-                    wb_values.close()
+            self._df = df
+            self._model.setDataFrame(df)
+            self.file_path = path
+            self.current_sheet = sheet_name
+            self.label_file.setText(f"불러온 파일: {path} ({sheet_name})")
+            self.status_bar.showMessage(f"{len(df)} 행 로드 완료")
 
         except Exception as e:
             self.show_message("오류", f"파일 열기 실패: {e}")
@@ -320,7 +325,7 @@ class MainWindow(QMainWindow):
             self.update_log(f"선택된 행: {', '.join(map(str, selected_rows))}")
 
             # 유의어 치환
-            generate_titles(
+            stats = generate_titles(
                 self.file_path,
                 self.current_sheet,
                 col_selection,
@@ -330,12 +335,61 @@ class MainWindow(QMainWindow):
                 lambda current, total: progress.setValue(current),
                 self.update_log,
                 self._model,
-                overwrite=self.chk_overwrite.isChecked()
+                overwrite=self.chk_overwrite.isChecked(),
+                backend=self.backend,
+                workers=self.workers,
+                save_mode=self.save_mode,
+                collect_stats=True,
+                sample_seed=SAMPLE_SEED if self.chk_random.isChecked() else None,
+                template=self.title_template,
+                save_handler=self.start_save
             )
 
+            # 단계별 처리 시간은 백그라운드 저장이 끝난 뒤 저장 시간과 함께 표시
+            # (저장 스레드의 시그널은 이 함수가 끝난 뒤에 처리됨)
+            self._run_stats = stats
+
         except Exception as e:
             self.show_message("오류", f"제목 생성 중 오류 발생: {str(e)}")
 
+    def start_save(self, job):
+        """제목 저장 작업을 백그라운드에서 실행 (진행 상황 표시, 파일 교체 전까지 취소 가능)"""
+        dialog = QProgressDialog("저장 중...", "취소", 0, 0, self)
+        dialog.setWindowModality(Qt.WindowModal)
+        dialog.setMinimumDuration(0)
+
+        worker = SaveWorker(job, self)
+        worker.progressed.connect(
+            lambda size, parts: dialog.setLabelText(f"저장 중: {parts}개 파트, {size / 2**20:,.1f}MB")
+        )
+        dialog.canceled.connect(worker.cancel)
+        worker.message.connect(self.update_log)
+        worker.saved.connect(self.on_saved)
+        worker.cancelled.connect(lambda: self.update_log("저장 취소: 원본 파일은 바뀌지 않았습니다."))
+        worker.failed.connect(lambda message: self.show_message("오류", f"저장 실패: {message}"))
+        worker.finished.connect(dialog.reset)
+        worker.finished.connect(self.show_run_stats)
+        worker.finished.connect(lambda: self.btn_transform.setEnabled(True))
+
+        # 저장이 끝날 때까지 같은 파일에 다시 실행하지 않도록 막음
+        self.btn_transform.setEnabled(False)
+        self._save_worker = worker
+        worker.start()
+
+    def on_saved(self, seconds):
+        """저장 완료 (저장 시간을 실행 통계의 save_workbook 단계로 기록)"""
+        self.update_log(f"저장 완료 ({seconds:.2f}초)")
+        if self._run_stats is not None:
+            self._run_stats.add('save_workbook', seconds)
+            self._run_stats.elapsed += seconds
+
+    def show_run_stats(self):
+        """저장 스레드가 끝나면 실행 통계 표시 (취소/실패하면 저장 단계 없이 표시)"""
+        stats, self._run_stats = self._run_stats, None
+        if stats is not None:
+            for line in stats.lines():
+                self.update_log(line)
+
     def on_selection_changed(self, selected, deselected):
         """테이블 선택 변경 시 상태바에 선택 행 수 표시"""
         rows = self.table_view.selectionModel().selectedRows()
@@ -366,9 +420,27 @@ class MainWindow(QMainWindow):
             if 'versions' in settings:
                 self.spin_version.setValue(settings['versions'])
 
+            # 무작위 조합 여부 복원
+            if 'random_versions' in settings:
+                self.chk_random.setChecked(settings['random_versions'])
+
             # 최근 파일 경로 복원
             self.last_directory = settings.get('last_directory', '')
 
+            # 제목 정리 시 제거할 단어 복원
+            if 'stopwords' in settings:
+                set_stopwords(settings['stopwords'])
+
+            # 마켓별 제목 템플릿과 사용할 템플릿 복원
+            TITLE_TEMPLATES.update(settings.get('title_templates', {}))
+            self.title_template = settings.get('title_template', DEFAULT_TEMPLATE)
+
+            # 제목 생성 백엔드, 병렬 생성 프로세스 수, 엑셀 읽기 엔진, 저장 방식 복원
+            self.backend = settings.get('backend', TITLE_BACKEND)
+            self.workers = settings.get('workers')
+            self.excel_engine = settings.get('excel_engine', EXCEL_ENGINE)
+            self.save_mode = settings.get('save_mode', SAVE_MODE)
+
         except Exception as e:
             print(f"설정 로드 중 오류 발생: {str(e)}")
 
@@ -381,7 +453,15 @@ class MainWindow(QMainWindow):
             'material': self.chk_material.isChecked(),
             'category': self.chk_category.isChecked(),
             'versions': self.spin_version.value(),
-            'last_directory': os.path.dirname(self.file_path) if self.file_path else ''
+            'random_versions': self.chk_random.isChecked(),
+            'last_directory': os.path.dirname(self.file_path) if self.file_path else '',
+            'stopwords': get_stopwords(),
+            'title_templates': TITLE_TEMPLATES,
+            'title_template': self.title_template,
+            'backend': self.backend,
+            'workers': self.workers,
+            'excel_engine': self.excel_engine,
+            'save_mode': self.save_mode
         }
         try:
             with open(self.settings_file, 'w', encoding='utf-8') as f:
@@ -390,8 +470,10 @@ class MainWindow(QMainWindow):
             print(f"설정 저장 중 오류 발생: {str(e)}")
 
     def closeEvent(self, event):
-        """프로그램 종료 시 설정 저장"""
+        """프로그램 종료 시 설정 저장 (저장 중이면 끝날 때까지 기다림)"""
         self.saveSettings()
+        if self._save_worker is not None:
+            self._save_worker.wait()
         super().closeEvent(event)
 
     def select_all_rows(self):
@@ -4,6 +4,8 @@ from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QColor, QBrush
 from typing import Any, Optional
 
+from frame_encoding import ensure_writable
+
 class DataFrameModel(QAbstractTableModel):
     """DataFrame을 TableView에 표시하기 위한 모델"""
     
@@ -63,11 +65,21 @@ class DataFrameModel(QAbstractTableModel):
     def update_cell(self, row: int, col: int, value: Any) -> None:
         """특정 셀 업데이트"""
         if 0 <= row < len(self._df) and 0 <= col < len(self._df.columns):
+            ensure_writable(self._df, col)
             self._df.iloc[row, col] = value
             # 변경 알림
             index = self.index(row, col)
             self.dataChanged.emit(index, index, [Qt.DisplayRole])
 
+    def update_cells(self, rows, col: int, values) -> None:
+        """한 열의 여러 셀을 한 번에 업데이트 (변경 알림도 한 번)"""
+        if rows and 0 <= col < len(self._df.columns):
+            ensure_writable(self._df, col)
+            self._df.iloc[rows, col] = values
+            self.dataChanged.emit(
+                self.index(min(rows), col), self.index(max(rows), col), [Qt.DisplayRole]
+            )
+
 
 def test_dataframe_model():
     """DataFrameModel 테스트"""
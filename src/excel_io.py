@@ -0,0 +1,114 @@
+"""
+엑셀 읽기 모듈
+
+상품 시트는 읽기 전용(read_only) + 값만(data_only) 모드로 한 번만 열고, 선택한 시트의 행을
+순서대로 읽어 바로 DataFrame을 만든다. 수식을 보존해야 하는 워크북은 제목을 써 넣을 때
+(transform.generate_titles) 처음으로 연다.
+
+읽기 엔진은 'openpyxl'(SheetReader)과 시트 XML을 직접 읽는 'xml'(xlsx_reader.XlsxReader)이 있고
+config.EXCEL_ENGINE이 기본값이다. 두 엔진은 같은 값을 돌려준다.
+"""
+import openpyxl
+import pandas as pd
+
+from title_generator.config import EXCEL_ENGINE
+from xlsx_reader import XlsxReader
+
+
+class SheetReader:
+    """
+    읽기 전용 워크북 (시트 목록 확인 후 같은 워크북에서 시트 읽기)
+
+        with SheetReader(path) as reader:
+            df = reader.read_frame(reader.sheetnames[0])
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """워크북 닫기 (파일 핸들 해제)"""
+        if self._wb is not None:
+            self._wb.close()
+            self._wb = None
+
+    @property
+    def sheetnames(self):
+        """시트 이름 목록"""
+        return self._wb.sheetnames
+
+    def iter_rows(self, sheet_name):
+        """시트의 행 값 튜플 (1행 포함)"""
+        return self._wb[sheet_name].iter_rows(values_only=True)
+
+    def read_frame(self, sheet_name):
+        """
+        시트를 문자열 DataFrame으로 읽기
+
+        1행은 헤더, 2행부터 데이터이며 빈 셀은 ''로, 나머지 값은 str로 바꾼다.
+        행마다 셀 개수가 다르면 가장 긴 행에 맞춰 ''로 채운다.
+
+        Args:
+            sheet_name: 읽을 시트 이름
+
+        Returns:
+            DataFrame: 모든 값이 문자열인 DataFrame
+        """
+        rows = self.iter_rows(sheet_name)
+        headers = list(next(rows, ()))
+        data = [['' if value is None else str(value) for value in row] for row in rows]
+
+        width = max([len(headers)] + [len(row) for row in data])
+        headers += [None] * (width - len(headers))
+        for row in data:
+            if len(row) < width:
+                row.extend([''] * (width - len(row)))
+        return pd.DataFrame(data, columns=headers)
+
+
+ENGINES = {
+    'openpyxl': SheetReader,
+    'xml': XlsxReader,
+}
+
+
+def open_workbook(path, engine=None):
+    """
+    읽기 엔진으로 워크북 열기
+
+    Args:
+        path: 엑셀 파일 경로
+        engine: 'openpyxl' 또는 'xml' (None이면 config.EXCEL_ENGINE)
+
+    Returns:
+        SheetReader 또는 XlsxReader (sheetnames/iter_rows/read_frame/close 제공)
+    """
+    engine = engine or EXCEL_ENGINE
+    if engine not in ENGINES:
+        raise ValueError(f"알 수 없는 읽기 엔진: {engine} (사용 가능: {', '.join(ENGINES)})")
+    return ENGINES[engine](path)
+
+
+def read_sheet_frame(path, sheet_name=None, engine=None):
+    """
+    시트 하나를 문자열 DataFrame으로 읽기
+
+    Args:
+        path: 엑셀 파일 경로
+        sheet_name: 읽을 시트 이름 (None이면 첫 번째 시트)
+        engine: 읽기 엔진 (None이면 config.EXCEL_ENGINE)
+
+    Returns:
+        tuple: (DataFrame, 읽은 시트 이름)
+    """
+    with open_workbook(path, engine) as reader:
+        if sheet_name is None:
+            sheet_name = reader.sheetnames[0]
+        return reader.read_frame(sheet_name), sheet_name
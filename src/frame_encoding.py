@@ -0,0 +1,95 @@
+"""
+상품 시트 DataFrame 인코딩 모듈
+
+엑셀에서 읽은 값은 모두 파이썬 str 객체(object dtype)라서 행이 많으면 메모리를 많이 쓴다.
+반복이 많은 속성 컬럼(config.ORDERED_COLUMNS)은 카테고리형으로, 나머지 텍스트 컬럼은
+pyarrow가 설치되어 있으면 Arrow 문자열로 바꾼다. (pyarrow가 없으면 그대로 둠)
+"""
+import re
+
+import pandas as pd
+
+from title_generator.config import ORDERED_COLUMNS
+
+# 제목을 써 넣는 컬럼 (상품명_1, 상품명_2, ...)
+_TITLE_COLUMN = re.compile(r'상품명_\d+')
+
+try:
+    import pyarrow  # noqa: F401
+    ARROW_STRING = pd.StringDtype('pyarrow')
+except ImportError:
+    ARROW_STRING = None
+
+
+def frame_memory(df):
+    """
+    DataFrame 메모리 사용량 (문자열 내용 포함)
+
+    Returns:
+        int: 바이트 수
+    """
+    return int(df.memory_usage(deep=True).sum())
+
+
+def format_memory(before, after):
+    """
+    인코딩 전후 메모리 사용량 메시지
+
+    Args:
+        before: 인코딩 전 바이트 수
+        after: 인코딩 후 바이트 수
+
+    Returns:
+        str: 로그 메시지
+    """
+    ratio = before / after if after else 0
+    return f"메모리 사용량: {before / 2**20:,.1f}MB → {after / 2**20:,.1f}MB ({ratio:.1f}배 절감)"
+
+
+def encode_frame(df, category_columns=ORDERED_COLUMNS, text_dtype=ARROW_STRING):
+    """
+    속성 컬럼은 카테고리형, 나머지 텍스트 컬럼은 Arrow 문자열로 변환
+
+    값은 바뀌지 않으므로 셀 값(str)과 제목 생성 결과는 인코딩 전과 같다.
+    제목을 써 넣는 상품명_N 컬럼은 category_columns에 있어도 카테고리형으로 바꾸지 않는다.
+    (카테고리에 없는 새 값을 넣을 수 없음)
+    (엑셀에서 읽을 때 빈 셀은 ''로 채우므로 결측값은 없다고 가정한다. 카테고리형에서는
+    None도 NaN이 됨)
+
+    Args:
+        df: 엑셀에서 읽은 object dtype DataFrame
+        category_columns: 카테고리형으로 바꿀 컬럼들
+        text_dtype: 나머지 텍스트 컬럼의 dtype (None이면 변환하지 않음)
+
+    Returns:
+        DataFrame: 인코딩한 새 DataFrame (원본은 바뀌지 않음)
+    """
+    encoded = df.copy(deep=False)
+    category_columns = set(category_columns)
+    # 중복/빈 헤더가 있어도 위치로 처리
+    for idx, column in enumerate(df.columns):
+        values = df.iloc[:, idx]
+        if values.dtype != object:
+            continue
+        if column in category_columns and not _TITLE_COLUMN.fullmatch(str(column)):
+            encoded.isetitem(idx, values.astype('category'))
+        elif text_dtype is not None and pd.api.types.infer_dtype(values, skipna=True) == 'string':
+            encoded.isetitem(idx, values.astype(text_dtype))
+    return encoded
+
+
+def ensure_writable(df, col):
+    """
+    위치 col의 컬럼에 새 문자열을 쓸 수 있도록 준비 (제자리 변경)
+
+    카테고리형 컬럼에는 카테고리에 없는 값을 넣을 수 없으므로, 제목을 쓰기 전에
+    카테고리 값의 dtype(문자열이면 object)으로 되돌린다. 다른 dtype은 그대로 둔다.
+    (속성 컬럼 자리가 상품명_N으로 바뀐 경우 등)
+
+    Args:
+        df: DataFrame
+        col: 컬럼 위치 (0부터)
+    """
+    values = df.iloc[:, col]
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        df.isetitem(col, values.astype(values.cat.categories.dtype))
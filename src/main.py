@@ -1,9 +1,12 @@
 # main.py
 import sys
+import multiprocessing
 from PySide6.QtWidgets import QApplication
 from app import MainWindow
 
 def main():
+    # 실행 파일로 묶었을 때 병렬 생성 작업 프로세스가 창을 다시 띄우지 않도록 함
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     window = MainWindow()
     window.resize(1200, 800)
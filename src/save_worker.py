@@ -0,0 +1,162 @@
+"""
+원자적 저장 모듈 (임시 파일에 쓴 뒤 os.replace로 교체)
+
+저장 중에 프로그램이 죽거나 사용자가 취소해도 원본 파일은 그대로 남도록, 같은 폴더의 임시
+파일에 zip 파트를 모두 쓴 다음 마지막에 os.replace로 바꾼다. (같은 파일 시스템이므로 원자적)
+파트를 하나 쓸 때마다 지금까지 쓴 바이트 수/파트 수를 알리고, 파트 사이와 교체 직전에
+취소 여부를 확인한다.
+
+SaveWorker는 저장 작업을 Qt 백그라운드 스레드에서 실행한다. (PySide6가 없으면 None)
+"""
+import datetime
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+
+from openpyxl.writer.excel import ExcelWriter
+
+try:
+    from PySide6.QtCore import QThread, Signal
+except ImportError:
+    QThread = None
+
+
+class SaveCancelled(Exception):
+    """사용자가 저장을 취소함 (원본 파일은 바뀌지 않음)"""
+
+
+class ProgressZipFile(zipfile.ZipFile):
+    """
+    파트를 쓸 때마다 진행 상황을 알리고 취소 여부를 확인하는 ZipFile
+
+    Args:
+        file: 쓸 파일 경로 또는 파일 객체
+        progress: progress(쓴 바이트 수, 쓴 파트 수) 콜백 (None이면 알리지 않음)
+        cancelled: 취소되었으면 True를 돌려주는 함수 (None이면 취소 없음)
+    """
+
+    def __init__(self, file, progress=None, cancelled=None):
+        super().__init__(file, 'w', zipfile.ZIP_DEFLATED, allowZip64=True)
+        self.progress = progress
+        self.cancelled = cancelled
+        self.parts = 0
+
+    def _check_cancelled(self):
+        if self.cancelled is not None and self.cancelled():
+            raise SaveCancelled("저장이 취소되었습니다.")
+
+    def _report(self):
+        self.parts += 1
+        if self.progress is not None:
+            self.progress(self.fp.tell(), self.parts)
+
+    def writestr(self, *args, **kwargs):
+        self._check_cancelled()
+        super().writestr(*args, **kwargs)
+        self._report()
+
+    def write(self, *args, **kwargs):
+        self._check_cancelled()
+        super().write(*args, **kwargs)
+        self._report()
+
+
+def atomic_write(path, write, progress=None, cancelled=None):
+    """
+    임시 파일에 zip을 쓴 뒤 원본과 교체
+
+    Args:
+        path: 저장할 파일 경로
+        write: write(archive) — ProgressZipFile에 파트를 쓰는 함수
+        progress: progress(쓴 바이트 수, 쓴 파트 수) 콜백
+        cancelled: 취소 여부 함수 (교체 직전까지 확인)
+
+    Returns:
+        int: 저장한 파일 크기 (바이트)
+
+    Raises:
+        SaveCancelled: 취소됨 (임시 파일은 지우고 원본은 그대로)
+    """
+    path = os.path.abspath(path)
+    fd, temp_path = tempfile.mkstemp(suffix='.xlsx', dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, 'w+b') as temp_file:
+            with ProgressZipFile(temp_file, progress, cancelled) as archive:
+                write(archive)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+            size = temp_file.tell()
+
+        if cancelled is not None and cancelled():
+            raise SaveCancelled("저장이 취소되었습니다.")
+        if os.path.exists(path):
+            shutil.copymode(path, temp_path)  # mkstemp 파일은 소유자 전용 권한
+        os.replace(temp_path, path)
+        return size
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def save_workbook_atomic(wb, path, progress=None, cancelled=None):
+    """
+    openpyxl 워크북을 원자적으로 저장 (Workbook.save와 같은 내용)
+
+    Returns:
+        int: 저장한 파일 크기 (바이트)
+    """
+    if wb.write_only and not wb.worksheets:
+        wb.create_sheet()
+
+    def write(archive):
+        wb.properties.modified = datetime.datetime.now(tz=datetime.timezone.utc).replace(tzinfo=None)
+        writer = ExcelWriter(wb, archive)
+        writer.write_data()
+
+    return atomic_write(path, write, progress, cancelled)
+
+
+if QThread is not None:
+
+    class SaveWorker(QThread):
+        """
+        저장 작업을 백그라운드 스레드에서 실행
+
+        job은 job(progress, cancelled, log)로 호출하는 저장 함수이다. (transform.generate_titles의
+        save_handler가 받는 함수) 결과는 시그널로 알린다.
+
+            progressed(쓴 바이트 수, 쓴 파트 수), saved(소요 시간(초)), cancelled(), failed(메시지),
+            message(로그 메시지)
+        """
+
+        progressed = Signal(object, int)  # 바이트 수는 2GB를 넘을 수 있음
+        saved = Signal(float)
+        cancelled = Signal()
+        failed = Signal(str)
+        message = Signal(str)
+
+        def __init__(self, job, parent=None):
+            super().__init__(parent)
+            self.job = job
+            self._cancel_requested = False
+
+        def cancel(self):
+            """저장 취소 요청 (파일 교체 전이면 원본 유지)"""
+            self._cancel_requested = True
+
+        def run(self):
+            start = time.perf_counter()
+            try:
+                self.job(self.progressed.emit, lambda: self._cancel_requested, self.message.emit)
+            except SaveCancelled:
+                self.cancelled.emit()
+            except Exception as e:
+                self.failed.emit(str(e))
+            else:
+                self.saved.emit(time.perf_counter() - start)
+
+else:
+    SaveWorker = None
@@ -0,0 +1,173 @@
+"""
+유의어 사전 캐시 모듈 (파싱·정규화한 사전을 로컬 파일에 저장)
+
+파일을 열 때마다 유의어 시트를 다시 읽고 색인을 만들지 않도록, 만든 사전을 피클로 저장해 두고
+같은 워크북을 다시 열면 그대로 불러온다. 캐시 파일은 워크북 경로와 로드 옵션별로 하나이며,
+다음 값으로 유효성을 확인한다.
+
+    - 워크북 경로 + 수정 시각(mtime) + 크기: 같으면 워크북을 열지 않고 바로 사용
+    - 유의어 시트 XML(+ 워크북/공유 문자열/스타일 파트)의 sha256: 수정 시각이 달라도
+      (예: 제목 셀만 패치 저장) 유의어 시트 내용이 같으면 사용하고 수정 시각을 갱신
+
+캐시 파일이 없거나 깨졌거나 형식이 다르면 캐시 미적중으로 처리한다. (캐시는 이 프로그램이 쓴
+로컬 파일만 읽음) 불러온 사전에는 새 리비전을 부여해 이전 사전 기준의 제목 캐시를 무효화한다.
+"""
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+
+from title_generator.config import SYNONYM_CACHE_DIR
+from title_generator.synonym_index import bump_dictionary_revision
+from xlsx_reader import XlsxReader
+
+logger = logging.getLogger(__name__)
+
+# 캐시 형식 버전 (저장하는 사전 구조나 캐시 키가 바뀌면 올림)
+CACHE_FORMAT = 2
+
+_CHUNK_SIZE = 1 << 20
+
+
+def sheets_digest(excel_path, sheet_names):
+    """
+    유의어 시트 내용의 sha256
+
+    시트 이름과 시트 XML, 값 변환에 쓰는 워크북/공유 문자열/스타일 파트를 압축을 푼 내용으로
+    해시한다. (zip 압축 방식이 달라도 내용이 같으면 같은 값)
+
+    Args:
+        excel_path: 엑셀 파일 경로
+        sheet_names: 유의어 시트 이름 목록
+
+    Returns:
+        str: 16진수 해시
+    """
+    digest = hashlib.sha256()
+    with XlsxReader(excel_path) as reader:
+        present = [name for name in sheet_names if name in reader.sheetnames]
+        digest.update(repr(present).encode('utf-8'))
+        for part in reader.value_parts(present):
+            digest.update(part.encode('utf-8') + b'\0')
+            with reader.open_part(part) as source:
+                for chunk in iter(lambda: source.read(_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _file_stat(excel_path):
+    """(수정 시각(ns), 크기)"""
+    stat = os.stat(excel_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _cache_file(cache_dir, path, options):
+    """워크북 경로 + 로드 옵션별 캐시 파일 경로"""
+    name = hashlib.sha256(repr((path, options)).encode('utf-8')).hexdigest()[:32]
+    return os.path.join(cache_dir, f'{name}.pickle')
+
+
+def _restore(entry):
+    """캐시 항목의 사전 복원 (정리 기록 다시 붙이고 새 리비전 부여)"""
+    result = entry['result']
+    if hasattr(result, 'revision'):
+        # CompactSynonymIndex는 피클에서 정리 기록을 빼므로 따로 저장한 것을 붙임
+        result.clean_report = entry['clean_report']
+        result.revision = bump_dictionary_revision()
+    else:
+        bump_dictionary_revision()
+    return result
+
+
+def load_cached(excel_path, sheet_names, options, cache_dir=None):
+    """
+    캐시된 유의어 사전 불러오기
+
+    Args:
+        excel_path: 엑셀 파일 경로
+        sheet_names: 유의어 시트 이름 목록
+        options: 로드 옵션 (결과가 달라지는 값만, 예: compiled/pre_clean/groups/compact와
+                 미리 정리할 때 기준이 되는 불필요한 단어 목록)
+        cache_dir: 캐시 폴더 (None이면 config.SYNONYM_CACHE_DIR)
+
+    Returns:
+        tuple: (사전 또는 None, 캐시 키)
+               캐시 키는 미적중일 때 store_cached에 넘긴다. (캐시를 쓸 수 없는 파일이면 None)
+    """
+    path = os.path.abspath(excel_path)
+    options = (tuple(sheet_names), tuple(sorted(options.items())))
+    try:
+        mtime_ns, size = _file_stat(path)
+    except OSError:
+        return None, None
+    key = {
+        'file': _cache_file(cache_dir or SYNONYM_CACHE_DIR, path, options),
+        'path': path, 'options': options, 'mtime_ns': mtime_ns, 'size': size, 'digest': None,
+    }
+
+    entry = None
+    try:
+        with open(key['file'], 'rb') as f:
+            entry = pickle.load(f)
+        if (entry.get('format') != CACHE_FORMAT or entry.get('path') != path
+                or entry.get('options') != options):
+            entry = None
+    except Exception:
+        entry = None
+
+    # 수정 시각과 크기가 같으면 워크북을 열지 않음
+    if entry is not None and (entry['mtime_ns'], entry['size']) == (mtime_ns, size):
+        return _restore(entry), key
+
+    try:
+        key['digest'] = sheets_digest(path, sheet_names)
+    except Exception:
+        return None, None
+    if entry is not None and entry['digest'] == key['digest']:
+        # 유의어 시트는 그대로이므로 수정 시각만 갱신
+        result = _restore(entry)
+        entry.update(mtime_ns=mtime_ns, size=size)
+        _write_entry(key['file'], entry)
+        return result, key
+    return None, key
+
+
+def store_cached(key, result):
+    """
+    유의어 사전을 캐시에 저장 (load_cached가 돌려준 키 사용)
+
+    저장에 실패해도 사전 로드는 계속되어야 하므로 오류는 무시한다.
+
+    Args:
+        key: load_cached가 돌려준 캐시 키 (None이면 저장하지 않음)
+        result: 저장할 사전
+    """
+    if key is None or key['digest'] is None:
+        return
+    _write_entry(key['file'], {
+        'format': CACHE_FORMAT,
+        'path': key['path'],
+        'options': key['options'],
+        'mtime_ns': key['mtime_ns'],
+        'size': key['size'],
+        'digest': key['digest'],
+        'clean_report': getattr(result, 'clean_report', None),
+        'result': result,
+    })
+
+
+def _write_entry(cache_file, entry):
+    """캐시 파일 쓰기 (임시 파일에 쓴 뒤 교체, 실패하면 무시)"""
+    cache_dir = os.path.dirname(cache_file)
+    temp_path = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=cache_dir)
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_file)
+    except Exception as e:
+        logger.warning("유의어 사전 캐시 저장 실패: %s", e)
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
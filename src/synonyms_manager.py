@@ -1,78 +1,113 @@
 # synonyms_manager.py
-import openpyxl
 from typing import Dict, List, Set
+from excel_io import open_workbook
+from synonym_cache import load_cached, store_cached
+from text_cleaner import stopwords_snapshot
+from title_generator.synonym_index import build_synonym_index, bump_dictionary_revision
+from title_generator.compact_index import compact_synonym_index
 
 def normalize_text(text: str) -> str:
     """텍스트 정규화"""
     return text.strip().upper()
 
-def load_synonym_dict_from_sheets(excel_path: str, sheet_names=None) -> Dict[str, Dict[str, List[str]]]:
-    """유의어 사전 로드"""
+def load_synonym_dict_from_sheets(excel_path: str, sheet_names=None,
+                                  compiled: bool = False,
+                                  pre_clean: bool = False,
+                                  groups: bool = False,
+                                  compact: bool = False,
+                                  engine: str = None,
+                                  cache_dir: str = None) -> Dict[str, Dict[str, List[str]]]:
+    """
+    유의어 사전 로드
+    
+    compiled=True면 조회용 SynonymIndex로 컴파일해서 반환한다.
+    pre_clean=True면 유의어를 미리 정리한 SynonymIndex를 반환하며,
+    정리로 바뀌거나 비워진 항목은 결과의 clean_report에 기록된다.
+    groups=True면 원본뿐 아니라 유의어로도 조회할 수 있는 SynonymIndex를 반환한다.
+    (원본/유의어가 겹치는 항목은 하나의 그룹으로 합쳐짐)
+    compact=True면 문자열을 한 번만 보관하는 압축 색인(CompactSynonymIndex)을 반환한다.
+    engine은 엑셀 읽기 엔진이다. ('openpyxl' 또는 'xml', None이면 config.EXCEL_ENGINE)
+    유의어 시트만 읽기 전용으로 읽으며, 'xml' 엔진은 다른 시트의 XML은 열지 않는다.
+    cache_dir을 주면 만든 사전을 그 폴더에 캐시하고, 같은 워크북(경로/수정 시각 또는
+    유의어 시트 내용이 같음)을 다시 열면 워크북을 읽지 않고 캐시에서 불러온다. (synonym_cache 참고)
+    """
     if sheet_names is None:
         sheet_names = ["브랜드", "색상", "패턴", "소재", "카테고리"]
         
     try:
-        wb = openpyxl.load_workbook(excel_path, data_only=True)
+        cache_key = None
+        if cache_dir is not None:
+            options = {'compiled': compiled, 'pre_clean': pre_clean, 'groups': groups, 'compact': compact,
+                       # 미리 정리한 유의어와 정리 기록은 불필요한 단어 목록에 따라 달라짐
+                       'stopwords': stopwords_snapshot() if pre_clean else None}
+            cached, cache_key = load_cached(excel_path, sheet_names, options, cache_dir)
+            if cached is not None:
+                return cached
+
         synonym_dict = {}
-        
-        for category in sheet_names:
-            if category not in wb.sheetnames:
-                continue
+        with open_workbook(excel_path, engine) as reader:
+            for category in sheet_names:
+                if category not in reader.sheetnames:
+                    continue
                 
-            ws = wb[category]
-            synonym_dict[category] = {}
+                synonym_dict[category] = {}
+                rows = reader.iter_rows(category)
+                next(rows, None)  # 1행은 헤더
             
-            # 데이터가 있는 마지막 행까지만 처리
-            max_row = ws.max_row
-            while max_row > 1:
-                if ws.cell(row=max_row, column=1).value:
-                    break
-                max_row -= 1
-            
-            # A열=원본, B~Z열=유의어들
-            for row_idx in range(2, max_row + 1):
-                orig = ws.cell(row=row_idx, column=1).value
-                if not orig:
-                    continue
-                    
-                orig = str(orig).strip()
-                seen: Set[str] = set()  # 중복 체크용
-                synonyms: List[str] = []
+                # A열=원본, B~Z열=유의어들
+                for row in rows:
+                    orig = row[0] if row else None
+                    if not orig:
+                        continue
+
+                    orig = str(orig).strip()
+                    seen: Set[str] = set()  # 중복 체크용
+                    synonyms: List[str] = []
                 
-                # 콤마로 구분된 데이터 처리
-                if ',' in orig:
-                    parts = [p.strip() for p in orig.split(',')]
-                    if len(parts) > 1:
-                        orig = parts[0]
-                        for part in parts[1:]:
-                            norm_part = normalize_text(part)
-                            if norm_part and norm_part not in seen:
-                                seen.add(norm_part)
-                                synonyms.append(part)
+                    # 콤마로 구분된 데이터 처리
+                    if ',' in orig:
+                        parts = [p.strip() for p in orig.split(',')]
+                        if len(parts) > 1:
+                            orig = parts[0]
+                            for part in parts[1:]:
+                                norm_part = normalize_text(part)
+                                if norm_part and norm_part not in seen:
+                                    seen.add(norm_part)
+                                    synonyms.append(part)
                 
-                # B열부터 순차적으로 유의어 처리
-                for col_idx in range(2, ws.max_column + 1):
-                    syn = ws.cell(row=row_idx, column=col_idx).value
-                    if syn:
-                        syn = str(syn).strip()
-                        if col_idx == 5:  # E열인 경우
-                            # 콤마로 구분된 데이터를 분리
-                            gpt_synonyms = [s.strip() for s in syn.split(',')]
-                            for gpt_syn in gpt_synonyms:
-                                norm_syn = normalize_text(gpt_syn)
+                    # B열부터 순차적으로 유의어 처리
+                    for col_idx, syn in enumerate(row[1:], start=2):
+                        if syn:
+                            syn = str(syn).strip()
+                            if col_idx == 5:  # E열인 경우
+                                # 콤마로 구분된 데이터를 분리
+                                gpt_synonyms = [s.strip() for s in syn.split(',')]
+                                for gpt_syn in gpt_synonyms:
+                                    norm_syn = normalize_text(gpt_syn)
+                                    if norm_syn and norm_syn not in seen:
+                                        seen.add(norm_syn)
+                                        synonyms.append(gpt_syn)
+                            else:
+                                norm_syn = normalize_text(syn)
                                 if norm_syn and norm_syn not in seen:
                                     seen.add(norm_syn)
-                                    synonyms.append(gpt_syn)
-                        else:
-                            norm_syn = normalize_text(syn)
-                            if norm_syn and norm_syn not in seen:
-                                seen.add(norm_syn)
-                                synonyms.append(syn)
+                                    synonyms.append(syn)
                 
-                if synonyms:  # 유의어가 있을 때만 추가
-                    synonym_dict[category][orig] = synonyms
-                    
-        return synonym_dict
+                    if synonyms:  # 유의어가 있을 때만 추가
+                        synonym_dict[category][orig] = synonyms
+        
+        if compact:
+            result = compact_synonym_index(
+                build_synonym_index(synonym_dict, pre_clean=pre_clean, groups=groups)
+            )
+        elif compiled or pre_clean or groups:
+            result = build_synonym_index(synonym_dict, pre_clean=pre_clean, groups=groups)
+        else:
+            # 새 사전이므로 이전 사전 기준의 제목 캐시 무효화
+            bump_dictionary_revision()
+            result = synonym_dict
+        store_cached(cache_key, result)
+        return result
         
     except Exception as e:
         print(f"유의어 사전 로드 실패: {str(e)}")
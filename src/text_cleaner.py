@@ -1,31 +1,104 @@
 import re
 
+# 기본 불필요 단어 ("체크"는 제거하지 않음)
+DEFAULT_STOPWORDS = ['폴리', '무지', '패턴', '없음', '제거', '유니섹스']
+
+# 조각을 이어 붙였을 때 정리 결과가 달라질 수 있는 문자 (괄호 쌍이 조각 경계를 넘는 경우)
+_BRACKET_CHARS = frozenset('[]()')
+
+# is_clean 결과를 보관할 최대 개수
+_CLEAN_PART_CACHE_SIZE = 100000
+
+# 제거할 패턴 정의
+REMOVE_PATTERNS = [
+    # 괄호 및 내용
+    r'\[[^\]]*\]',            # [S], [없음] 등 대괄호와 내용
+    # (in&out) 등 소괄호와 내용
+    # - 대괄호를 먼저 지우던 순서를 유지하기 위해 소괄호 안의 [..]는 통째로 건너뜀
+    r'\((?:\[[^\]]*\]|[^)\[]|\[(?![^\]]*\]))*\)',
+
+    # 특수문자
+    r'[\^&,]+',               # ^, &, , (쉼표까지 추가)
+]
+
+
+class TextCleaner:
+    """
+    미리 컴파일한 정규식 하나로 한 번에 정리하는 텍스트 정리기
+
+    괄호, 특수문자, 불필요한 단어와 그 주변 공백을 하나의 패턴으로 묶어
+    공백 하나로 치환하고, 남은 연속 공백도 같은 치환에서 함께 정리한다.
+    """
+
+    def __init__(self, stopwords=None):
+        self.stopwords = tuple(
+            word for word in (DEFAULT_STOPWORDS if stopwords is None else stopwords) if word
+        )
+        # 여러 단어로 된 불필요한 단어는 조각 경계를 넘어 지워질 수 있으므로 조각 단위 판단 불가
+        self.joins_clean = not any(char.isspace() for word in self.stopwords for char in word)
+
+        removable = list(REMOVE_PATTERNS)
+        first_chars = r'\s\[(\^&,'
+        if self.stopwords:
+            # 불필요한 단어 (단어 경계 처리)
+            words = '|'.join(re.escape(word) for word in self.stopwords)
+            removable.append(rf'\b(?:{words})\b')
+            first_chars += ''.join(re.escape(word[0]) for word in self.stopwords)
+
+        # 제거 대상이 연속된 구간(사이 공백 포함) 또는 공백 구간 → 공백 하나
+        # (첫 글자 전방 탐색으로 해당 없는 위치는 바로 건너뜀)
+        self._pattern = re.compile(
+            rf'(?=[{first_chars}])(?:(?:\s*(?:{"|".join(removable)}))+\s*|\s+)'
+        )
+        self._clean_parts = {}
+
+    def clean(self, text: str) -> str:
+        """특수문자와 불필요한 단어 제거 및 텍스트 정규화"""
+        return self._pattern.sub(' ', text).strip()
+
+    __call__ = clean
+
+    def is_clean(self, text: str) -> bool:
+        """
+        이미 정리된 조각인지 확인
+
+        정리해도 바뀌지 않고 괄호 문자가 없는 조각들은 공백으로 이어 붙여도
+        정리 결과가 그대로이므로, 제목 전체의 정리를 생략할 수 있다.
+        (불필요한 단어에 공백이 있으면 항상 False)
+        """
+        cached = self._clean_parts.get(text)
+        if cached is None:
+            cached = (self.joins_clean and _BRACKET_CHARS.isdisjoint(text)
+                      and self.clean(text) == text)
+            if len(self._clean_parts) < _CLEAN_PART_CACHE_SIZE:
+                self._clean_parts[text] = cached
+        return cached
+
+
+_default_cleaner = TextCleaner()
+
+
+def set_stopwords(stopwords):
+    """기본 정리기의 불필요한 단어 목록 변경 (None이면 기본 목록)"""
+    global _default_cleaner
+    _default_cleaner = TextCleaner(stopwords)
+
+
+def get_stopwords():
+    """기본 정리기의 불필요한 단어 목록"""
+    return list(_default_cleaner.stopwords)
+
+
+def stopwords_snapshot():
+    """기본 정리기의 불필요한 단어 튜플 (미리 정리한 사전의 기준과 비교용)"""
+    return _default_cleaner.stopwords
+
+
+def is_clean_part(text: str) -> bool:
+    """기본 정리기 기준으로 이미 정리된 조각인지 확인"""
+    return _default_cleaner.is_clean(text)
+
+
 def clean_text(text: str) -> str:
     """특수문자와 불필요한 단어 제거 및 텍스트 정규화"""
-    
-    # 1. 제거할 패턴 정의
-    patterns = [
-        # 괄호 및 내용
-        r'\s*\[[^\]]*\]',     # [S], [없음] 등 대괄호와 내용
-        r'\([^)]*\)',         # (in&out) 등 소괄호와 내용
-        
-        # 특수문자
-        r'[\^&,]+',           # ^, &, , (쉼표까지 추가)
-        
-        # 불필요한 단어 (단어 경계 처리)
-        r'\b(폴리|무지|패턴|없음|제거|유니섹스)\b',  # "체크" 제거하지 않음
-        
-        # 공백 정리
-        r'\s{2,}',            # 두 개 이상의 공백을 하나로
-        r'^\s+|\s+$'          # 앞뒤 공백
-    ]
-    
-    # 2. 패턴 순차 적용
-    result = text
-    for pattern in patterns:
-        result = re.sub(pattern, ' ', result)
-    
-    # 3. 최종 정리
-    result = ' '.join(result.split())
-    
-    return result.strip()
\ No newline at end of file
+    return _default_cleaner.clean(text)
@@ -1,62 +1,316 @@
 """
 유의어 치환 타이틀 생성기 패키지
+
+진단 메시지는 'title_generator' 로거로 남긴다. DEBUG 레벨은 기본적으로 꺼져 있고,
+꺼져 있을 때는 메시지 문자열도 만들지 않는다.
 """
-from text_cleaner import clean_text
+import logging
+from math import prod
+from text_cleaner import is_clean_part
 from .config import ORDERED_COLUMNS, DEFAULT_VALUES
 from .preprocessor import prepare_data
 from .synonym_matcher import find_synonyms
-from .version_calc import calculate_version_indices
-from .result_builder import generate_result
+from .version_calc import (
+    calculate_version_indices, iter_version_indices, iter_gray_changes,
+    sample_version_indices, row_sample_seed
+)
+from .result_builder import generate_result, build_token_slots
+from .synonym_index import (
+    SynonymIndex, CleanedSynonyms, PrecleanedSynonyms, build_synonym_index, normalize_key,
+    raw_synonyms, precleaned_current, is_precleaned
+)
+from .compact_index import (
+    StringTable, SynonymIds, CompactSynonymIndex, compact_synonym_index, token_source
+)
+from .vectorized import generate_title_matrix
+from .title_cache import TitleCache, default_title_cache
+from .combination_export import export_title_combinations
+from .template import TitlePlan, compile_template, get_title_plan
+from .parallel import generate_titles_parallel, iter_titles_parallel, resolve_worker_count
+from .diagnostics import ColumnStats, collect_column_stats
+from .profiling import PipelineStats, timed, timed_run, timed_stage
+from .free_text import FreeTextReplacer, generate_free_text_titles
+from .backends import (
+    register_backend, register_stream, available_backends, get_backend, iter_title_chunks
+)
+
+logger = logging.getLogger(__name__)
 
-def create_title_combination(row, col_selection, synonym_dict, version_idx):
+def _resolve_row(row, col_selection, synonym_dict, columns=ORDERED_COLUMNS, stats=None):
     """
-    유의어 치환으로 새로운 제목 생성
+    행의 유의어 후보와 고정 값 분리
     
     Args:
         row: 현재 행 데이터
         col_selection: 선택된 컬럼들
         synonym_dict: 유의어 사전
-        version_idx: 버전 인덱스 (0부터 시작)
+        columns: 처리할 컬럼 순서 (템플릿의 컬럼 순서)
+        stats: PipelineStats (있으면 prepare_data/find_synonyms 단계 측정)
     
     Returns:
-        tuple: (생성된 제목, 전체 조합 수)
+        tuple: (유의어 리스트들, 유의어가 적용된 컬럼들, 고정 값 딕셔너리)
     """
-    try:
-        ordered_lists = []
-        ordered_selections = []
-        
-        # 1. 데이터 전처리
-        processed_data = prepare_data(row, ORDERED_COLUMNS)
-        fixed_values = {}
-        
-        # 2. 컬럼별 유의어 처리
-        for key, value in processed_data.items():
-            if key in synonym_dict and key in col_selection and value:
-                synonyms = find_synonyms(value, synonym_dict[key])
-                if synonyms:
-                    ordered_lists.append(synonyms)
-                    ordered_selections.append(key)
-                else:
-                    fixed_values[key] = value
+    ordered_lists = []
+    ordered_selections = []
+    
+    # 1. 데이터 전처리
+    processed_data = timed(stats, 'prepare_data', prepare_data)(row, columns)
+    fixed_values = {}
+    match = timed(stats, 'find_synonyms', find_synonyms)
+    
+    # 2. 컬럼별 유의어 처리
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("processed_data: %s", processed_data)
+    for key, value in processed_data.items():
+        if key in synonym_dict and key in col_selection and value:
+            synonyms = match(value, synonym_dict[key])
+            if synonyms:
+                ordered_lists.append(synonyms)
+                ordered_selections.append(key)
             else:
                 fixed_values[key] = value
-        
-        # 3. 버전 인덱스 계산
-        selected_indices, total_combinations = calculate_version_indices(
-            ordered_lists, version_idx
+        else:
+            fixed_values[key] = value
+    
+    return ordered_lists, ordered_selections, fixed_values
+
+def _needs_clean(ordered_lists, fixed_values, plan=None, synonym_dict=None):
+    """
+    제목 전체 정리가 필요한지 확인
+    
+    유의어가 모두 미리 정리된 목록이고 고정 값도 정리된 조각이면
+    이어 붙인 결과도 이미 정리된 상태이므로 clean_text를 생략할 수 있다.
+    (템플릿은 공백으로만 이어 붙여야 하고, 사전은 현재 불필요한 단어 목록으로 정리된 것이어야 함)
+    """
+    if plan is not None and not plan.clean_safe:
+        return True
+    if ordered_lists and not precleaned_current(synonym_dict):
+        return True
+    if not all(is_precleaned(synonyms) for synonyms in ordered_lists):
+        return True
+    return not all(is_clean_part(value) for value in fixed_values.values() if value)
+
+class _RowRenderer:
+    """
+    한 행의 제목 조립기
+    
+    템플릿 컬럼 순서의 토큰 배열을 한 번 만들어 두고,
+    버전마다 유의어 자리만 바꿔 끼운 뒤 템플릿 계획대로 이어 붙인다.
+    (압축 색인의 유의어 ID 목록은 자리에 끼우는 토큰만 문자열로 변환)
+    stats를 주면 버전 인덱스 계산과 제목 조립/정리 시간을 측정한다.
+    """
+    
+    def __init__(self, plan, ordered_lists, ordered_selections, fixed_values, synonym_dict=None,
+                 stats=None):
+        self.plan = plan
+        self.render_title = plan.title_renderer(stats)
+        self.version_indices = timed(stats, 'calculate_version_indices', calculate_version_indices)
+        self.needs_clean = _needs_clean(ordered_lists, fixed_values, plan, synonym_dict)
+        if self.needs_clean:
+            # 제목 전체를 정리하므로 미리 정리한 유의어 대신 원본 사용
+            ordered_lists = [raw_synonyms(synonyms) for synonyms in ordered_lists]
+        self.ordered_lists = ordered_lists
+        self.sources = [token_source(synonyms) for synonyms in ordered_lists]
+        self.tokens, self.slots = build_token_slots(
+            plan.columns, ordered_selections, ordered_lists, fixed_values
         )
+    
+    def set_index(self, pos, value):
+        """유의어 자리 하나 갱신"""
+        tokens, ids = self.sources[pos]
+        self.tokens[self.slots[pos]] = tokens[ids[value]]
+    
+    def render(self, selected_indices=None):
+        """
+        현재 토큰(또는 selected_indices를 적용한 토큰)으로 제목 생성
         
-        # 4. 결과 생성
-        final_text = generate_result(
-            ORDERED_COLUMNS,
-            ordered_selections,
-            ordered_lists,
-            selected_indices,
-            fixed_values
+        Args:
+            selected_indices: 유의어 리스트별 선택 인덱스 (None이면 현재 토큰 그대로)
+        
+        Returns:
+            str: 생성된 제목
+        """
+        if selected_indices is not None:
+            for pos, value in enumerate(selected_indices):
+                self.set_index(pos, value)
+        return self.render_title(self.tokens, self.needs_clean)
+
+def _row_renderer(row, col_selection, synonym_dict, plan, stats=None):
+    """행 전처리/유의어 매칭 후 조립기 생성"""
+    ordered_lists, ordered_selections, fixed_values = _resolve_row(
+        row, col_selection, synonym_dict, plan.columns, stats
+    )
+    return _RowRenderer(plan, ordered_lists, ordered_selections, fixed_values, synonym_dict, stats)
+
+def _build_title(renderer, version_idx):
+    """버전 하나의 제목 생성 (버전 인덱스 계산 → 결과 생성 → 정리)"""
+    # 3. 버전 인덱스 계산
+    selected_indices, total_combinations = renderer.version_indices(
+        renderer.ordered_lists, version_idx
+    )
+    
+    # 4. 결과 생성
+    return renderer.render(selected_indices), total_combinations
+
+def create_title_combination(row, col_selection, synonym_dict, version_idx, template=None,
+                             stats=None):
+    """
+    유의어 치환으로 새로운 제목 생성
+    
+    Args:
+        row: 현재 행 데이터
+        col_selection: 선택된 컬럼들
+        synonym_dict: 유의어 사전 (또는 build_synonym_index로 컴파일된 SynonymIndex)
+        version_idx: 버전 인덱스 (0부터 시작)
+        template: 제목 템플릿 (이름, 템플릿 문자열 또는 TitlePlan, None이면 기본 템플릿)
+        stats: PipelineStats (있으면 단계별 시간 측정)
+    
+    Returns:
+        tuple: (생성된 제목, 전체 조합 수)
+    """
+    try:
+        renderer = _row_renderer(
+            row, col_selection, synonym_dict, get_title_plan(template), stats
         )
+        return _build_title(renderer, version_idx)
         
-        return clean_text(final_text), total_combinations
+    except Exception as e:
+        logger.error("create_title_combination: %s", e)
+        return f"{DEFAULT_VALUES['error_prefix']}{str(e)}", 0
+
+def create_title_combinations(row, col_selection, synonym_dict, versions, order='index',
+                              sample_seed=None, template=None, stats=None):
+    """
+    한 행의 여러 버전 제목을 한 번에 생성
+    
+    전처리와 유의어 매칭은 행마다 한 번만 수행하고,
+    버전별로는 인덱스 계산과 결과 생성만 반복한다.
+    
+    Args:
+        row: 현재 행 데이터
+        col_selection: 선택된 컬럼들
+        synonym_dict: 유의어 사전 (또는 SynonymIndex)
+        versions: 버전 개수(int) 또는 버전 인덱스 목록
+        order: 'index'면 버전 인덱스 순서, 'gray'면 그레이 코드 순서
+               ('gray'에서 버전 인덱스 n은 그레이 코드 순서의 n번째 조합)
+        sample_seed: 지정하면 버전 인덱스 대신 전체 조합 중 서로 다른 조합을
+                     무작위로 뽑는다. (행 속성 값과 시드로 행마다 재현 가능)
+        template: 제목 템플릿 (이름, 템플릿 문자열 또는 TitlePlan)
+        stats: PipelineStats (있으면 단계별 시간 측정)
+    
+    Returns:
+        tuple: (버전별 제목 리스트, 전체 조합 수)
+    """
+    version_indices = range(versions) if isinstance(versions, int) else list(versions)
+    
+    try:
+        plan = get_title_plan(template)
+        renderer = _row_renderer(row, col_selection, synonym_dict, plan, stats)
+        
+        titles = []
+        total_combinations = prod(len(synonyms) for synonyms in renderer.ordered_lists)
+        
+        if sample_seed is not None:
+            version_indices = _sample_versions(
+                row, total_combinations, len(version_indices), sample_seed, plan.columns
+            )
+        elif order == 'gray':
+            needed = max(version_indices, default=-1) + 1
+            titles = [title for _, title in _walk_gray(renderer, needed)]
+            # 조합 수보다 많이 요청하면 버전 인덱스처럼 순환
+            return [titles[i % total_combinations] for i in version_indices], total_combinations
+        
+        for version_idx in version_indices:
+            title, _ = _build_title(renderer, version_idx)
+            titles.append(title)
+        
+        return titles, total_combinations
         
     except Exception as e:
-        print(f"[ERROR] create_title_combination: {str(e)}")
-        return f"{DEFAULT_VALUES['error_prefix']}{str(e)}", 0 
\ No newline at end of file
+        logger.error("create_title_combinations: %s", e)
+        error = f"{DEFAULT_VALUES['error_prefix']}{str(e)}"
+        return [error] * len(version_indices), 0
+
+def iter_title_combinations(row, col_selection, synonym_dict, offset=0, cap=None,
+                            template=None):
+    """
+    한 행의 모든 조합 제목을 차례로 생성 (전체 조합을 메모리에 만들지 않음)
+    
+    offset/cap으로 조합 공간을 구간별로 나눠 처리할 수 있다.
+    (다음 구간은 offset + cap부터 이어서 처리)
+    
+    Args:
+        row: 현재 행 데이터
+        col_selection: 선택된 컬럼들
+        synonym_dict: 유의어 사전 (또는 SynonymIndex)
+        offset: 시작할 조합 번호
+        cap: 최대 생성 개수 (None이면 끝까지)
+        template: 제목 템플릿 (이름, 템플릿 문자열 또는 TitlePlan)
+    
+    Yields:
+        tuple: (조합 번호, 생성된 제목)
+    """
+    renderer = _row_renderer(row, col_selection, synonym_dict, get_title_plan(template))
+    
+    for combination_idx, selected_indices in iter_version_indices(
+        renderer.ordered_lists, offset, cap
+    ):
+        yield combination_idx, renderer.render(selected_indices)
+
+def _sample_versions(row, total_combinations, count, sample_seed, columns=ORDERED_COLUMNS):
+    """행별 시드로 서로 다른 조합 count개 추출 (조합 수보다 많으면 순환)"""
+    values = prepare_data(row, columns).values()
+    sampled = sample_version_indices(
+        total_combinations, count, row_sample_seed(values, sample_seed)
+    )
+    return [sampled[i % len(sampled)] for i in range(count)]
+
+def _walk_gray(renderer, cap=None):
+    """
+    그레이 코드 순서로 제목 생성
+    
+    이전 제목의 토큰 배열을 재사용하고, 다음 조합에서 바뀌는 유의어 자리 하나만 갱신한다.
+    
+    Yields:
+        tuple: (조합 번호, 생성된 제목)
+    """
+    radices = [len(synonyms) for synonyms in renderer.ordered_lists]
+    total_combinations = prod(radices)
+    limit = total_combinations if cap is None else min(total_combinations, cap)
+    if limit <= 0:
+        return
+    
+    strides = [prod(radices[:pos]) for pos in range(len(radices))]
+    selected_indices = [0] * len(radices)
+    combination_idx = 0
+    
+    yield combination_idx, renderer.render(selected_indices)
+    
+    changes = iter_gray_changes(radices)
+    for _ in range(limit - 1):
+        pos, value = next(changes)
+        combination_idx += (value - selected_indices[pos]) * strides[pos]
+        selected_indices[pos] = value
+        renderer.set_index(pos, value)
+        yield combination_idx, renderer.render()
+
+def iter_gray_title_combinations(row, col_selection, synonym_dict, cap=None, template=None):
+    """
+    한 행의 모든 조합 제목을 그레이 코드 순서로 생성
+    
+    연속된 두 제목은 유의어 한 자리만 다르다. 제목마다 토큰 배열을 새로 만들지 않고
+    바뀐 자리만 갱신하므로 버전이 늘어도 추가 비용이 컬럼 수에 비례하지 않는다.
+    
+    Args:
+        row: 현재 행 데이터
+        col_selection: 선택된 컬럼들
+        synonym_dict: 유의어 사전 (또는 SynonymIndex)
+        cap: 최대 생성 개수 (None이면 끝까지)
+        template: 제목 템플릿 (이름, 템플릿 문자열 또는 TitlePlan)
+    
+    Yields:
+        tuple: (조합 번호, 생성된 제목) - 조합 번호는 버전 인덱스 기준 번호
+    """
+    yield from _walk_gray(
+        _row_renderer(row, col_selection, synonym_dict, get_title_plan(template)), cap
+    )
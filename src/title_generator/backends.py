@@ -0,0 +1,267 @@
+"""
+제목 생성 백엔드 등록 모듈
+
+모든 백엔드는 같은 인터페이스로 선택된 행 전체의 버전별 제목을 만든다.
+
+    backend(df, rows, col_selection, synonym_dict, version_count,
+            sample_seed=None, template=None, stats=None, **options) -> rows 순서의 버전별 제목 리스트
+
+stats(PipelineStats)를 주면 백엔드가 엔진 단계별 시간을 기록한다.
+iter_title_chunks는 같은 제목을 행 청크 단위로 돌려주므로 결과를 청크마다 바로 쓸 수 있다.
+
+설정(config.TITLE_BACKEND) 또는 이름으로 백엔드를 고르며, 모든 백엔드는 같은 입력에
+대해 바이트 단위로 같은 제목을 만든다. (tests/test_backends.py에서 검증)
+"""
+import weakref
+
+import pandas as pd
+
+from .config import TITLE_BACKEND, PARALLEL_CHUNK_SIZE, PARALLEL_MIN_ROWS, FREE_TEXT_COLUMN
+from .synonym_index import SynonymIndex, build_synonym_index, dictionary_revision
+from .profiling import timed_stage
+
+_BACKENDS = {}
+# 청크 단위로 결과를 돌려주는 백엔드별 생성기 (없으면 청크마다 백엔드 호출)
+_STREAMS = {}
+
+# free_text 백엔드가 마지막으로 만든 (사전 약한 참조, 리비전, 카테고리, 치환기)
+# 사전을 붙잡아 두지 않도록 약한 참조로 보관하고, 사전이 사라지면 함께 비운다.
+_last_replacer = None
+
+
+def _forget_replacer(ref):
+    """치환기를 만든 사전이 사라지면 재사용 기록 비우기"""
+    global _last_replacer
+    if _last_replacer is not None and _last_replacer[0] is ref:
+        _last_replacer = None
+
+
+def register_backend(name):
+    """
+    백엔드 등록 데코레이터
+
+    Args:
+        name: 백엔드 이름 (같은 이름이 있으면 덮어씀)
+    """
+    def decorator(func):
+        _BACKENDS[name] = func
+        return func
+    return decorator
+
+
+def register_stream(name):
+    """
+    백엔드의 청크 생성기 등록 데코레이터
+
+    생성기는 백엔드와 같은 인자에 chunk_size를 더 받아 (청크 행 위치 리스트, 청크 제목 리스트)를
+    행 순서대로 yield한다. (프로세스 풀처럼 청크마다 다시 시작하면 비싼 백엔드용)
+
+    Args:
+        name: 백엔드 이름
+    """
+    def decorator(func):
+        _STREAMS[name] = func
+        return func
+    return decorator
+
+
+def available_backends():
+    """
+    등록된 백엔드 이름 목록
+
+    Returns:
+        list: 등록 순서의 백엔드 이름
+    """
+    return list(_BACKENDS)
+
+
+def get_backend(name=None):
+    """
+    이름으로 백엔드 조회
+
+    Args:
+        name: 백엔드 이름 (None이면 config.TITLE_BACKEND)
+
+    Returns:
+        callable: 백엔드 함수
+
+    Raises:
+        ValueError: 등록되지 않은 이름인 경우
+    """
+    if name is None:
+        name = TITLE_BACKEND
+    try:
+        return _BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f"알 수 없는 백엔드 '{name}' (사용 가능: {', '.join(available_backends())})"
+        ) from None
+
+
+def iter_title_chunks(name, df, rows, col_selection, synonym_dict, version_count,
+                      chunk_size=PARALLEL_CHUNK_SIZE, **options):
+    """
+    백엔드 결과를 행 청크 단위로 생성
+
+    전체 제목 행렬을 만들지 않고 청크가 끝나는 대로 돌려준다. 청크를 모두 이으면
+    백엔드를 한 번 호출한 결과와 같다.
+
+    Args:
+        name: 백엔드 이름 (None이면 config.TITLE_BACKEND)
+        df, rows, col_selection, synonym_dict, version_count: 백엔드 인자와 같음
+        chunk_size: 청크 하나의 행 수
+        **options: 백엔드 옵션 (sample_seed, template, stats, workers 등)
+
+    Yields:
+        tuple: (청크의 행 위치 리스트, 청크의 버전별 제목 리스트)
+    """
+    backend = get_backend(name)
+    stream = _STREAMS.get(TITLE_BACKEND if name is None else name)
+    if stream is not None:
+        yield from stream(
+            df, rows, col_selection, synonym_dict, version_count, chunk_size=chunk_size, **options
+        )
+        return
+
+    rows = list(rows)
+    chunk_size = max(1, chunk_size)
+    for start in range(0, len(rows), chunk_size):
+        chunk_rows = rows[start:start + chunk_size]
+        yield chunk_rows, backend(
+            df, chunk_rows, col_selection, synonym_dict, version_count, **options
+        )
+
+
+def _generate_rows(df, rows, col_selection, synonym_dict, version_count, sample_seed, template,
+                   stats=None):
+    """행마다 create_title_combinations 호출"""
+    from . import create_title_combinations
+
+    return [
+        create_title_combinations(
+            df.iloc[row], col_selection, synonym_dict, version_count,
+            sample_seed=sample_seed, template=template, stats=stats
+        )[0]
+        for row in rows
+    ]
+
+
+@register_backend('reference')
+def reference_backend(df, rows, col_selection, synonym_dict, version_count,
+                      sample_seed=None, template=None, stats=None, **options):
+    """
+    기준 백엔드 (행 단위, 원본 사전 선형 탐색, 제목마다 clean_text)
+
+    컴파일된 SynonymIndex가 들어오면 색인을 만든 원본 사전을 사용한다.
+    (그룹 역색인은 원본 사전에 없으므로 그룹 색인은 그대로 사용)
+    """
+    if (isinstance(synonym_dict, SynonymIndex) and synonym_dict.source is not None
+            and not synonym_dict.grouped):
+        synonym_dict = synonym_dict.source
+    return _generate_rows(
+        df, rows, col_selection, synonym_dict, version_count, sample_seed, template, stats
+    )
+
+
+def _compiled_index(synonym_dict):
+    """
+    일반 사전을 색인으로 컴파일
+
+    일반 사전은 제자리에서 수정될 수 있고 약한 참조도 만들 수 없으므로 호출마다 컴파일한다.
+    (앱은 불러올 때 컴파일한 색인을 넘기므로 다시 컴파일하지 않음)
+    """
+    if isinstance(synonym_dict, SynonymIndex):
+        return synonym_dict
+    return build_synonym_index(synonym_dict)
+
+
+@register_backend('indexed')
+def indexed_backend(df, rows, col_selection, synonym_dict, version_count,
+                    sample_seed=None, template=None, stats=None, **options):
+    """행 단위, 컴파일된 유의어 색인 조회 (일반 사전이면 먼저 컴파일)"""
+    return _generate_rows(
+        df, rows, col_selection, _compiled_index(synonym_dict),
+        version_count, sample_seed, template, stats
+    )
+
+
+@register_backend('vectorized')
+def vectorized_backend(df, rows, col_selection, synonym_dict, version_count,
+                       sample_seed=None, template=None, stats=None, **options):
+    """고유 속성 조합별로 한 번만 생성 (generate_title_matrix)"""
+    from .vectorized import generate_title_matrix
+
+    return generate_title_matrix(
+        df, rows, col_selection, synonym_dict, version_count,
+        sample_seed=sample_seed, template=template, stats=stats
+    )
+
+
+@register_stream('parallel')
+def parallel_stream(df, rows, col_selection, synonym_dict, version_count,
+                    sample_seed=None, template=None, stats=None, workers=None,
+                    chunk_size=PARALLEL_CHUNK_SIZE, min_rows=PARALLEL_MIN_ROWS, **options):
+    """프로세스 풀을 한 번만 시작하고 끝난 청크부터 돌려주기 (iter_titles_parallel)"""
+    from .parallel import iter_titles_parallel
+
+    return iter_titles_parallel(
+        df, rows, col_selection, synonym_dict, version_count,
+        sample_seed=sample_seed, template=template, workers=workers,
+        chunk_size=chunk_size, min_rows=min_rows, stats=stats
+    )
+
+
+@register_backend('parallel')
+def parallel_backend(df, rows, col_selection, synonym_dict, version_count,
+                     sample_seed=None, template=None, stats=None, workers=None,
+                     chunk_size=PARALLEL_CHUNK_SIZE, min_rows=PARALLEL_MIN_ROWS, **options):
+    """청크별 프로세스 풀 생성 (generate_titles_parallel)"""
+    from .parallel import generate_titles_parallel
+
+    return generate_titles_parallel(
+        df, rows, col_selection, synonym_dict, version_count,
+        sample_seed=sample_seed, template=template, workers=workers,
+        chunk_size=chunk_size, min_rows=min_rows, stats=stats
+    )
+
+
+def _free_text_replacer(synonym_dict, categories):
+    """
+    치환기 생성 (같은 색인·리비전·카테고리면 이전 치환기 재사용)
+
+    일반 사전은 제자리에서 수정될 수 있으므로 재사용하지 않는다.
+    """
+    from .free_text import FreeTextReplacer
+
+    global _last_replacer
+    revision = dictionary_revision(synonym_dict)
+    if (_last_replacer is not None and _last_replacer[0]() is synonym_dict
+            and _last_replacer[1] == revision and _last_replacer[2] == categories):
+        return _last_replacer[3]
+
+    replacer = FreeTextReplacer.from_synonym_dict(synonym_dict, categories)
+    if isinstance(synonym_dict, SynonymIndex):
+        _last_replacer = (
+            weakref.ref(synonym_dict, _forget_replacer), revision, categories, replacer
+        )
+    return replacer
+
+
+@register_backend('free_text')
+def free_text_backend(df, rows, col_selection, synonym_dict, version_count,
+                      sample_seed=None, template=None, stats=None, column=FREE_TEXT_COLUMN,
+                      **options):
+    """
+    상품명 자유 텍스트 치환 (속성 컬럼 없이 상품명 컬럼만 있는 시트용)
+
+    선택된 카테고리 사전의 원본 단어를 상품명 안에서 찾아 유의어로 바꾼다.
+    템플릿은 사용하지 않는다. (title_generator.free_text 참고)
+    """
+    from .free_text import generate_free_text_titles
+
+    with timed_stage(stats, 'build_replacer'):
+        replacer = _free_text_replacer(synonym_dict, tuple(col_selection))
+    values = df[column].iloc[list(rows)] if column in df.columns else [''] * len(rows)
+    texts = ['' if pd.isna(value) else value for value in values]
+    with timed_stage(stats, 'replace_text'):
+        return generate_free_text_titles(texts, replacer, version_count, sample_seed)
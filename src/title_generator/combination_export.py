@@ -0,0 +1,66 @@
+"""
+전체 조합 내보내기 모듈
+
+행별 모든 조합 제목을 생성하는 즉시 CSV 또는 JSONL 파일에 기록한다.
+조합을 메모리에 모으지 않으므로 조합 수와 관계없이 메모리 사용량이 일정하다.
+"""
+import csv
+import json
+import os
+
+EXPORT_FIELDS = ['row', 'combination', 'title']
+
+
+def _detect_format(path, fmt):
+    """파일 형식 결정 (지정하지 않으면 확장자 기준)"""
+    if fmt is None:
+        fmt = 'jsonl' if os.path.splitext(path)[1].lower() in ('.jsonl', '.json') else 'csv'
+    if fmt not in ('csv', 'jsonl'):
+        raise ValueError(f"지원하지 않는 형식: {fmt}")
+    return fmt
+
+
+def export_title_combinations(rows, col_selection, synonym_dict, path, fmt=None,
+                              offset=0, cap=None, append=False):
+    """
+    행별 모든 조합 제목을 파일로 내보내기
+
+    Args:
+        rows: (행 번호, 행 데이터) 쌍의 iterable
+        col_selection: 선택된 컬럼들
+        synonym_dict: 유의어 사전 (또는 SynonymIndex)
+        path: 저장할 파일 경로
+        fmt: 'csv' 또는 'jsonl' (None이면 확장자로 결정)
+        offset: 행마다 시작할 조합 번호
+        cap: 행마다 최대 내보낼 조합 수 (None이면 끝까지)
+        append: True면 기존 파일 뒤에 이어서 기록 (구간별 재개용)
+
+    Returns:
+        int: 기록한 제목 수
+    """
+    from . import iter_title_combinations
+
+    fmt = _detect_format(path, fmt)
+    write_header = fmt == 'csv' and not (append and os.path.exists(path))
+    written = 0
+
+    with open(path, 'a' if append else 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f) if fmt == 'csv' else None
+        if write_header:
+            writer.writerow(EXPORT_FIELDS)
+
+        for row_id, row in rows:
+            for combination_idx, title in iter_title_combinations(
+                row, col_selection, synonym_dict, offset, cap
+            ):
+                if writer is not None:
+                    writer.writerow([row_id, combination_idx, title])
+                else:
+                    f.write(json.dumps(
+                        {'row': row_id, 'combination': combination_idx, 'title': title},
+                        ensure_ascii=False
+                    ))
+                    f.write('\n')
+                written += 1
+
+    return written
@@ -0,0 +1,425 @@
+"""
+정수 ID 기반 압축 유의어 색인 모듈
+
+SynonymIndex는 카테고리마다 {정규화된 키: 유의어 튜플} 딕셔너리를 두므로 같은 유의어가
+여러 항목/카테고리에 나오면 문자열과 튜플이 그만큼 반복된다. 압축 색인은 모든 문자열을
+하나의 문자열 표(StringTable)에 한 번만 넣고, 키와 유의어 목록은 정수 ID 배열(array)로 보관한다.
+
+    키 ID 정렬 배열 → 목록 번호 → (시작 위치, 끝 위치) → 유의어 ID 배열
+
+제목 엔진(find_synonyms)은 유의어 문자열 튜플 대신 ID 배열 구간을 가리키는 SynonymIds를 받아
+조합 수 계산과 버전 인덱스 선택을 ID 목록으로 하고, 제목에 들어갈 토큰만 문자열로 바꾼다.
+(lookup/items는 SynonymIndex와 같은 문자열 튜플을 돌려줌)
+피클에는 문자열 표와 정수 배열만 들어가므로(원본 사전과 정리 기록은 제외) 병렬 생성에서
+작업 프로세스로 넘기는 비용이 작다. (중복 문자열이 많은 사전에서 수 배, 거의 겹치지 않는 사전도 약 2배)
+"""
+import weakref
+from array import array
+from bisect import bisect_left
+
+from .synonym_index import (
+    SynonymIndex, CleanedSynonyms, PrecleanedSynonyms, build_synonym_index, normalize_key
+)
+
+# 목록 종류 (일반 튜플 / 미리 정리한 유의어 / 정리 생략 가능한 유의어)
+_PLAIN, _CLEANED, _PRECLEANED = 0, 1, 2
+
+# compact_synonym_index가 마지막으로 압축한 (색인 약한 참조, 압축 색인)
+# 색인(과 원본 사전)을 붙잡아 두지 않도록 약한 참조로 보관하고, 색인이 사라지면 함께 비운다.
+_last_compacted = None
+
+
+def _forget_compacted(ref):
+    """압축한 색인이 사라지면 재사용 기록 비우기"""
+    global _last_compacted
+    if _last_compacted is not None and _last_compacted[0] is ref:
+        _last_compacted = None
+
+
+class StringTable:
+    """
+    문자열 표 (같은 문자열은 하나의 ID)
+
+    피클에는 이어 붙인 문자열과 길이 배열만 넣고, 문자열 → ID 딕셔너리는 복원할 때 다시 만든다.
+    """
+
+    __slots__ = ('strings', '_ids')
+
+    def __init__(self, strings=()):
+        self.strings = []
+        self._ids = {}
+        for text in strings:
+            self.intern(text)
+
+    def __len__(self):
+        return len(self.strings)
+
+    def __getitem__(self, string_id):
+        return self.strings[string_id]
+
+    def intern(self, text):
+        """
+        문자열 ID 조회 (없으면 추가)
+
+        Args:
+            text: 문자열
+
+        Returns:
+            int: 문자열 ID
+        """
+        string_id = self._ids.get(text)
+        if string_id is None:
+            string_id = self._ids[text] = len(self.strings)
+            self.strings.append(text)
+        return string_id
+
+    def intern_all(self, texts):
+        """
+        여러 문자열의 ID 조회 (없으면 추가)
+
+        Returns:
+            tuple: 문자열 ID 튜플
+        """
+        ids, strings = self._ids, self.strings
+        result = []
+        for text in texts:
+            string_id = ids.get(text)
+            if string_id is None:
+                string_id = ids[text] = len(strings)
+                strings.append(text)
+            result.append(string_id)
+        return tuple(result)
+
+    def get_id(self, text):
+        """문자열 ID 조회 (없으면 None)"""
+        return self._ids.get(text)
+
+    def decode(self, ids):
+        """ID 배열을 문자열 튜플로 변환"""
+        strings = self.strings
+        return tuple(strings[string_id] for string_id in ids)
+
+    def __getstate__(self):
+        # 문자열 하나와 길이 배열로 보내면 문자열마다 피클하는 것보다 작고 빠름
+        return ''.join(self.strings), _id_array(map(len, self.strings))
+
+    def __setstate__(self, state):
+        joined, lengths = state
+        strings = []
+        end = 0
+        for length in lengths:
+            start, end = end, end + length
+            strings.append(joined[start:end])
+        self.strings = strings
+        self._ids = {text: string_id for string_id, text in enumerate(strings)}
+
+
+def _id_array(values):
+    """값 범위에 맞는 가장 작은 부호 없는 정수 배열"""
+    values = list(values)
+    largest = max(values, default=0)
+    typecode = 'B' if largest < 1 << 8 else 'H' if largest < 1 << 16 else 'I'
+    return array(typecode, values)
+
+
+class SynonymIds:
+    """
+    압축 색인의 유의어 ID 목록 (제목 엔진용 조회 결과)
+
+    유의어 튜플을 만들지 않고 ID 배열 구간을 그대로 가리킨다. 길이와 버전 인덱스는 ID로 계산하고,
+    synonyms[i]로 토큰을 꺼낼 때만 그 ID 하나를 문자열로 바꾼다.
+    raw는 정리 전 원본 ID 목록이다. (CleanedSynonyms.raw와 같은 역할, 일반 목록이면 자기 자신)
+    """
+
+    __slots__ = ('strings', 'ids', 'raw_ids', 'precleaned')
+
+    def __init__(self, strings, ids, raw_ids=None, precleaned=False):
+        self.strings = strings
+        self.ids = ids
+        self.raw_ids = raw_ids
+        self.precleaned = precleaned
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, pos):
+        return self.strings[self.ids[pos]]
+
+    def __iter__(self):
+        strings = self.strings
+        return (strings[string_id] for string_id in self.ids)
+
+    @property
+    def raw(self):
+        """정리 전 원본 ID 목록"""
+        if self.raw_ids is None:
+            return self
+        return SynonymIds(self.strings, self.raw_ids)
+
+
+def token_source(synonyms):
+    """
+    유의어 목록의 (토큰 표, 토큰 ID 목록)
+
+    ID 목록은 공유 문자열 표와 ID 구간을 그대로 쓰고, 그 외 목록은 위치가 곧 ID이다.
+    제목 엔진은 tokens[ids[i]]로 자리에 들어갈 토큰 하나만 꺼낸다.
+    """
+    if isinstance(synonyms, SynonymIds):
+        return synonyms.strings, synonyms.ids
+    return synonyms, range(len(synonyms))
+
+
+class _ListStore:
+    """
+    카테고리 색인을 만들 때 쓰는 유의어 목록 저장소 (같은 목록은 한 번만 저장)
+
+    정리 전 원본 ID는 미리 정리한 목록만 raw_ids에 따로 보관한다.
+    """
+
+    def __init__(self, table):
+        self.table = table
+        self.slots = {}
+        self.offsets = [0]
+        self.ids = []
+        self.raw_offsets = [0]
+        self.raw_ids = []
+        self.kinds = []
+
+    def add(self, synonyms):
+        """목록 번호 조회 (없으면 추가)"""
+        if isinstance(synonyms, PrecleanedSynonyms):
+            kind, raw = _PRECLEANED, synonyms.raw
+        elif isinstance(synonyms, CleanedSynonyms):
+            kind, raw = _CLEANED, synonyms.raw
+        else:
+            kind, raw = _PLAIN, synonyms
+        ids = self.table.intern_all(synonyms)
+        raw_ids = ids if raw is synonyms else self.table.intern_all(raw)
+        key = (kind, ids, raw_ids)
+
+        slot = self.slots.get(key)
+        if slot is None:
+            slot = self.slots[key] = len(self.kinds)
+            self.ids.extend(ids)
+            self.offsets.append(len(self.ids))
+            if kind != _PLAIN:
+                self.raw_ids.extend(raw_ids)
+            self.raw_offsets.append(len(self.raw_ids))
+            self.kinds.append(kind)
+        return slot
+
+
+def _sorted_arrays(mapping):
+    """{키 ID: 값} → (정렬된 키 ID 배열, 같은 순서의 값 배열)"""
+    items = sorted(mapping.items())
+    return _id_array(key for key, _ in items), _id_array(value for _, value in items)
+
+
+class CompactCategory:
+    """
+    카테고리 하나의 압축 색인 (CategoryIndex와 같은 lookup/group_id/items 제공)
+
+    정수 배열은 값 범위에 맞춰 1/2/4바이트 배열로 보관한다.
+    raw_ids는 미리 정리한 유의어의 정리 전 원본 ID이다. (일반 목록은 보관하지 않음)
+    """
+
+    def __init__(self, table, category_index):
+        self.table = table
+        store = _ListStore(table)
+
+        direct = {
+            table.intern(key): store.add(synonyms) for key, synonyms in category_index.items()
+        }
+        self.key_ids, self.key_slots = _sorted_arrays(direct)
+
+        # 그룹 역색인 (구성원 ID → 그룹 번호, 그룹 번호 → 대표 원본 ID/목록 번호)
+        self.group_origs = _id_array(table.intern(orig) for orig, _ in category_index.groups)
+        self.group_slots = _id_array(store.add(synonyms) for _, synonyms in category_index.groups)
+        self.member_ids, self.member_groups = _sorted_arrays({
+            table.intern(member): group_id for member, group_id in category_index.group_of.items()
+        })
+
+        self.offsets = _id_array(store.offsets)
+        self.ids = _id_array(store.ids)
+        self.raw_offsets = _id_array(store.raw_offsets)
+        self.raw_ids = _id_array(store.raw_ids)
+        self.kinds = array('B', store.kinds)
+        self._decoded = {}
+        self._views = None
+
+    def __len__(self):
+        return len(self.key_ids)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_decoded'] = {}
+        state['_views'] = None
+        return state
+
+    @staticmethod
+    def _find(ids, values, string_id):
+        """정렬된 ID 배열에서 값 조회 (없으면 None)"""
+        if string_id is None:
+            return None
+        pos = bisect_left(ids, string_id)
+        if pos < len(ids) and ids[pos] == string_id:
+            return values[pos]
+        return None
+
+    def _decode(self, slot):
+        """목록 번호의 유의어 튜플 (처음 조회할 때만 문자열로 변환)"""
+        synonyms = self._decoded.get(slot)
+        if synonyms is None:
+            start, end = self.offsets[slot], self.offsets[slot + 1]
+            decoded = self.table.decode(self.ids[start:end])
+            kind = self.kinds[slot]
+            if kind == _PLAIN:
+                synonyms = decoded
+            else:
+                raw = self.table.decode(
+                    self.raw_ids[self.raw_offsets[slot]:self.raw_offsets[slot + 1]]
+                )
+                synonyms = (PrecleanedSynonyms if kind == _PRECLEANED else CleanedSynonyms)(decoded, raw)
+            self._decoded[slot] = synonyms
+        return synonyms
+
+    def _ids(self, slot):
+        """목록 번호의 유의어 ID 목록 (배열을 복사하지 않는 memoryview 구간)"""
+        if self._views is None:
+            self._views = memoryview(self.ids), memoryview(self.raw_ids)
+        ids, raw_ids = self._views
+        kind = self.kinds[slot]
+        raw = None
+        if kind != _PLAIN:
+            raw = raw_ids[self.raw_offsets[slot]:self.raw_offsets[slot + 1]]
+        return SynonymIds(
+            self.table.strings, ids[self.offsets[slot]:self.offsets[slot + 1]], raw,
+            kind == _PRECLEANED
+        )
+
+    def _slot(self, value):
+        """값에 해당하는 목록 번호 (원본 키 우선, 없으면 그룹, 둘 다 없으면 None)"""
+        string_id = self.table.get_id(normalize_key(value))
+        slot = self._find(self.key_ids, self.key_slots, string_id)
+        if slot is None:
+            group_id = self._find(self.member_ids, self.member_groups, string_id)
+            if group_id is not None:
+                slot = self.group_slots[group_id]
+        return slot
+
+    def lookup(self, value):
+        """
+        값에 해당하는 유의어 튜플 조회 (CategoryIndex.lookup과 같은 규칙)
+
+        Args:
+            value: 조회할 원본 값
+
+        Returns:
+            tuple: 유의어 튜플 (없으면 빈 튜플)
+        """
+        slot = self._slot(value)
+        return () if slot is None else self._decode(slot)
+
+    def lookup_ids(self, value):
+        """
+        값에 해당하는 유의어 ID 목록 조회 (lookup과 같은 규칙, 제목 엔진용)
+
+        Args:
+            value: 조회할 원본 값
+
+        Returns:
+            SynonymIds: 유의어 ID 목록 (없으면 빈 튜플)
+        """
+        slot = self._slot(value)
+        return () if slot is None else self._ids(slot)
+
+    def group_id(self, value):
+        """값이 속한 그룹 번호 (그룹 색인이 아니거나 어느 그룹에도 없으면 None)"""
+        string_id = self.table.get_id(normalize_key(value))
+        return self._find(self.member_ids, self.member_groups, string_id)
+
+    @property
+    def groups(self):
+        """그룹별 (대표 원본, 유의어 튜플) 리스트"""
+        return [
+            (self.table[orig], self._decode(slot))
+            for orig, slot in zip(self.group_origs, self.group_slots)
+        ]
+
+    def keys(self):
+        return [self.table[key_id] for key_id in self.key_ids]
+
+    def items(self):
+        """(정규화된 키, 유의어 튜플) 목록"""
+        return [
+            (self.table[key_id], self._decode(slot))
+            for key_id, slot in zip(self.key_ids, self.key_slots)
+        ]
+
+    def __contains__(self, key):
+        return self._find(self.key_ids, self.key_slots, self.table.get_id(key)) is not None
+
+    def __getitem__(self, key):
+        slot = self._find(self.key_ids, self.key_slots, self.table.get_id(key))
+        if slot is None:
+            raise KeyError(key)
+        return self._decode(slot)
+
+
+class CompactSynonymIndex(SynonymIndex):
+    """
+    압축 유의어 색인 (카테고리 → CompactCategory)
+
+    SynonymIndex와 같은 방식으로 사용할 수 있고, 압축한 색인의 리비전을 그대로 쓴다.
+    (내용이 같으므로 제목 캐시를 무효화하지 않음)
+    """
+
+    def __init__(self, categories, table, revision, clean_report=None, grouped=False,
+                 stopwords=None):
+        dict.__init__(self, categories)
+        self.table = table
+        self.source = None
+        self.clean_report = clean_report
+        self.grouped = grouped
+        self.stopwords = stopwords
+        self.revision = revision
+
+    def __reduce__(self):
+        # 정리 기록은 현재 프로세스에서만 사용하므로 피클에서 제외
+        return (
+            CompactSynonymIndex,
+            (dict(self), self.table, self.revision, None, self.grouped, self.stopwords)
+        )
+
+
+def compact_synonym_index(synonym_dict):
+    """
+    유의어 사전/색인을 압축 색인으로 변환
+
+    같은 SynonymIndex를 연달아 압축하면 이전 결과를 재사용한다. (색인이 살아 있는 동안만)
+
+    Args:
+        synonym_dict: 유의어 사전, SynonymIndex 또는 CompactSynonymIndex
+
+    Returns:
+        CompactSynonymIndex: 압축 색인
+    """
+    global _last_compacted
+    if isinstance(synonym_dict, CompactSynonymIndex):
+        return synonym_dict
+    if (isinstance(synonym_dict, SynonymIndex) and _last_compacted is not None
+            and _last_compacted[0]() is synonym_dict):
+        return _last_compacted[1]
+
+    index = build_synonym_index(synonym_dict)
+    table = StringTable()
+    categories = {
+        category: CompactCategory(table, category_index)
+        for category, category_index in index.items()
+    }
+    compact = CompactSynonymIndex(
+        categories, table, index.revision, index.clean_report, index.grouped, index.stopwords
+    )
+    if isinstance(synonym_dict, SynonymIndex):
+        _last_compacted = (weakref.ref(synonym_dict, _forget_compacted), compact)
+    return compact
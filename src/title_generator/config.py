@@ -1,12 +1,77 @@
 """
 설정 값 모듈
 """
+import os
 
 # 컬럼 순서 정의
 ORDERED_COLUMNS = ['브랜드', '색상', '패턴', '소재', '카테고리']
 
+# 마켓별 제목 템플릿 ('{컬럼명}' 자리에 값이 들어가고 나머지는 구분자/고정 문구)
+# 예: TITLE_TEMPLATES['마켓명'] = '{브랜드} {색상} {카테고리} - {소재}'
+# 괄호는 자리표시자 하나만 감쌀 수 있고('[{브랜드}]'), 값이 비면 괄호도 함께 빠짐
+TITLE_TEMPLATES = {
+    'default': ' '.join(f'{{{column}}}' for column in ORDERED_COLUMNS)
+}
+
+# 기본 템플릿 이름
+DEFAULT_TEMPLATE = 'default'
+
 # 기본 값 설정
 DEFAULT_VALUES = {
     'empty': '',
     'error_prefix': 'ERROR: '
-} 
\ No newline at end of file
+}
+
+# 제목 캐시 최대 항목 수
+TITLE_CACHE_SIZE = 100000
+
+# 무작위 조합 추출 기본 시드 (행 속성 값과 함께 행별 시드를 만듦)
+SAMPLE_SEED = 0
+
+# 제목 생성 백엔드 ('reference', 'indexed', 'vectorized', 'parallel', 'free_text')
+TITLE_BACKEND = 'parallel'
+
+# 엑셀 읽기 엔진 ('openpyxl', 'xml' = 시트 XML 직접 스트리밍)
+EXCEL_ENGINE = 'openpyxl'
+
+# 제목 저장 방식 ('openpyxl' = 워크북 전체 다시 저장, 'patch' = 대상 시트의 바뀐 셀만 패치)
+SAVE_MODE = 'openpyxl'
+
+
+
+def user_cache_dir(name):
+    """
+    사용자별 앱 캐시 폴더 경로 (작업 폴더와 무관)
+
+    Windows는 %LOCALAPPDATA%, 그 외는 $XDG_CACHE_HOME 또는 ~/.cache 아래에 만든다.
+
+    Args:
+        name: 앱 캐시 폴더 안의 하위 폴더 이름
+
+    Returns:
+        str: 캐시 폴더 경로
+    """
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.environ.get('APPDATA')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME')
+    if not base:
+        base = os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'excel-synonym-replacer', name)
+
+
+# 유의어 사전 캐시 폴더 (워크북 경로/수정 시각/유의어 시트 해시로 확인, None이면 캐시 안 함)
+# 이 프로그램이 쓴 피클만 읽도록 작업 폴더가 아닌 사용자별 캐시 폴더에 둔다.
+SYNONYM_CACHE_DIR = user_cache_dir('synonym_cache')
+
+# free_text 백엔드가 치환할 상품명 컬럼
+FREE_TEXT_COLUMN = '상품명'
+
+# 병렬 생성 작업 프로세스 수 (None이면 CPU 수)
+PARALLEL_WORKERS = None
+
+# 병렬 생성 청크 하나의 행 수
+PARALLEL_CHUNK_SIZE = 2000
+
+# 이보다 적은 행은 현재 프로세스에서 생성 (프로세스 시작 비용이 더 큼)
+PARALLEL_MIN_ROWS = 5000
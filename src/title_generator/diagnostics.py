@@ -0,0 +1,109 @@
+"""
+실행 단위 진단 모듈
+
+행마다 메시지를 출력하는 대신, 선택된 행 전체를 한 번 훑어 컬럼별 빈 값/유의어 미일치
+행 수를 모아 두고 실행이 끝날 때 한 번만 보고한다.
+"""
+import logging
+
+import pandas as pd
+
+from .synonym_matcher import find_synonyms
+from .template import get_title_plan
+
+logger = logging.getLogger(__name__)
+
+
+class ColumnStats:
+    """
+    컬럼별 집계 결과
+
+    Attributes:
+        rows: 집계한 행 수
+        empty: {컬럼명: 값이 비어 있는 행 수}
+        unmatched: {컬럼명: 유의어 치환 컬럼인데 사전에 없는 값의 행 수}
+    """
+
+    def __init__(self, rows=0, empty=None, unmatched=None):
+        self.rows = rows
+        self.empty = empty or {}
+        self.unmatched = unmatched or {}
+
+    def lines(self):
+        """
+        보고용 문장 목록 (0인 항목은 생략)
+
+        Returns:
+            list: '빈 패턴: 41,203행' 형태의 문자열 리스트
+        """
+        lines = [f"빈 {column}: {count:,}행" for column, count in self.empty.items() if count]
+        lines += [
+            f"유의어 없는 {column}: {count:,}행"
+            for column, count in self.unmatched.items() if count
+        ]
+        return lines
+
+    def report(self, log_callback=None):
+        """
+        집계 결과를 한 번에 보고 (log_callback과 로거 INFO 레벨)
+
+        Args:
+            log_callback: 로그 메시지를 받을 함수 (선택)
+        """
+        lines = self.lines()
+        if not lines:
+            return
+        message = f"컬럼 집계 ({self.rows:,}행): " + ', '.join(lines)
+        logger.info(message)
+        if log_callback:
+            log_callback(message)
+
+
+def collect_column_stats(df, rows, col_selection, synonym_dict, template=None):
+    """
+    선택된 행의 템플릿 컬럼별 빈 값/유의어 미일치 행 수 집계
+
+    고유 값별로 한 번만 유의어를 조회하므로 행 수가 많아도 비용이 작다.
+
+    Args:
+        df: 상품 데이터 DataFrame
+        rows: 처리할 행 위치 리스트 (0-based)
+        col_selection: 선택된 컬럼들
+        synonym_dict: 유의어 사전 (또는 SynonymIndex)
+        template: 제목 템플릿 (이름, 템플릿 문자열 또는 TitlePlan)
+
+    Returns:
+        ColumnStats: 집계 결과
+    """
+    rows = list(rows)
+    frame = df.iloc[rows]
+    stats = ColumnStats(rows=len(rows))
+
+    for column in get_title_plan(template).columns:
+        if column not in frame.columns:
+            stats.empty[column] = len(rows)
+            continue
+
+        # 결측값도 빈 값으로 집계 (고유 값별로 집계한 뒤 정리된 값 기준으로 합침)
+        # 카테고리형 컬럼은 행 값을 문자열로 바꾸지 않고 코드로 집계됨
+        counts = {}
+        for value, count in frame[column].value_counts(dropna=False, sort=False).items():
+            value = '' if pd.isna(value) else str(value).strip()
+            counts[value] = counts.get(value, 0) + int(count)
+        stats.empty[column] = counts.get('', 0)
+
+        if column in col_selection and column in synonym_dict:
+            stats.unmatched[column] = sum(
+                int(count) for value, count in counts.items()
+                if value and not _has_synonyms(value, synonym_dict[column])
+            )
+
+    return stats
+
+
+def _has_synonyms(value, category_synonyms):
+    """값에 해당하는 유의어가 있는지 (조회 중 에러는 미일치로 집계)"""
+    try:
+        return bool(find_synonyms(value, category_synonyms))
+    except Exception:
+        return False
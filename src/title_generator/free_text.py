@@ -0,0 +1,306 @@
+"""
+자유 텍스트 유의어 치환 모듈
+
+브랜드/색상 등 속성 컬럼 없이 상품명 하나만 있는 시트를 위해, 상품명 안에서 사전의 원본 단어를
+찾아 유의어로 바꾼다. 원본 단어 전체로 아호-코라식 오토마톤을 한 번만 만들어 두고 제목마다
+한 번만 훑으며, 겹치는 일치는 가장 왼쪽·가장 긴 것을 고른다. (사전 항목마다 정규식을 돌리지 않음)
+
+한글은 정규식의 \\b로 단어 경계를 판단할 수 없으므로(한글과 영문/숫자가 모두 \\w), 글자 종류
+(한글 / 영문·숫자 / 그 외)가 바뀌는 곳을 경계로 본다. 예: 'NIKE맨투맨'의 'NIKE'는 일치하고,
+'검정티셔츠'의 '검정'은 일치하지 않는다.
+"""
+import logging
+import unicodedata
+from collections import deque
+from math import prod
+
+from text_cleaner import clean_text
+from .config import DEFAULT_VALUES
+from .synonym_index import raw_synonyms
+from .version_calc import calculate_version_indices, sample_version_indices, row_sample_seed
+
+logger = logging.getLogger(__name__)
+
+
+def _char_class(ch):
+    """경계 판단용 글자 종류 ('hangul' / 'word' / None(경계 문자))"""
+    if '가' <= ch <= '힣' or 'ᄀ' <= ch <= 'ᇿ' or '㄰' <= ch <= '㆏':
+        return 'hangul'
+    if ch.isalnum() or ch == '_':
+        return 'word'
+    return None
+
+
+def normalize_text(text):
+    """
+    조회용 정규화 (normalize_key와 같은 규칙을 글자 단위로 적용)
+
+    NFKC → casefold, 연속 공백은 공백 하나로 바꾸고 정규화된 글자마다 원본 위치를 기록한다.
+
+    Returns:
+        tuple: (정규화된 문자열, 정규화된 글자별 원본 위치 리스트)
+    """
+    chars = []
+    positions = []
+    in_space = False
+    for pos, ch in enumerate(str(text)):
+        if ch.isspace():
+            if not in_space:
+                chars.append(' ')
+                positions.append(pos)
+            in_space = True
+            continue
+        in_space = False
+        for norm in unicodedata.normalize('NFKC', ch).casefold():
+            chars.append(norm)
+            positions.append(pos)
+    return ''.join(chars), positions
+
+
+class FreeTextReplacer:
+    """
+    상품명 자유 텍스트 유의어 치환기
+
+    원본 단어는 정규화(normalize_text)한 뒤 오토마톤에 넣는다. 정규화 결과가 같은 단어가
+    여러 번 나오면 먼저 나온 항목을 사용한다. (build_synonym_index와 같은 규칙)
+    """
+
+    def __init__(self, entries):
+        """
+        Args:
+            entries: {원본 단어: 유의어 리스트(또는 문자열)}
+        """
+        self.words = []      # 항목별 정규화된 원본 단어
+        self.synonyms = []   # 항목별 유의어 튜플
+        # 상태별 전이 / 실패 링크 / 그 상태에서 끝나는 (단어 길이, 항목 번호) 목록
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+
+        seen = set()
+        for orig, syn_list in entries.items():
+            word = normalize_text(orig)[0].strip()
+            if isinstance(syn_list, str):
+                syn_list = (syn_list,)
+            syn_list = tuple(raw_synonyms(syn_list))
+            if not word or not syn_list or word in seen:
+                continue
+            seen.add(word)
+            self._add_word(word, len(self.words))
+            self.words.append(word)
+            self.synonyms.append(syn_list)
+        self._build_links()
+
+    @classmethod
+    def from_synonym_dict(cls, synonym_dict, categories=None):
+        """
+        카테고리별 유의어 사전(또는 SynonymIndex)을 하나로 합쳐 치환기 생성
+
+        Args:
+            synonym_dict: {카테고리: {원본: [유의어, ...]}} 형태의 유의어 사전
+            categories: 사용할 카테고리 (None이면 전체, 앞 카테고리의 항목 우선)
+        """
+        entries = {}
+        for category, category_entries in synonym_dict.items():
+            if categories is not None and category not in categories:
+                continue
+            for orig, syn_list in category_entries.items():
+                entries.setdefault(orig, syn_list)
+        return cls(entries)
+
+    def __len__(self):
+        return len(self.words)
+
+    def _add_word(self, word, entry):
+        """트라이에 단어 추가"""
+        state = 0
+        for ch in word:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        self._output[state] = ((len(word), entry),)
+
+    def _build_links(self):
+        """너비 우선으로 실패 링크를 만들고 실패 상태의 출력을 합침"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(ch, 0)
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def find(self, text):
+        """
+        경계 조건을 만족하는 가장 왼쪽·가장 긴 일치 찾기
+
+        Args:
+            text: 상품명
+
+        Returns:
+            list: (원본 시작 위치, 원본 끝 위치, 항목 번호) 리스트 (위치 순서, 겹치지 않음)
+        """
+        norm, positions = normalize_text(text)
+        size = len(norm)
+        goto, fail, output = self._goto, self._fail, self._output
+
+        # 시작 위치별 가장 긴 일치 (길이, 항목 번호)
+        longest = {}
+        state = 0
+        for end, ch in enumerate(norm):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for length, entry in output[state]:
+                start = end - length + 1
+                if length > longest.get(start, (0,))[0] and self._at_boundary(norm, positions, start, end):
+                    longest[start] = (length, entry)
+
+        matches = []
+        pos = 0
+        while pos < size:
+            match = longest.get(pos)
+            if match is None:
+                pos += 1
+                continue
+            length, entry = match
+            end = pos + length - 1
+            matches.append((positions[pos], positions[end] + 1, entry))
+            pos = end + 1
+        return matches
+
+    @staticmethod
+    def _at_boundary(norm, positions, start, end):
+        """일치 앞뒤가 단어 경계인지 (원본 글자 하나가 여러 글자로 정규화된 경우 중간에서 끊기지 않음)"""
+        if start > 0:
+            if positions[start - 1] == positions[start]:
+                return False
+            before = _char_class(norm[start - 1])
+            if before is not None and before == _char_class(norm[start]):
+                return False
+        if end + 1 < len(norm):
+            if positions[end + 1] == positions[end]:
+                return False
+            after = _char_class(norm[end + 1])
+            if after is not None and after == _char_class(norm[end]):
+                return False
+        return True
+
+    def split(self, text):
+        """
+        상품명을 고정 조각과 유의어 자리로 나누기
+
+        같은 원본 단어가 여러 번 나오면 같은 유의어 자리를 공유한다.
+        (한 제목 안에서는 같은 단어를 같은 유의어로 바꿈)
+
+        Returns:
+            tuple: (조각 리스트, 조각별 유의어 자리 번호(고정 조각은 None), 자리별 유의어 튜플)
+        """
+        text = str(text)
+        parts = []
+        part_slots = []
+        ordered_lists = []
+        entry_slots = {}
+        pos = 0
+        for start, end, entry in self.find(text):
+            if start > pos:
+                parts.append(text[pos:start])
+                part_slots.append(None)
+            slot = entry_slots.get(entry)
+            if slot is None:
+                slot = entry_slots[entry] = len(ordered_lists)
+                ordered_lists.append(self.synonyms[entry])
+            parts.append(None)
+            part_slots.append(slot)
+            pos = end
+        if pos < len(text):
+            parts.append(text[pos:])
+            part_slots.append(None)
+        return parts, part_slots, ordered_lists
+
+    def replace(self, text, version_idx=0):
+        """
+        버전 하나의 치환 결과 (정리 전)
+
+        Args:
+            text: 상품명
+            version_idx: 버전 인덱스 (유의어 자리별 선택은 calculate_version_indices와 같은 규칙)
+
+        Returns:
+            str: 치환된 상품명
+        """
+        parts, part_slots, ordered_lists = self.split(text)
+        selected, _ = calculate_version_indices(ordered_lists, version_idx)
+        return _join_parts(parts, part_slots, ordered_lists, selected)
+
+    def title_combinations(self, text, version_count, sample_seed=None):
+        """
+        한 상품명의 버전별 제목 생성 (치환 후 clean_text로 정리)
+
+        Args:
+            text: 상품명
+            version_count: 생성할 버전 수
+            sample_seed: 지정하면 전체 조합 중 서로 다른 조합을 무작위 추출
+
+        Returns:
+            tuple: (버전별 제목 리스트, 전체 조합 수)
+        """
+        parts, part_slots, ordered_lists = self.split(text)
+        total_combinations = prod(len(synonyms) for synonyms in ordered_lists)
+        version_indices = range(version_count)
+        if sample_seed is not None:
+            sampled = sample_version_indices(
+                total_combinations, version_count, row_sample_seed([str(text).strip()], sample_seed)
+            )
+            version_indices = [sampled[i % len(sampled)] for i in range(version_count)]
+
+        titles = []
+        for version_idx in version_indices:
+            selected, _ = calculate_version_indices(ordered_lists, version_idx)
+            titles.append(clean_text(_join_parts(parts, part_slots, ordered_lists, selected)))
+        return titles, total_combinations
+
+
+def _join_parts(parts, part_slots, ordered_lists, selected):
+    """고정 조각과 선택된 유의어 이어 붙이기"""
+    return ''.join(
+        part if slot is None else ordered_lists[slot][selected[slot]]
+        for part, slot in zip(parts, part_slots)
+    )
+
+
+def generate_free_text_titles(texts, replacer, version_count, sample_seed=None):
+    """
+    상품명 목록의 버전별 제목 생성 (같은 상품명은 한 번만 생성)
+
+    Args:
+        texts: 상품명 목록
+        replacer: FreeTextReplacer
+        version_count: 생성할 버전 수
+        sample_seed: 지정하면 전체 조합 중 서로 다른 조합을 무작위 추출
+
+    Returns:
+        list: texts 순서의 버전별 제목 리스트
+    """
+    results = {}
+    titles = []
+    for text in texts:
+        text = '' if text is None else str(text)
+        result = results.get(text)
+        if result is None:
+            try:
+                result, _ = replacer.title_combinations(text, version_count, sample_seed)
+            except Exception as e:
+                logger.error("generate_free_text_titles: %s", e)
+                result = [f"{DEFAULT_VALUES['error_prefix']}{str(e)}"] * version_count
+            results[text] = result
+        titles.append(result)
+    return titles
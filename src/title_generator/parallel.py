@@ -0,0 +1,203 @@
+"""
+프로세스 풀 병렬 제목 생성 모듈
+
+선택된 행을 청크로 나눠 작업 프로세스들이 나눠 생성하고, 결과를 행 순서대로 합친다.
+(iter_titles_parallel은 합치지 않고 끝난 청크부터 행 순서대로 돌려준다.)
+유의어 사전·템플릿·불필요한 단어 목록은 청크마다 보내지 않고
+프로세스 초기화(initializer) 때 한 번만 전달한다. 단계별 시간을 측정하면 작업 프로세스가
+청크마다 자기 통계를 결과와 함께 돌려주고, 현재 프로세스의 통계에 합친다.
+(단계 시간은 프로세스별 시간의 합이므로 전체 소요 시간보다 클 수 있음)
+
+작업 프로세스는 항상 spawn으로 시작한다. GUI(Qt) 프로세스 안에서 fork하면 스레드와 Qt 상태가
+복사된 채로 자식이 실행되어 멈추거나 죽을 수 있다. (Linux의 기본값이 fork)
+"""
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from text_cleaner import get_stopwords, set_stopwords
+from .config import PARALLEL_WORKERS, PARALLEL_CHUNK_SIZE, PARALLEL_MIN_ROWS
+from .profiling import PipelineStats
+from .synonym_index import SynonymIndex
+from .compact_index import compact_synonym_index
+from .template import get_title_plan
+from .vectorized import generate_title_matrix
+
+logger = logging.getLogger(__name__)
+
+# 작업 프로세스별 공유 상태 (_init_worker에서 설정)
+_worker_state = {}
+
+
+def _init_worker(col_selection, synonym_dict, version_count, sample_seed, template, stopwords,
+                 collect_stats=False):
+    """작업 프로세스 초기화 (사전과 생성 옵션을 한 번만 받아 둠)"""
+    set_stopwords(stopwords)
+    _worker_state.update(
+        col_selection=col_selection,
+        synonym_dict=synonym_dict,
+        version_count=version_count,
+        sample_seed=sample_seed,
+        plan=get_title_plan(template),
+        collect_stats=collect_stats
+    )
+
+
+def _generate_chunk(frame):
+    """
+    작업 프로세스에서 청크 하나의 제목 생성
+
+    Returns:
+        tuple: (청크의 버전별 제목 리스트, 청크의 PipelineStats 또는 None)
+    """
+    stats = PipelineStats() if _worker_state['collect_stats'] else None
+    titles = generate_title_matrix(
+        frame,
+        range(len(frame)),
+        _worker_state['col_selection'],
+        _worker_state['synonym_dict'],
+        _worker_state['version_count'],
+        sample_seed=_worker_state['sample_seed'],
+        template=_worker_state['plan'],
+        stats=stats
+    )
+    return titles, stats
+
+
+def _dispatch_dictionary(synonym_dict):
+    """작업 프로세스로 넘길 사전 (색인은 문자열 표와 정수 배열만 담은 압축 색인으로 변환)"""
+    if isinstance(synonym_dict, SynonymIndex):
+        return compact_synonym_index(synonym_dict)
+    return synonym_dict
+
+
+def resolve_worker_count(workers=None):
+    """
+    사용할 작업 프로세스 수 결정
+
+    Args:
+        workers: 지정한 프로세스 수 (None이면 config.PARALLEL_WORKERS, 그것도 None이면 CPU 수)
+
+    Returns:
+        int: 1 이상의 프로세스 수
+    """
+    if workers is None:
+        workers = PARALLEL_WORKERS
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return max(1, int(workers))
+
+
+def _iter_in_process(df, rows, col_selection, synonym_dict, version_count, sample_seed, plan,
+                     chunk_size, stats):
+    """현재 프로세스에서 청크별로 생성"""
+    for start in range(0, len(rows), chunk_size):
+        chunk_rows = rows[start:start + chunk_size]
+        yield chunk_rows, generate_title_matrix(
+            df, chunk_rows, col_selection, synonym_dict, version_count,
+            sample_seed=sample_seed, template=plan, stats=stats
+        )
+
+
+def iter_titles_parallel(df, rows, col_selection, synonym_dict, version_count,
+                         sample_seed=None, template=None, workers=None,
+                         chunk_size=PARALLEL_CHUNK_SIZE, min_rows=PARALLEL_MIN_ROWS,
+                         stats=None):
+    """
+    여러 프로세스에서 나눠 생성한 제목을 청크가 끝나는 대로 행 순서대로 돌려주기
+
+    전체 결과를 모으지 않고 청크마다 바로 쓸 수 있다. 인자는 generate_titles_parallel과 같다.
+    중간에 작업 프로세스가 실패하면 아직 돌려주지 않은 행만 현재 프로세스에서 생성한다.
+
+    Yields:
+        tuple: (청크의 행 위치 리스트, 청크의 버전별 제목 리스트)
+    """
+    rows = list(rows)
+    plan = get_title_plan(template)
+    chunk_size = max(1, chunk_size)
+    workers = min(resolve_worker_count(workers), -(-len(rows) // chunk_size))
+
+    if workers <= 1 or len(rows) < min_rows:
+        yield from _iter_in_process(
+            df, rows, col_selection, synonym_dict, version_count, sample_seed, plan,
+            chunk_size, stats
+        )
+        return
+
+    # 템플릿에 필요한 컬럼만 청크로 잘라 전달
+    columns = [column for column in plan.columns if column in df.columns]
+    frame = df.iloc[rows][columns]
+    chunks = [frame.iloc[start:start + chunk_size] for start in range(0, len(frame), chunk_size)]
+
+    done = 0
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(
+                list(col_selection), _dispatch_dictionary(synonym_dict), version_count,
+                sample_seed, plan.template, get_stopwords(), stats is not None
+            )
+        ) as executor:
+            # map은 제출 순서대로 결과를 돌려주므로 행 순서가 유지됨
+            # (실패한 청크는 현재 프로세스에서 다시 생성하므로 끝난 청크의 통계만 합침)
+            for titles, chunk_stats in executor.map(_generate_chunk, chunks):
+                if stats is not None:
+                    stats.merge(chunk_stats)
+                yield rows[done:done + len(titles)], titles
+                done += len(titles)
+            return
+
+    except Exception as e:
+        logger.error("generate_titles_parallel: %s - 현재 프로세스에서 다시 생성합니다.", e)
+
+    yield from _iter_in_process(
+        df, rows[done:], col_selection, synonym_dict, version_count, sample_seed, plan,
+        chunk_size, stats
+    )
+
+
+def generate_titles_parallel(df, rows, col_selection, synonym_dict, version_count,
+                             sample_seed=None, template=None, workers=None,
+                             chunk_size=PARALLEL_CHUNK_SIZE, min_rows=PARALLEL_MIN_ROWS,
+                             stats=None):
+    """
+    선택된 행 전체의 버전별 제목을 여러 프로세스에서 나눠 생성
+
+    행 수가 min_rows보다 적거나 프로세스가 하나뿐이면 현재 프로세스에서 생성한다.
+    (프로세스 시작과 사전 전달 비용이 생성 시간보다 큰 경우)
+
+    Args:
+        df: 상품 데이터 DataFrame
+        rows: 처리할 행 위치 리스트 (0-based)
+        col_selection: 선택된 컬럼들
+        synonym_dict: 유의어 사전 (또는 SynonymIndex)
+        version_count: 생성할 버전 수
+        sample_seed: 지정하면 조합별로 서로 다른 조합을 무작위 추출
+        template: 제목 템플릿 (이름, 템플릿 문자열 또는 TitlePlan)
+        workers: 작업 프로세스 수 (None이면 설정 값 또는 CPU 수)
+        chunk_size: 청크 하나의 행 수
+        min_rows: 병렬로 처리할 최소 행 수
+        stats: PipelineStats (있으면 작업 프로세스의 단계별 시간까지 합쳐서 기록)
+
+    Returns:
+        list: rows 순서의 버전별 제목 리스트 (generate_title_matrix의 결과와 동일)
+    """
+    rows = list(rows)
+    workers = min(resolve_worker_count(workers), -(-len(rows) // max(1, chunk_size)))
+    if workers <= 1 or len(rows) < min_rows:
+        return generate_title_matrix(
+            df, rows, col_selection, synonym_dict, version_count,
+            sample_seed=sample_seed, template=template, stats=stats
+        )
+
+    result = []
+    for _, titles in iter_titles_parallel(
+        df, rows, col_selection, synonym_dict, version_count,
+        sample_seed=sample_seed, template=template, workers=workers,
+        chunk_size=chunk_size, min_rows=min_rows, stats=stats
+    ):
+        result.extend(titles)
+    return result
@@ -0,0 +1,143 @@
+"""
+단계별 시간 측정 모듈
+
+generate_titles(collect_stats=True)일 때만 측정한다. PipelineStats를 엔진과 백엔드 함수에
+stats 인자로 넘기면, 각 함수가 단계 함수(prepare_data, find_synonyms, ...)를 timed로 감싸서
+호출한다. 모듈 전역을 바꾸지 않으므로 다른 스레드의 실행에 영향이 없고, 병렬 생성의
+작업 프로세스는 자기 통계를 결과와 함께 돌려준다. (stats가 None이면 원래 함수를 그대로 호출)
+"""
+import time
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+
+
+class PipelineStats:
+    """
+    제목 생성 파이프라인 통계
+
+    Attributes:
+        stages: {단계 이름: [누적 시간(초), 호출 횟수]} (처음 기록된 순서 유지)
+        rows: 처리한 행 수
+        titles: 생성한 제목 수
+        elapsed: 전체 소요 시간(초)
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.rows = 0
+        self.titles = 0
+        self.elapsed = 0.0
+
+    def add(self, name, seconds, calls=1):
+        """단계 시간과 호출 횟수 누적"""
+        entry = self.stages.setdefault(name, [0.0, 0])
+        entry[0] += seconds
+        entry[1] += calls
+
+    @contextmanager
+    def stage(self, name):
+        """with 블록 하나를 단계로 측정"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def merge(self, other):
+        """
+        다른 통계의 단계 시간과 호출 횟수 합치기 (병렬 생성 작업 프로세스의 통계)
+
+        Args:
+            other: PipelineStats
+        """
+        for name, (seconds, calls) in other.stages.items():
+            self.add(name, seconds, calls)
+
+    def wrap(self, name, func):
+        """호출할 때마다 name 단계로 측정하는 함수 반환"""
+        @wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.add(name, time.perf_counter() - start)
+        return timed
+
+    @property
+    def rows_per_sec(self):
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def titles_per_sec(self):
+        return self.titles / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self):
+        """
+        통계를 딕셔너리로 변환
+
+        Returns:
+            dict: stages/rows/titles/elapsed/rows_per_sec/titles_per_sec
+        """
+        return {
+            'stages': {
+                name: {'seconds': seconds, 'calls': calls}
+                for name, (seconds, calls) in self.stages.items()
+            },
+            'rows': self.rows,
+            'titles': self.titles,
+            'elapsed': self.elapsed,
+            'rows_per_sec': self.rows_per_sec,
+            'titles_per_sec': self.titles_per_sec
+        }
+
+    def lines(self):
+        """
+        로그 패널 표시용 문장 목록
+
+        Returns:
+            list: 전체 요약 한 줄 + 단계별 한 줄씩
+        """
+        lines = [
+            f"처리 통계: {self.rows:,}행 / 제목 {self.titles:,}개 / {self.elapsed:.2f}초 "
+            f"({self.rows_per_sec:,.0f}행/초, {self.titles_per_sec:,.0f}제목/초)"
+        ]
+        for name, (seconds, calls) in self.stages.items():
+            share = seconds / self.elapsed * 100 if self.elapsed else 0.0
+            lines.append(f"  {name}: {seconds:.3f}초 ({calls:,}회, {share:.1f}%)")
+        return lines
+
+
+def timed_stage(stats, name):
+    """stats가 있으면 단계 측정, 없으면 아무것도 하지 않는 컨텍스트"""
+    return stats.stage(name) if stats is not None else nullcontext()
+
+
+@contextmanager
+def timed_run(stats):
+    """
+    with 블록 전체의 소요 시간을 stats.elapsed에 더함 (stats가 None이면 아무것도 하지 않음)
+
+    Args:
+        stats: PipelineStats 또는 None
+    """
+    if stats is None:
+        yield stats
+        return
+    start = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        stats.elapsed += time.perf_counter() - start
+
+
+def timed(stats, name, func):
+    """
+    stats가 있으면 호출마다 name 단계로 측정하는 함수, 없으면 func 그대로 반환
+
+    Args:
+        stats: PipelineStats 또는 None
+        name: 단계 이름
+        func: 측정할 함수
+    """
+    return func if stats is None else stats.wrap(name, func)
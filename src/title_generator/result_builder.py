@@ -17,14 +17,42 @@ def generate_result(ordered_columns, ordered_selections, ordered_lists,
     Returns:
         str: 생성된 결과 문자열
     """
+    positions = {key: idx for idx, key in enumerate(ordered_selections)}
     result = []
     for key in ordered_columns:
-        if key in ordered_selections:
-            idx = ordered_selections.index(key)
+        if key in positions:
+            idx = positions[key]
             value = ordered_lists[idx][selected_indices[idx]]
             if value:  # 빈 값이 아닌 경우만 추가
                 result.append(value)
         elif key in fixed_values and fixed_values[key]:
             result.append(fixed_values[key])
             
-    return ' '.join(filter(None, result)) 
\ No newline at end of file
+    return ' '.join(filter(None, result))
+
+def build_token_slots(ordered_columns, ordered_selections, ordered_lists, fixed_values):
+    """
+    제목 토큰 배열과 유의어 자리 위치 생성 (모든 유의어 인덱스가 0인 상태)
+    
+    토큰 배열을 재사용하면서 바뀐 자리만 갱신할 때 사용한다.
+    
+    Args:
+        ordered_columns: 컬럼 순서 리스트
+        ordered_selections: 선택된 컬럼 리스트
+        ordered_lists: 유의어 리스트들
+        fixed_values: 고정 값 딕셔너리
+    
+    Returns:
+        tuple: (토큰 리스트, 유의어 리스트별 토큰 위치 리스트)
+    """
+    positions = {key: idx for idx, key in enumerate(ordered_selections)}
+    tokens = []
+    slots = [0] * len(ordered_selections)
+    for key in ordered_columns:
+        if key in positions:
+            slots[positions[key]] = len(tokens)
+            tokens.append(ordered_lists[positions[key]][0])
+        else:
+            tokens.append(fixed_values.get(key, ''))
+    
+    return tokens, slots
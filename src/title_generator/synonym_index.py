@@ -0,0 +1,304 @@
+"""
+유의어 색인 모듈
+
+유의어 사전을 한 번만 정규화해 두고, 행마다 사전 전체를 순회하는 대신
+정규화된 키로 바로 조회할 수 있도록 한다.
+"""
+import itertools
+import unicodedata
+
+from text_cleaner import clean_text, is_clean_part, stopwords_snapshot, _BRACKET_CHARS
+
+# 유의어 사전 리비전 (사전을 다시 불러올 때마다 증가)
+_revision_counter = itertools.count(1)
+_current_revision = next(_revision_counter)
+
+
+def bump_dictionary_revision():
+    """
+    유의어 사전 리비전 증가 (사전을 새로 불러왔음을 알림)
+
+    Returns:
+        int: 새 리비전 번호
+    """
+    global _current_revision
+    _current_revision = next(_revision_counter)
+    return _current_revision
+
+
+def dictionary_revision(synonym_dict):
+    """
+    유의어 사전의 리비전 조회
+
+    SynonymIndex는 컴파일 시점의 리비전을, 일반 사전은 현재 전역 리비전을 사용한다.
+    """
+    return getattr(synonym_dict, 'revision', _current_revision)
+
+
+def normalize_key(value):
+    """
+    조회용 키 정규화 (NFKC → 공백 압축 → casefold)
+
+    Args:
+        value: 정규화할 값
+
+    Returns:
+        str: 정규화된 키
+    """
+    text = unicodedata.normalize('NFKC', str(value))
+    return ' '.join(text.split()).casefold()
+
+
+class CleanedSynonyms(tuple):
+    """
+    clean_text로 하나씩 미리 정리한 유의어 튜플
+
+    raw에 정리 전 원본을 보관한다. 제목 전체 정리가 필요한 경우에는 조각별 정리와
+    결과가 달라질 수 있으므로(괄호가 조각 경계를 넘는 경우 등) 원본으로 제목을 만든다.
+    """
+
+    # 미리 정리된 유의어만으로 이어 붙인 제목은 정리 생략 가능 (PrecleanedSynonyms)
+    precleaned = False
+
+    def __new__(cls, cleaned, raw):
+        synonyms = super().__new__(cls, cleaned)
+        synonyms.raw = tuple(raw)
+        return synonyms
+
+    def __getnewargs__(self):
+        return tuple(self), self.raw
+
+
+class PrecleanedSynonyms(CleanedSynonyms):
+    """
+    미리 정리된 유의어 튜플
+
+    원본에 괄호가 없고 정리 결과가 모두 정리된 조각(is_clean_part)이므로
+    이 유의어만으로 공백으로 이어 붙인 제목은 clean_text를 다시 거치지 않아도 된다.
+    """
+
+    precleaned = True
+
+
+def precleaned_current(synonym_dict):
+    """
+    사전의 미리 정리된 유의어(PrecleanedSynonyms)를 그대로 써도 되는지 확인
+
+    사전을 정리한 뒤 불필요한 단어 목록이 바뀌었으면 정리 결과가 지금 기준과 다를 수 있으므로
+    False를 반환한다. (이때는 원본 유의어로 제목 전체를 정리)
+    """
+    return getattr(synonym_dict, 'stopwords', None) == stopwords_snapshot()
+
+
+def is_precleaned(synonyms):
+    """미리 정리된 유의어 목록인지 확인 (PrecleanedSynonyms 또는 압축 색인의 같은 종류 ID 목록)"""
+    return getattr(synonyms, 'precleaned', False)
+
+
+def raw_synonyms(synonyms):
+    """미리 정리한 유의어면 정리 전 원본, 아니면 그대로 반환 (압축 색인의 ID 목록 포함)"""
+    return getattr(synonyms, 'raw', synonyms)
+
+
+class CategoryIndex(dict):
+    """
+    카테고리 하나의 색인 (정규화된 키 → 유의어 튜플)
+
+    그룹 색인(build_synonym_index(groups=True))이면 group_of에 원본/유의어의 정규화된 키별
+    그룹 번호를, groups에 그룹별 (대표 원본, 유의어 튜플)을 둔다.
+    """
+
+    # 그룹 색인이 아니면 비어 있음 (인스턴스마다 새로 설정)
+    group_of = {}
+    groups = ()
+
+    def lookup(self, value):
+        """
+        값에 해당하는 유의어 튜플 조회
+
+        원본 키가 우선이고, 원본 키가 아니면 값이 속한 그룹의 유의어를 반환한다.
+
+        Args:
+            value: 조회할 원본 값
+
+        Returns:
+            tuple: 유의어 튜플 (없으면 빈 튜플)
+        """
+        key = normalize_key(value)
+        synonyms = self.get(key)
+        if synonyms is not None:
+            return synonyms
+        group_id = self.group_of.get(key)
+        return () if group_id is None else self.groups[group_id][1]
+
+    def group_id(self, value):
+        """
+        값이 속한 그룹 번호 (그룹 색인이 아니거나 어느 그룹에도 없으면 None)
+
+        Args:
+            value: 조회할 원본 값 또는 유의어
+        """
+        return self.group_of.get(normalize_key(value))
+
+
+class SynonymIndex(dict):
+    """
+    컴파일된 유의어 사전 (카테고리 → CategoryIndex)
+
+    일반 유의어 사전과 같은 방식(`key in index`, `index[key]`)으로
+    사용할 수 있으므로 create_title_combination에 그대로 전달할 수 있다.
+    """
+
+    def __init__(self, categories=None, source=None, clean_report=None, grouped=False,
+                 stopwords=None):
+        super().__init__(categories or {})
+        # 색인을 만든 원본 사전
+        self.source = source
+        # 미리 정리한 경우 정리로 바뀐/비워진 항목 기록
+        self.clean_report = clean_report
+        # 미리 정리할 때의 불필요한 단어 목록 (precleaned_current 참고)
+        self.stopwords = stopwords
+        # 유의어 → 그룹 역색인 포함 여부
+        self.grouped = grouped
+        # 컴파일할 때마다 새 리비전 부여 (캐시 무효화 기준)
+        self.revision = bump_dictionary_revision()
+
+
+def _preclean_synonyms(category, orig, syn_list, report):
+    """
+    유의어 목록을 미리 정리하고 바뀐 항목을 기록
+
+    비워진 유의어도 목록에서 빼지 않는다. (버전별 조합 순서 유지)
+    """
+    cleaned = []
+    for synonym in syn_list:
+        after = clean_text(synonym)
+        if after != synonym:
+            report['modified'].append((category, orig, synonym, after))
+            if not after:
+                report['emptied'].append((category, orig, synonym))
+        cleaned.append(after)
+
+    # 괄호가 있던 항목은 다른 조각과 이어 붙였을 때 정리 결과가 달라질 수 있음
+    if (all(_BRACKET_CHARS.isdisjoint(synonym) for synonym in syn_list)
+            and all(is_clean_part(synonym) for synonym in cleaned)):
+        return PrecleanedSynonyms(cleaned, syn_list)
+    # 제목 전체 정리가 필요 (원본으로 제목 생성)
+    return CleanedSynonyms(cleaned, syn_list)
+
+
+def _find_root(parents, node):
+    """유니온 파인드 루트 찾기 (경로 압축)"""
+    root = node
+    while parents[root] != root:
+        root = parents[root]
+    while parents[node] != root:
+        parents[node], node = root, parents[node]
+    return root
+
+
+def _build_groups(category, entries, category_index, pre_clean):
+    """
+    원본/유의어가 겹치는 항목을 하나의 그룹으로 합쳐 역색인 생성
+
+    항목마다 원본과 유의어의 정규화된 키를 구성원으로 보고, 구성원을 공유하는 항목을
+    유니온 파인드로 합친다. 그룹의 대표 원본은 먼저 나온 항목의 원본이고, 그룹의 유의어는
+    합쳐진 항목들의 유의어를 순서대로 이어 붙인 것이다. (정규화 기준 중복 제거)
+    """
+    items = [
+        (orig, (syn_list,) if isinstance(syn_list, str) else tuple(syn_list))
+        for orig, syn_list in entries.items()
+    ]
+    parents = list(range(len(items)))
+    owner = {}
+    for idx, (orig, syn_list) in enumerate(items):
+        for member in (orig,) + syn_list:
+            key = normalize_key(member)
+            if not key:
+                continue
+            first = owner.setdefault(key, idx)
+            root, other = _find_root(parents, idx), _find_root(parents, first)
+            if root != other:
+                # 먼저 나온 항목이 루트가 되도록 합침
+                parents[max(root, other)] = min(root, other)
+
+    group_of = {}
+    groups = []
+    group_ids = {}
+    group_keys = []
+    for idx, (orig, syn_list) in enumerate(items):
+        root = _find_root(parents, idx)
+        group_id = group_ids.get(root)
+        if group_id is None:
+            group_id = group_ids[root] = len(groups)
+            groups.append((orig, []))
+            group_keys.append(set())
+        synonyms, seen = groups[group_id][1], group_keys[group_id]
+        for synonym in syn_list:
+            key = normalize_key(synonym)
+            if key not in seen:
+                seen.add(key)
+                synonyms.append(synonym)
+        for member in (orig,) + syn_list:
+            key = normalize_key(member)
+            if key:
+                group_of[key] = group_id
+
+    # 정리 기록은 원본 항목 기준이므로 그룹 유의어의 정리는 기록하지 않음
+    report = {'modified': [], 'emptied': []}
+    category_index.groups = [
+        (orig, _preclean_synonyms(category, orig, synonyms, report) if pre_clean else tuple(synonyms))
+        for orig, synonyms in groups
+    ]
+    category_index.group_of = group_of
+
+
+def build_synonym_index(synonym_dict, pre_clean=False, groups=False):
+    """
+    유의어 사전을 색인으로 컴파일
+
+    정규화 결과가 같은 키가 여러 개면 먼저 나온 항목을 사용한다.
+    (기존 선형 탐색이 첫 번째 일치 항목을 반환하던 것과 같은 동작)
+
+    Args:
+        synonym_dict: {카테고리: {원본: [유의어, ...]}} 형태의 유의어 사전
+        pre_clean: True면 유의어를 clean_text로 미리 정리
+                   (결과의 clean_report에 바뀐 항목과 비워진 항목을 기록)
+        groups: True면 유의어로도 조회할 수 있도록 그룹 역색인 생성
+                (원본 키가 아닌 값은 그 값이 속한 그룹의 유의어로 치환)
+
+    Returns:
+        SynonymIndex: 컴파일된 유의어 색인
+    """
+    if isinstance(synonym_dict, SynonymIndex):
+        # 불필요한 단어 목록이 바뀐 뒤에는 다시 정리
+        if ((not pre_clean or (synonym_dict.clean_report is not None
+                               and precleaned_current(synonym_dict)))
+                and (not groups or synonym_dict.grouped)):
+            return synonym_dict
+        pre_clean = pre_clean or synonym_dict.clean_report is not None
+        groups = groups or synonym_dict.grouped
+        synonym_dict = synonym_dict.source
+
+    report = {'modified': [], 'emptied': []} if pre_clean else None
+    categories = {}
+    for category, entries in synonym_dict.items():
+        category_index = CategoryIndex()
+        for orig, syn_list in entries.items():
+            key = normalize_key(orig)
+            if key in category_index:
+                continue
+            if isinstance(syn_list, str):
+                syn_list = (syn_list,)
+            if pre_clean:
+                category_index[key] = _preclean_synonyms(category, orig, syn_list, report)
+            else:
+                category_index[key] = tuple(syn_list)
+        if groups:
+            _build_groups(category, entries, category_index, pre_clean)
+        categories[category] = category_index
+
+    return SynonymIndex(
+        categories, source=synonym_dict, clean_report=report, grouped=groups,
+        stopwords=stopwords_snapshot() if pre_clean else None
+    )
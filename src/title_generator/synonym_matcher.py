@@ -1,6 +1,8 @@
 """
 유의어 매칭 모듈
 """
+from .synonym_index import CategoryIndex, normalize_key
+from .compact_index import CompactCategory
 
 def find_synonyms(value, synonyms_dict):
     """
@@ -8,12 +10,22 @@ def find_synonyms(value, synonyms_dict):
     
     Args:
         value: 매칭할 원본 값
-        synonyms_dict: 유의어 사전
+        synonyms_dict: 유의어 사전 (또는 컴파일된 CategoryIndex / CompactCategory)
     
     Returns:
-        list: 매칭된 유의어 리스트
+        list: 매칭된 유의어 리스트 (CompactCategory면 유의어 ID 목록 SynonymIds)
     """
+    # 컴파일된 색인이면 사전 순회 없이 바로 조회
+    if isinstance(synonyms_dict, CategoryIndex):
+        return synonyms_dict.lookup(value)
+    if isinstance(synonyms_dict, CompactCategory):
+        # 제목 엔진은 ID 목록으로 조합하고 토큰만 문자열로 변환
+        return synonyms_dict.lookup_ids(value)
+    
+    # 색인과 같은 정규화 규칙으로 비교 (먼저 나온 항목 우선)
+    # 원본 사전은 제자리에서 수정될 수 있으므로 정규화 결과를 보관하지 않고 매번 비교
+    key = normalize_key(value)
     for dict_key, syn_list in synonyms_dict.items():
-        if value.lower().strip() == dict_key.lower().strip():
+        if key == normalize_key(dict_key):
             return [syn_list] if isinstance(syn_list, str) else syn_list
-    return [] 
\ No newline at end of file
+    return []
@@ -0,0 +1,231 @@
+"""
+제목 템플릿 모듈
+
+'{브랜드} {색상} {카테고리} - {소재}' 같은 템플릿을 한 번만 해석해 슬롯 계획(TitlePlan)으로
+만들어 두고, 행마다 템플릿을 다시 해석하지 않고 미리 정한 순서대로 이어 붙인다.
+
+'[{브랜드}]', '({색상})'처럼 자리표시자 하나를 감싸는 괄호는 그 컬럼에 딸린 문구로 보고,
+값이 비면 괄호도 함께 뺀다. 고정 문구는 정리하지 않고 값만 정리한다. (render_title 참고)
+"""
+import re
+from functools import lru_cache
+
+from text_cleaner import clean_text
+from .config import TITLE_TEMPLATES, DEFAULT_TEMPLATE
+
+_PLACEHOLDER = re.compile(r'\{([^{}]*)\}')
+
+# 자리표시자 바로 앞의 여는 괄호 / 바로 뒤의 닫는 괄호 (괄호 안쪽 공백 포함)
+_OPENER = re.compile(r'(?:[\[(]\s*)+$')
+_CLOSER = re.compile(r'^(?:\s*[\])])+')
+_BRACKET_PAIRS = {'[': ']', '(': ')'}
+
+
+class TitlePlan:
+    """
+    컴파일된 제목 템플릿
+
+    Attributes:
+        template: 원본 템플릿 문자열
+        columns: 템플릿에 나오는 컬럼 순서
+        prefix: 첫 컬럼 앞의 고정 문구
+        separators: 컬럼별 앞 구분자 (첫 컬럼은 빈 문자열)
+        suffix: 마지막 컬럼 뒤의 고정 문구
+        openers: 컬럼별 여는 괄호 (값이 있을 때만 넣음)
+        closers: 컬럼별 닫는 괄호 (값이 있을 때만 넣음)
+        clean_safe: 정리된 값들만 넣으면 결과도 정리된 상태인지 여부 (공백으로만 이어 붙이는 템플릿)
+    """
+
+    def __init__(self, template, prefix, columns, separators, suffix, openers=None, closers=None):
+        self.template = template
+        self.prefix = prefix
+        self.columns = tuple(columns)
+        self.separators = tuple(separators)
+        self.suffix = suffix
+        self.openers = tuple(openers or [''] * len(self.columns))
+        self.closers = tuple(closers or [''] * len(self.columns))
+        # 다른 구분자는 정리로 값이 비워질 때 구분자만 남을 수 있음
+        self.clean_safe = (
+            not prefix and not suffix
+            and all(sep == ' ' for sep in separators[1:])
+            and not any(self.openers) and not any(self.closers)
+        )
+
+    def __repr__(self):
+        return f"TitlePlan({self.template!r})"
+
+    @property
+    def slots(self):
+        """
+        슬롯 목록
+
+        Returns:
+            list: ('literal', 문구) / ('open', 여는 괄호) / ('column', 컬럼명) /
+                  ('close', 닫는 괄호) / ('separator', 구분자) 순서 목록
+        """
+        slots = []
+        if self.prefix:
+            slots.append(('literal', self.prefix))
+        for idx, column in enumerate(self.columns):
+            if idx:
+                slots.append(('separator', self.separators[idx]))
+            if self.openers[idx]:
+                slots.append(('open', self.openers[idx]))
+            slots.append(('column', column))
+            if self.closers[idx]:
+                slots.append(('close', self.closers[idx]))
+        if self.suffix:
+            slots.append(('literal', self.suffix))
+        return slots
+
+    def column_kinds(self, col_selection, synonym_dict):
+        """
+        컬럼 슬롯별 종류
+
+        Returns:
+            dict: {컬럼명: 'synonym' (유의어 치환) 또는 'static' (행 값 그대로)}
+        """
+        return {
+            column: 'synonym' if column in col_selection and column in synonym_dict else 'static'
+            for column in self.columns
+        }
+
+    def render(self, values):
+        """
+        컬럼 값으로 제목 조립
+
+        빈 값은 괄호와 함께 건너뛰고, 구분자는 앞뒤에 값이 모두 있을 때만 넣는다.
+        (빈 값 뒤의 값은 자기 앞 구분자로 이전 값과 이어짐)
+
+        Args:
+            values: columns 순서의 값 리스트
+
+        Returns:
+            str: 조립된 제목
+        """
+        parts = [self.prefix]
+        has_previous = False
+        for separator, opener, closer, value in zip(
+                self.separators, self.openers, self.closers, values):
+            if value:
+                if has_previous:
+                    parts.append(separator)
+                parts.extend((opener, value, closer))
+                has_previous = True
+        parts.append(self.suffix)
+        return ''.join(parts)
+
+    def render_title(self, values, clean=True):
+        """
+        제목 조립 후 정리
+
+        공백으로만 이어 붙이는 템플릿은 기존처럼 제목 전체를 clean_text로 정리한다.
+        고정 문구가 있는 템플릿은 전체를 정리하면 문구의 괄호/특수문자까지 지워지므로,
+        값만 하나씩 정리하고 고정 문구는 그대로 둔다. (정리로 비워진 값은 괄호/구분자와 함께 빠짐)
+
+        Args:
+            values: columns 순서의 값 리스트 (정리 전 원본)
+            clean: False면 정리하지 않음 (이미 정리된 값)
+
+        Returns:
+            str: 조립된 제목
+        """
+        return self._render_title(values, clean, self.render, clean_text)
+
+    def title_renderer(self, stats=None):
+        """
+        render_title과 같은 제목 함수 (stats가 있으면 조립/정리 시간을 단계별로 측정)
+
+        Args:
+            stats: PipelineStats 또는 None ('render', 'clean_text' 단계)
+
+        Returns:
+            function: render_title(values, clean=True)
+        """
+        if stats is None:
+            return self.render_title
+        render = stats.wrap('render', self.render)
+        clean = stats.wrap('clean_text', clean_text)
+        return lambda values, clean_values=True: self._render_title(
+            values, clean_values, render, clean
+        )
+
+    def _render_title(self, values, clean, render, cleaner):
+        """render_title 본체 (조립 함수와 정리 함수를 받아 사용)"""
+        if not clean:
+            return render(values)
+        if self.clean_safe:
+            return cleaner(render(values))
+        return render([cleaner(value) if value else value for value in values])
+
+
+@lru_cache(maxsize=64)
+def compile_template(template):
+    """
+    템플릿 문자열을 TitlePlan으로 컴파일
+
+    Args:
+        template: '{컬럼명}' 자리표시자가 들어간 템플릿 문자열
+
+    Returns:
+        TitlePlan: 컴파일된 슬롯 계획
+
+    Raises:
+        ValueError: 자리표시자가 없거나, 비어 있거나, 중복되거나, 괄호가 맞지 않는 경우
+                    (대괄호/소괄호는 자리표시자 하나만 감싸야 함)
+    """
+    columns = []
+    literals = []
+    position = 0
+    for match in _PLACEHOLDER.finditer(template):
+        column = match.group(1).strip()
+        if not column:
+            raise ValueError(f"빈 자리표시자: {template!r}")
+        if column in columns:
+            raise ValueError(f"중복된 컬럼 '{column}': {template!r}")
+        literals.append(template[position:match.start()])
+        columns.append(column)
+        position = match.end()
+    literals.append(template[position:])
+
+    if not columns:
+        raise ValueError(f"자리표시자가 없는 템플릿: {template!r}")
+    if any('{' in literal or '}' in literal for literal in literals):
+        raise ValueError(f"괄호가 맞지 않는 템플릿: {template!r}")
+
+    # 자리표시자를 감싸는 괄호는 컬럼에 딸린 문구로 분리
+    openers, closers = [], []
+    for idx in range(len(columns)):
+        opener = _OPENER.search(literals[idx])
+        openers.append(opener.group(0) if opener else '')
+        literals[idx] = literals[idx][:len(literals[idx]) - len(openers[idx])]
+        closer = _CLOSER.match(literals[idx + 1])
+        closers.append(closer.group(0) if closer else '')
+        literals[idx + 1] = literals[idx + 1][len(closers[idx]):]
+
+    for opener, closer in zip(openers, closers):
+        expected = ''.join(_BRACKET_PAIRS[char] for char in reversed(opener) if char in _BRACKET_PAIRS)
+        if expected != ''.join(char for char in closer if not char.isspace()):
+            raise ValueError(f"괄호가 맞지 않는 템플릿: {template!r}")
+    if any(char in literal for literal in literals for char in '[]()'):
+        raise ValueError(f"괄호는 자리표시자 하나만 감싸야 합니다: {template!r}")
+
+    separators = [''] + literals[1:-1]
+    return TitlePlan(template, literals[0], columns, separators, literals[-1], openers, closers)
+
+
+def get_title_plan(template=None):
+    """
+    템플릿 이름/문자열/TitlePlan을 TitlePlan으로 변환
+
+    Args:
+        template: None(기본 템플릿), TITLE_TEMPLATES의 이름, 템플릿 문자열 또는 TitlePlan
+
+    Returns:
+        TitlePlan: 컴파일된 슬롯 계획
+    """
+    if isinstance(template, TitlePlan):
+        return template
+    if template is None:
+        template = DEFAULT_TEMPLATE
+    return compile_template(TITLE_TEMPLATES.get(template, template))
@@ -0,0 +1,145 @@
+"""
+제목 캐시 모듈
+
+속성 값이 같은 행은 같은 제목을 만들므로, 생성 결과를 LRU 방식으로 보관해
+전처리 → 유의어 매칭 → 인덱스 계산 → 결과 생성 → 정리 과정을 건너뛴다.
+"""
+from collections import OrderedDict
+
+from text_cleaner import stopwords_snapshot
+from .config import TITLE_CACHE_SIZE
+from .preprocessor import prepare_data
+from .synonym_index import dictionary_revision
+from .template import get_title_plan
+
+
+class TitleCache:
+    """
+    create_title_combination 결과의 LRU 캐시
+
+    키: (템플릿, 전처리된 속성 값 튜플, 선택 컬럼, 버전 인덱스, 사전 리비전)
+    다른 사전 객체가 들어오거나 사전을 다시 불러와 리비전이 바뀌면 자동으로 비운다.
+    불필요한 단어 목록(set_stopwords)이 바뀌어도 제목 정리 결과가 달라지므로 비운다.
+    """
+
+    def __init__(self, maxsize=TITLE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        # 캐시가 기준으로 삼는 사전 (참조를 유지해 id 재사용을 막음)
+        self._synonym_dict = None
+        self._revision = None
+        self._stopwords = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """캐시 비우기 (적중/미적중 횟수는 유지)"""
+        self._entries.clear()
+
+    def info(self):
+        """
+        캐시 상태 조회
+
+        Returns:
+            dict: 적중/미적중 횟수, 현재 크기, 최대 크기
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'maxsize': self.maxsize
+        }
+
+    def _bind(self, synonym_dict):
+        """사전이나 불필요한 단어 목록이 바뀌었으면 캐시를 비우고 현재 리비전 반환"""
+        revision = dictionary_revision(synonym_dict)
+        stopwords = stopwords_snapshot()
+        if (synonym_dict is not self._synonym_dict or revision != self._revision
+                or stopwords != self._stopwords):
+            self.clear()
+            self._synonym_dict = synonym_dict
+            self._revision = revision
+            self._stopwords = stopwords
+        return revision
+
+    def _row_key(self, row, col_selection, plan):
+        """행의 캐시 키 앞부분 (템플릿, 전처리된 속성 값 튜플, 선택 컬럼)"""
+        attributes = tuple(prepare_data(row, plan.columns).values())
+        return plan.template, attributes, tuple(col_selection)
+
+    def _get(self, key):
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def _put(self, key, value):
+        # 에러 결과는 저장하지 않음
+        if value[1] == 0:
+            return
+        self._entries[key] = value
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def title_combination(self, row, col_selection, synonym_dict, version_idx, template=None,
+                          stats=None):
+        """
+        캐시를 거치는 create_title_combination (stats는 캐시 미적중으로 생성할 때 전달)
+
+        Returns:
+            tuple: (생성된 제목, 전체 조합 수)
+        """
+        from . import create_title_combination
+
+        plan = get_title_plan(template)
+        revision = self._bind(synonym_dict)
+        key = self._row_key(row, col_selection, plan) + (version_idx, revision)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        result = create_title_combination(
+            row, col_selection, synonym_dict, version_idx, plan, stats=stats
+        )
+        self._put(key, result)
+        return result
+
+    def title_combinations(self, row, col_selection, synonym_dict, versions, template=None,
+                           stats=None):
+        """
+        캐시를 거치는 create_title_combinations (stats는 캐시 미적중으로 생성할 때 전달)
+
+        요청한 버전이 모두 캐시에 있을 때만 캐시를 사용하고,
+        하나라도 없으면 한 번에 생성한 뒤 버전별로 저장한다.
+
+        Returns:
+            tuple: (버전별 제목 리스트, 전체 조합 수)
+        """
+        from . import create_title_combinations
+
+        version_indices = range(versions) if isinstance(versions, int) else list(versions)
+        plan = get_title_plan(template)
+        revision = self._bind(synonym_dict)
+        row_key = self._row_key(row, col_selection, plan)
+        keys = [row_key + (version_idx, revision) for version_idx in version_indices]
+
+        cached = [self._get(key) for key in keys]
+        if keys and all(value is not None for value in cached):
+            return [title for title, _ in cached], cached[0][1]
+
+        titles, total_combinations = create_title_combinations(
+            row, col_selection, synonym_dict, version_indices, template=plan, stats=stats
+        )
+        for key, title in zip(keys, titles):
+            self._put(key, (title, total_combinations))
+        return titles, total_combinations
+
+
+# 기본 공용 캐시
+default_title_cache = TitleCache()
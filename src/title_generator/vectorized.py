@@ -0,0 +1,252 @@
+"""
+DataFrame 단위 제목 생성 모듈
+
+행마다 create_title_combination을 호출하는 대신 템플릿의 속성 컬럼을 factorize하여
+고유한 (브랜드, 색상, 패턴, 소재, 카테고리) 조합별로 한 번만 제목을 만들고
+각 행으로 다시 펼친다. 압축 색인은 유의어 ID 목록으로 조합하고 제목에 들어가는 토큰만
+문자열로 바꾼다.
+"""
+import logging
+
+import numpy as np
+import pandas as pd
+
+from text_cleaner import is_clean_part
+from .config import DEFAULT_VALUES
+from .synonym_matcher import find_synonyms
+from .synonym_index import is_precleaned, precleaned_current, raw_synonyms
+from .compact_index import token_source
+from .version_calc import sample_version_indices, row_sample_seed
+from .template import get_title_plan
+from .profiling import timed
+
+logger = logging.getLogger(__name__)
+
+# int64 범위를 넘는 조합 수는 파이썬 정수로 계산
+_MAX_VECTOR_COMBINATIONS = 2 ** 62
+
+# 고정 값 자리의 토큰 ID 목록
+_SINGLE_TOKEN = range(1)
+
+
+def _factorize_column(frame, key):
+    """
+    컬럼 하나를 factorize (컬럼이 없으면 모든 행이 빈 값)
+
+    카테고리형 컬럼은 이미 있는 카테고리 코드를 그대로 사용한다.
+    (선택한 행에 쓰이지 않는 카테고리는 빼서 쓰이는 값만 유의어를 매칭)
+
+    Returns:
+        tuple: (행별 코드 배열, 고유 값 리스트) - 결측값의 코드는 -1
+    """
+    if key not in frame.columns:
+        return np.zeros(len(frame), dtype=np.int64), [DEFAULT_VALUES['empty']]
+
+    values = frame[key]
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.cat.remove_unused_categories()
+        return values.cat.codes.to_numpy(dtype=np.int64), list(values.cat.categories)
+
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    return codes.astype(np.int64), list(uniques)
+
+
+def _resolve_uniques(key, uniques, col_selection, synonym_dict, match=find_synonyms):
+    """
+    고유 값별 유의어 후보 계산 (prepare_data / _resolve_row와 같은 규칙)
+
+    Returns:
+        list: 고유 값별 (정리된 값, 유의어 리스트 / None / 매칭 중 발생한 예외)
+    """
+    use_synonyms = key in synonym_dict and key in col_selection
+    resolved = []
+    for value in uniques:
+        value_str = str(value).strip()
+        synonyms = None
+        if use_synonyms and value_str:
+            try:
+                synonyms = match(value_str, synonym_dict[key]) or None
+            except Exception as e:
+                # 행 단위 생성과 같이 해당 조합 전체를 에러로 처리
+                synonyms = e
+        resolved.append((value_str, synonyms))
+    return resolved
+
+
+def _version_indices(lengths, version_count):
+    """
+    고유 조합 전체의 버전별 인덱스를 한 번에 계산
+
+    Args:
+        lengths: (고유 조합 수, 컬럼 수) 유의어 개수 배열 (고정 값은 1)
+        version_count: 생성할 버전 수
+
+    Returns:
+        ndarray: (고유 조합 수, 버전 수, 컬럼 수) 인덱스 배열
+    """
+    totals = np.prod(lengths, axis=1)
+    versions = np.arange(version_count, dtype=np.int64)
+    remaining = versions[np.newaxis, :] % totals[:, np.newaxis]
+
+    # calculate_version_indices와 같은 혼합 진법 분해 (앞 컬럼이 가장 빨리 변함)
+    strides = np.cumprod(lengths, axis=1) // lengths
+    return (remaining[:, :, np.newaxis] // strides[:, np.newaxis, :]) % lengths[:, np.newaxis, :]
+
+
+def generate_title_matrix(df, rows, col_selection, synonym_dict, version_count,
+                          sample_seed=None, template=None, stats=None):
+    """
+    선택된 행 전체의 버전별 제목을 한 번에 생성
+
+    Args:
+        df: 상품 데이터 DataFrame
+        rows: 처리할 행 위치 리스트 (0-based)
+        col_selection: 선택된 컬럼들
+        synonym_dict: 유의어 사전 (또는 SynonymIndex)
+        version_count: 생성할 버전 수
+        sample_seed: 지정하면 조합별로 서로 다른 조합을 무작위 추출
+        template: 제목 템플릿 (이름, 템플릿 문자열 또는 TitlePlan)
+        stats: PipelineStats (있으면 고유 값 매칭/버전 인덱스 계산/조립/정리 시간 측정)
+
+    Returns:
+        list: rows 순서의 버전별 제목 리스트
+              (create_title_combinations의 결과와 동일)
+    """
+    from . import create_title_combinations
+
+    rows = list(rows)
+    if not rows:
+        return []
+
+    frame = df.iloc[rows]
+    plan = get_title_plan(template)
+    render_title = plan.title_renderer(stats)
+    match = timed(stats, 'find_synonyms', find_synonyms)
+    # 미리 정리한 유의어는 현재 불필요한 단어 목록 기준일 때만 그대로 사용
+    precleaned = precleaned_current(synonym_dict)
+
+    # 1. 템플릿 컬럼별 factorize 및 고유 값의 유의어 매핑
+    column_codes = []
+    column_values = []
+    for key in plan.columns:
+        codes, uniques = _factorize_column(frame, key)
+        column_codes.append(codes)
+        column_values.append(_resolve_uniques(
+            key, uniques, col_selection, synonym_dict, match
+        ))
+
+    codes = np.stack(column_codes, axis=1)
+
+    # 결측값이 있는 행은 행 단위 생성으로 처리 (str(None) 등 원래 규칙 유지)
+    # (고유 조합에서도 빼야 모든 행이 결측값인 컬럼에서 없는 고유 값을 찾지 않음)
+    na_rows = (codes < 0).any(axis=1)
+
+    # 2. 고유 조합 추출
+    unique_codes, inverse = np.unique(codes[~na_rows], axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+
+    # 3. 고유 조합별 유의어 개수와 버전 인덱스
+    lengths = np.ones(unique_codes.shape, dtype=np.int64)
+    for col, values in enumerate(column_values):
+        value_lengths = np.array(
+            [_synonym_count(synonyms) for _, synonyms in values],
+            dtype=np.int64
+        )
+        lengths[:, col] = value_lengths[unique_codes[:, col]]
+
+    totals = [_python_prod(row_lengths) for row_lengths in lengths.tolist()]
+    vector_mask = np.array([total < _MAX_VECTOR_COMBINATIONS for total in totals])
+    indices = np.zeros(unique_codes.shape[:1] + (version_count, len(plan.columns)), dtype=np.int64)
+    if sample_seed is None and vector_mask.any():
+        indices[vector_mask] = timed(stats, 'calculate_version_indices', _version_indices)(
+            lengths[vector_mask], version_count
+        )
+
+    # 4. 고유 조합별 제목 조립
+    unique_titles = []
+    for u, tuple_codes in enumerate(unique_codes.tolist()):
+        try:
+            entries = [column_values[col][code] for col, code in enumerate(tuple_codes)]
+            for _, synonyms in entries:
+                if isinstance(synonyms, Exception):
+                    raise synonyms
+            if sample_seed is not None:
+                seed = row_sample_seed([value_str for value_str, _ in entries], sample_seed)
+                sampled = sample_version_indices(totals[u], version_count, seed)
+                version_indices = [
+                    _decode_version(lengths[u].tolist(), sampled[i % len(sampled)], totals[u])
+                    for i in range(version_count)
+                ]
+            elif vector_mask[u]:
+                version_indices = indices[u].tolist()
+            else:
+                version_indices = [
+                    _decode_version(lengths[u].tolist(), version, totals[u])
+                    for version in range(version_count)
+                ]
+
+            # 미리 정리된 조각만으로 이루어진 조합은 정리 생략
+            needs_clean = not plan.clean_safe or not all(
+                precleaned and is_precleaned(synonyms) if synonyms
+                else not value_str or is_clean_part(value_str)
+                for value_str, synonyms in entries
+            )
+            if needs_clean:
+                # 제목 전체를 정리하므로 미리 정리한 유의어 대신 원본 사용
+                entries = [(value_str, raw_synonyms(synonyms) if synonyms else synonyms)
+                           for value_str, synonyms in entries]
+
+            # 자리별 (토큰 표, 토큰 ID 목록) - 제목에 들어가는 토큰만 표에서 꺼냄
+            sources = [_token_source(value_str, synonyms) for value_str, synonyms in entries]
+            titles = []
+            for selected in version_indices:
+                parts = [tokens[ids[idx]] for (tokens, ids), idx in zip(sources, selected)]
+                titles.append(render_title(parts, needs_clean))
+            unique_titles.append(titles)
+
+        except Exception as e:
+            logger.error("generate_title_matrix: %s", e)
+            unique_titles.append([f"{DEFAULT_VALUES['error_prefix']}{str(e)}"] * version_count)
+
+    # 5. 각 행으로 펼치기
+    result = [None] * len(codes)
+    for pos, u in zip(np.flatnonzero(~na_rows).tolist(), inverse.tolist()):
+        result[pos] = unique_titles[u]
+    for pos in np.flatnonzero(na_rows).tolist():
+        result[pos], _ = create_title_combinations(
+            frame.iloc[pos], col_selection, synonym_dict, version_count,
+            sample_seed=sample_seed, template=plan, stats=stats
+        )
+    return result
+
+
+def _token_source(value_str, synonyms):
+    """자리 하나의 (토큰 표, 토큰 ID 목록) - 고정 값은 토큰 하나짜리 표"""
+    if not synonyms:
+        return (value_str,), _SINGLE_TOKEN
+    return token_source(synonyms)
+
+
+def _synonym_count(synonyms):
+    """유의어 개수 (고정 값이거나 매칭 에러면 1)"""
+    if not synonyms or isinstance(synonyms, Exception):
+        return 1
+    return len(synonyms)
+
+
+def _python_prod(values):
+    """파이썬 정수로 곱 계산 (오버플로 없음)"""
+    total = 1
+    for value in values:
+        total *= value
+    return total
+
+
+def _decode_version(lengths, version_idx, total):
+    """조합 수가 매우 큰 경우의 혼합 진법 분해"""
+    remaining = version_idx % total
+    selected = []
+    for length in lengths:
+        selected.append(remaining % length)
+        remaining //= length
+    return selected
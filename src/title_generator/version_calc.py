@@ -1,6 +1,8 @@
 """
 버전 인덱스 계산 모듈
 """
+import hashlib
+import random
 
 def calculate_version_indices(ordered_lists, version_idx):
     """
@@ -25,4 +27,113 @@ def calculate_version_indices(ordered_lists, version_idx):
         selected_indices.append(idx)
         remaining //= len(synonyms)
         
-    return selected_indices, total_combinations 
\ No newline at end of file
+    return selected_indices, total_combinations
+
+def iter_version_indices(ordered_lists, offset=0, cap=None):
+    """
+    조합 인덱스를 순서대로 생성 (데카르트 곱을 만들지 않음)
+    
+    시작 위치만 calculate_version_indices로 분해하고, 이후에는 앞 자리부터
+    1씩 올리는 방식으로 다음 조합을 만든다. (조합당 평균 O(1))
+    버전 인덱스가 전체 조합 수를 넘어 순환하지 않으므로 각 조합은 한 번만 나온다.
+    
+    Args:
+        ordered_lists: 유의어 리스트들
+        offset: 시작할 조합 번호
+        cap: 최대 생성 개수 (None이면 끝까지)
+    
+    Yields:
+        tuple: (조합 번호, 선택된 인덱스 리스트)
+               인덱스 리스트는 재사용되므로 보관하려면 복사해야 한다.
+    """
+    radices = [len(synonyms) for synonyms in ordered_lists]
+    selected_indices, total_combinations = calculate_version_indices(ordered_lists, offset)
+    
+    end = total_combinations if cap is None else min(total_combinations, offset + cap)
+    for combination_idx in range(offset, end):
+        yield combination_idx, selected_indices
+        
+        # 다음 조합 (혼합 진법 1 증가)
+        for pos, radix in enumerate(radices):
+            selected_indices[pos] += 1
+            if selected_indices[pos] < radix:
+                break
+            selected_indices[pos] = 0
+
+def iter_gray_changes(radices):
+    """
+    혼합 진법 반사 그레이 코드 순서의 자리 변화 생성 (Knuth 7.2.1.1 Algorithm H)
+    
+    모든 자리가 0인 첫 조합 이후, 다음 조합마다 한 자리만 ±1 바뀐다.
+    반복 없이(loopless) 조합당 O(1)로 동작한다.
+    
+    Args:
+        radices: 자리별 진법 (유의어 개수)
+    
+    Yields:
+        tuple: (바뀐 자리, 새 값)
+    """
+    # 진법이 1인 자리는 바뀌지 않으므로 제외
+    positions = [pos for pos, radix in enumerate(radices) if radix > 1]
+    n = len(positions)
+    digits = [0] * n
+    directions = [1] * n
+    focus = list(range(n + 1))
+    
+    while True:
+        j = focus[0]
+        focus[0] = 0
+        if j == n:
+            return
+        
+        digits[j] += directions[j]
+        yield positions[j], digits[j]
+        
+        if digits[j] == 0 or digits[j] == radices[positions[j]] - 1:
+            directions[j] = -directions[j]
+            focus[j] = focus[j + 1]
+            focus[j + 1] = j + 1
+
+def sample_version_indices(total_combinations, k, seed=None):
+    """
+    전체 조합 중 서로 다른 k개의 버전 인덱스를 무작위 추출 (Floyd 알고리즘)
+    
+    조합 공간을 나열하지 않으므로 조합 수가 수십억이어도 O(k) 시간/메모리로 동작한다.
+    
+    Args:
+        total_combinations: 전체 조합 수
+        k: 추출할 개수 (전체 조합 수보다 크면 전체 조합 수만큼)
+        seed: 난수 시드 (같은 시드면 같은 결과)
+    
+    Returns:
+        list: 서로 다른 버전 인덱스 리스트 (무작위 순서)
+    """
+    rng = random.Random(seed)
+    k = max(0, min(k, total_combinations))
+    
+    chosen = set()
+    sampled = []
+    for upper in range(total_combinations - k, total_combinations):
+        candidate = rng.randrange(upper + 1)
+        if candidate in chosen:
+            candidate = upper
+        chosen.add(candidate)
+        sampled.append(candidate)
+    
+    # Floyd 알고리즘은 집합만 균등하므로 순서는 따로 섞음
+    rng.shuffle(sampled)
+    return sampled
+
+def row_sample_seed(values, seed):
+    """
+    행 속성 값과 기본 시드로 행별 시드 계산 (실행마다 같은 값)
+    
+    Args:
+        values: 전처리된 속성 값들
+        seed: 기본 시드
+    
+    Returns:
+        int: 행별 시드
+    """
+    key = '\x1f'.join([str(seed)] + [str(value) for value in values])
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'big')
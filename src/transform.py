@@ -1,110 +1,351 @@
+import os
 import pandas as pd
 import openpyxl
-from title_generator import create_title_combination
+from title_generator import (
+    create_title_combinations, iter_title_chunks, get_title_plan,
+    collect_column_stats, PipelineStats, timed_run, timed_stage
+)
 from openpyxl.utils.cell import get_column_letter
+from title_generator.config import SAVE_MODE
+from xlsx_patch import PatchError, patch_cells
+from save_worker import save_workbook_atomic
+from frame_encoding import ensure_writable
 import time
 
-def generate_titles(file_path, sheet_name, col_selection, synonym_dict, selected_rows, 
-                   version_count, progress_callback, log_callback, model, overwrite=True):
-    """유의어 치환으로 새로운 제목 생성"""
+
+def _save_with_openpyxl(file_path, sheet_name, updates, progress=None, cancelled=None):
+    """워크북 전체를 openpyxl로 읽어 셀 값을 쓰고 저장"""
+    wb = openpyxl.load_workbook(file_path)
     try:
-        wb = None
+        ws = wb[sheet_name]
+        for (row, column), value in updates.items():
+            ws.cell(row=row, column=column, value=value)
+        save_workbook_atomic(wb, file_path, progress, cancelled)
+    finally:
+        wb.close()
+
+
+def _save_job(wb, file_path, sheet_name, updates, output_path=None):
+    """
+    제목 저장 작업 만들기
+
+    wb가 있으면 워크북을 output_path(없으면 file_path)에 저장하고, 없으면 updates를
+    셀 패치로 저장한다. 어느 쪽이든 임시 파일에 쓴 뒤 교체한다. (save_worker.atomic_write)
+
+    Returns:
+        function: job(progress=None, cancelled=None, log=None) — 끝나면 워크북을 닫음
+    """
+    def job(progress=None, cancelled=None, log=None):
         try:
-            if not model:
-                raise Exception("모델이 없습니다.")
-            
-            # DataFrame 복사 및 워크북 로드
-            df = model._df.copy()
-            wb = openpyxl.load_workbook(file_path)
-            ws = wb[sheet_name]
-            
-            # M열(13번째)부터 상품명 열 처리
-            start_col = 12  # M열 (0-based index)
-            existing_cols = {}  # 이미 존재하는 상품명 열의 위치
-            
-            # 1. 기존 상품명 열 위치 찾기
-            for ver in range(1, version_count + 1):
-                col_name = f'상품명_{ver}'
-                if col_name in df.columns:
-                    existing_cols[ver] = df.columns.get_loc(col_name)
-            
-            # 2. M열부터 순차적으로 새 열 추가
-            next_col = start_col
-            for ver in range(1, version_count + 1):
-                col_name = f'상품명_{ver}'
+            if wb is not None:
+                save_workbook_atomic(wb, output_path or file_path, progress, cancelled)
+                return
+            try:
+                patch_cells(file_path, sheet_name, updates, progress=progress, cancelled=cancelled)
+            except PatchError as patch_error:
+                if log:
+                    log(f"셀 패치 저장 불가({patch_error}), 전체 저장으로 진행")
+                _save_with_openpyxl(file_path, sheet_name, updates, progress, cancelled)
+        finally:
+            if wb is not None:
+                wb.close()
+    return job
+
+
+def _output_row(row):
+    """출력 워크북에 쓸 행 값 (결측값은 빈 셀)"""
+    return [None if pd.isna(value) else value for value in row]
+
+
+def _apply_title_matrix(df, rows, title_matrix, version_count, overwrite):
+    """
+    백엔드가 만든 제목 행렬을 상품명_N 컬럼에 컬럼마다 한 번에 쓰기
+
+    행별 처리와 같은 규칙을 따른다. 빈 제목이나 ERROR 제목은 기존 값을 유지하고,
+    overwrite=False면 기존 값이 있는 셀은 건너뛴다.
+
+    Args:
+        df: 상품 DataFrame (상품명_1~N 컬럼이 있어야 함)
+        rows: 처리할 행 위치 목록
+        title_matrix: 행별 제목 목록 (rows와 같은 순서)
+        version_count: 버전 수
+        overwrite: 기존 값 덮어쓰기 여부
+
+    Returns:
+        dict: {열 위치(0부터): (쓴 행 위치 리스트, 제목 리스트)}
+    """
+    written = {}
+    for ver in range(1, version_count + 1):
+        col = df.columns.get_loc(f'상품명_{ver}')
+        target_rows, titles = [], []
+        for row, new_titles, current in zip(rows, title_matrix, df.iloc[rows, col].tolist()):
+            if ver > len(new_titles):
+                continue
+            title = new_titles[ver - 1]
+            if not title or title.startswith("ERROR"):
+                title = current
+            if overwrite or not current:
+                target_rows.append(row)
+                titles.append(title)
+        if target_rows:
+            df.iloc[target_rows, col] = titles
+        written[col] = (target_rows, titles)
+    return written
+
+
+def generate_titles(file_path, sheet_name, col_selection, synonym_dict, selected_rows, 
+                   version_count, progress_callback, log_callback, model, overwrite=True,
+                   vectorized=False, title_cache=None, sample_seed=None, template=None,
+                   parallel=False, workers=None, collect_stats=False, backend=None,
+                   save_mode=None, output_path=None, output_sheet=None, save_handler=None):
+    """
+    유의어 치환으로 새로운 제목 생성
+    
+    backend를 주면 해당 백엔드('reference', 'indexed', 'vectorized', 'parallel', 'free_text')로
+    선택된 행 전체를 한 번에 생성한다. (title_generator.backends 참고)
+    'free_text'는 속성 컬럼 대신 상품명 컬럼 안의 단어를 유의어로 바꾼다.
+    vectorized=True는 backend='vectorized', parallel=True는 backend='parallel'과 같다.
+    title_cache(TitleCache)를 주면 속성 값이 같은 행의 결과를 재사용한다.
+    sample_seed를 주면 버전마다 전체 조합 중 서로 다른 조합을 무작위로 뽑는다.
+    (캐시는 버전 인덱스 기준이므로 sample_seed와 함께 쓰면 사용하지 않음)
+    template은 제목 템플릿 이름(config.TITLE_TEMPLATES) 또는 템플릿 문자열이다.
+    workers는 parallel 백엔드의 작업 프로세스 수이다. (선택 행이 적으면 현재 프로세스에서 생성)
+    collect_stats=True면 단계별 누적 시간/호출 횟수와 행·제목 처리 속도를 측정해
+    PipelineStats로 반환한다. (기본값이면 None 반환, 측정 비용 없음)
+    통계는 엔진/백엔드 함수에 인자로 넘겨 기록하므로 병렬 생성의 작업 프로세스 단계도 포함된다.
+    save_handler로 저장을 넘기면 저장 시간은 포함되지 않는다. (저장 작업 쪽에서 더함)
+    save_mode는 저장 방식이다. (None이면 config.SAVE_MODE)
+    'openpyxl'은 워크북 전체를 읽고 다시 저장하고, 'patch'는 대상 시트 XML의 바뀐 셀만
+    고쳐 쓰고 다른 파트는 그대로 복사한다. (수식 셀 등 패치할 수 없으면 openpyxl로 저장)
+    output_path를 주면 원본 파일은 읽거나 고치지 않고, 처리한 행(헤더 + 선택 행 순서)을
+    새 워크북의 output_sheet 시트(None이면 sheet_name)에 openpyxl 쓰기 전용 모드로 쓴다.
+    행은 제목을 만드는 대로 바로 쓰므로 행 수가 많아도 메모리 사용량이 늘지 않는다.
+    (이때 save_mode는 사용하지 않음)
+    저장은 항상 같은 폴더의 임시 파일에 쓴 뒤 원본과 교체한다. (중간에 실패해도 원본 유지)
+    save_handler를 주면 여기서 저장하지 않고 저장 작업 job(progress, cancelled, log)을
+    save_handler(job)으로 넘긴다. (GUI에서 save_worker.SaveWorker로 백그라운드 저장)
+    """
+    try:
+        stats = PipelineStats() if collect_stats else None
+        with timed_run(stats):
+            wb = None
+            try:
+                if not model:
+                    raise Exception("모델이 없습니다.")
                 
-                # 이미 존재하는 열이면 건너뛰기
-                if ver in existing_cols:
-                    next_col = max(next_col, existing_cols[ver] + 1)
-                    continue
+                # 제목 템플릿은 작업 시작 전에 한 번만 컴파일
+                plan = get_title_plan(template)
                 
-                # 새 열 추가
-                while len(df.columns) <= next_col:
-                    temp_name = f'Column_{len(df.columns)}'
-                    df[temp_name] = ''
+                # DataFrame 복사 및 워크북 로드 (패치 저장은 워크북을 읽지 않음)
+                df = model._df.copy()
+                save_mode = save_mode or SAVE_MODE
+                ws = out_ws = None
+                if output_path is not None:
+                    if os.path.abspath(output_path) == os.path.abspath(file_path):
+                        raise ValueError("출력 파일은 원본 파일과 달라야 합니다.")
+                    wb = openpyxl.Workbook(write_only=True)
+                    out_ws = wb.create_sheet(output_sheet or sheet_name)
+                elif save_mode == 'openpyxl':
+                    with timed_stage(stats, 'load_workbook'):
+                        wb = openpyxl.load_workbook(file_path)
+                    ws = wb[sheet_name]
+                elif save_mode != 'patch':
+                    raise ValueError(f"알 수 없는 저장 방식: {save_mode}")
+                updates = {}  # {(엑셀 행, 엑셀 열): 제목}
                 
-                # 해당 위치의 열 이름을 상품명_N으로 변경
-                df.rename(columns={df.columns[next_col]: col_name}, inplace=True)
-                existing_cols[ver] = next_col
-                next_col += 1
-            
-            # 처리할 행 인덱스
-            df_indices = selected_rows
-            
-            if log_callback:
-                log_callback(f"처리 시작: 총 {len(df_indices)}개 행")
-            
-            # 각 선택된 행에 대해 처리
-            for i, df_idx in enumerate(df_indices, 1):
-                try:
-                    current_row = df.iloc[df_idx]
-                    titles = []
+                # M열(13번째)부터 상품명 열 처리
+                start_col = 12  # M열 (0-based index)
+                existing_cols = {}  # 이미 존재하는 상품명 열의 위치
+                filler_cols = set()  # 상품명 열 위치를 맞추려고 채운 빈 열
+                
+                # 1. 기존 상품명 열 위치 찾기
+                for ver in range(1, version_count + 1):
+                    col_name = f'상품명_{ver}'
+                    if col_name in df.columns:
+                        existing_cols[ver] = df.columns.get_loc(col_name)
+                
+                # 2. M열부터 순차적으로 새 열 추가
+                next_col = start_col
+                for ver in range(1, version_count + 1):
+                    col_name = f'상품명_{ver}'
                     
-                    # 각 버전별로 새 제목 생성
-                    for version in range(version_count):
-                        new_title, _ = create_title_combination(
-                            current_row,
-                            col_selection,
-                            synonym_dict,
-                            version
-                        )
-                        
-                        if new_title and not new_title.startswith("ERROR"):
-                            titles.append(new_title)
-                        else:
-                            titles.append(df.iloc[df_idx][f'상품명_{version+1}'])
+                    # 이미 존재하는 열이면 건너뛰기
+                    if ver in existing_cols:
+                        next_col = max(next_col, existing_cols[ver] + 1)
+                        continue
                     
-                    # 모든 버전의 제목 열 업데이트
-                    for ver, title in enumerate(titles, 1):
-                        col_name = f'상품명_{ver}'
-                        if overwrite or not df.iloc[df_idx][col_name]:
-                            # DataFrame 업데이트
-                            df.loc[df_idx, col_name] = title
-                            if model:
-                                model.update_cell(df_idx, df.columns.get_loc(col_name), title)
+                    # 새 열 추가
+                    while len(df.columns) <= next_col:
+                        temp_name = f'Column_{len(df.columns)}'
+                        df[temp_name] = ''
+                        filler_cols.add(temp_name)
+                    
+                    # 해당 위치의 열 이름을 상품명_N으로 변경
+                    df.rename(columns={df.columns[next_col]: col_name}, inplace=True)
+                    existing_cols[ver] = next_col
+                    next_col += 1
+                
+                # 카테고리형 속성 컬럼 자리가 상품명_N이 됐으면 새 제목을 쓸 수 있도록 되돌림
+                for col in existing_cols.values():
+                    ensure_writable(df, col)
+                
+                # 출력 워크북 헤더 (이번 실행에서 채운 빈 열 이름은 비워 둠)
+                if out_ws is not None:
+                    out_ws.append([None if column in filler_cols else column for column in df.columns])
+                
+                # 처리할 행 인덱스
+                df_indices = selected_rows
+                
+                if log_callback:
+                    log_callback(f"처리 시작: 총 {len(df_indices)}개 행")
+                
+                # 고유 속성 조합별로 청크 단위 생성
+                if backend is None:
+                    backend = 'parallel' if parallel else 'vectorized' if vectorized else None
+                if backend is not None:
+                    # 전체 제목 행렬을 기다리지 않고 청크가 끝나는 대로 셀과 출력 행을 씀
+                    chunks = iter_title_chunks(
+                        backend, df, df_indices, col_selection, synonym_dict, version_count,
+                        sample_seed=sample_seed, template=plan, workers=workers, stats=stats
+                    )
+                    done = 0
+                    while True:
+                        with timed_stage(stats, 'generate'):
+                            chunk = next(chunks, None)
+                        if chunk is None:
+                            break
+                        chunk_rows, title_matrix = chunk
+                        
+                        # 백엔드 결과는 컬럼마다 한 번에 쓰기 (행마다 iloc/loc를 거치지 않음)
+                        with timed_stage(stats, 'write_cells'):
+                            written = _apply_title_matrix(
+                                df, chunk_rows, title_matrix, version_count, overwrite
+                            )
+                            for col, (rows, titles) in written.items():
+                                if model:
+                                    model.update_cells(rows, col, titles)
+                                if ws is not None:
+                                    for row, title in zip(rows, titles):
+                                        ws.cell(row=row + 2, column=col + 1, value=title)
+                                elif out_ws is None:
+                                    updates.update(
+                                        ((row + 2, col + 1), title) for row, title in zip(rows, titles)
+                                    )
+                            if out_ws is not None:
+                                for values in df.iloc[chunk_rows].itertuples(index=False, name=None):
+                                    out_ws.append(_output_row(values))
+                        if stats is not None:
+                            stats.rows += len(chunk_rows)
+                            stats.titles += sum(len(new_titles) for new_titles in title_matrix)
+                        done += len(chunk_rows)
+                        if progress_callback:
+                            progress_callback(done, len(df_indices))
+                
+                else:
+                    # 각 선택된 행에 대해 처리
+                    for i, df_idx in enumerate(df_indices, 1):
+                        try:
+                            current_row = df.iloc[df_idx]
+                            titles = []
+                        
+                            # 모든 버전의 새 제목을 한 번에 생성
+                            if title_cache is not None and sample_seed is None:
+                                with timed_stage(stats, 'generate'):
+                                    new_titles, _ = title_cache.title_combinations(
+                                        current_row,
+                                        col_selection,
+                                        synonym_dict,
+                                        version_count,
+                                        template=plan,
+                                        stats=stats
+                                    )
+                            else:
+                                with timed_stage(stats, 'generate'):
+                                    new_titles, _ = create_title_combinations(
+                                        current_row,
+                                        col_selection,
+                                        synonym_dict,
+                                        version_count,
+                                        sample_seed=sample_seed,
+                                        template=plan,
+                                        stats=stats
+                                    )
+                        
+                            for version, new_title in enumerate(new_titles):
+                                if new_title and not new_title.startswith("ERROR"):
+                                    titles.append(new_title)
+                                else:
+                                    titles.append(current_row[f'상품명_{version+1}'])
+                        
+                            # 모든 버전의 제목 열 업데이트
+                            with timed_stage(stats, 'write_cells'):
+                                for ver, title in enumerate(titles, 1):
+                                    col_name = f'상품명_{ver}'
+                                    if overwrite or not df.iloc[df_idx][col_name]:
+                                        # DataFrame 업데이트
+                                        df.loc[df_idx, col_name] = title
+                                        if model:
+                                            model.update_cell(df_idx, df.columns.get_loc(col_name), title)
+                                    
+                                        # 워크시트 업데이트 (패치 저장은 바뀐 셀만 모아 두었다가 한 번에 씀)
+                                        excel_col = df.columns.get_loc(col_name) + 1
+                                        excel_row = df_idx + 2
+                                        if ws is not None:
+                                            ws[f"{get_column_letter(excel_col)}{excel_row}"] = title
+                                        elif out_ws is None:
+                                            updates[(excel_row, excel_col)] = title
                             
-                            # 워크시트 업데이트
-                            col_letter = get_column_letter(df.columns.get_loc(col_name) + 1)
-                            excel_row = df_idx + 2
-                            ws[f"{col_letter}{excel_row}"] = title
+                                # 출력 워크북에는 행 전체를 바로 씀
+                                if out_ws is not None:
+                                    out_ws.append(_output_row(df.iloc[df_idx]))
+                        
+                            if stats is not None:
+                                stats.rows += 1
+                                stats.titles += len(new_titles)
+                        
+                            if progress_callback:
+                                progress_callback(i, len(df_indices))
                     
-                    if progress_callback:
-                        progress_callback(i, len(df_indices))
+                        except Exception as row_error:
+                            if log_callback:
+                                log_callback(f"행 {df_idx} 처리 중 오류: {str(row_error)}")
+                            # 출력 워크북에서 행이 빠지지 않도록 원본 행을 그대로 씀
+                            if out_ws is not None:
+                                out_ws.append(_output_row(df.iloc[df_idx]))
+                            continue
                 
-                except Exception as row_error:
-                    if log_callback:
-                        log_callback(f"행 {df_idx} 처리 중 오류: {str(row_error)}")
-                    continue
-            
-            # 변경사항 저장
-            wb.save(file_path)
-            
-        finally:
-            if wb:
-                wb.close()
+                if title_cache is not None and log_callback:
+                    cache_info = title_cache.info()
+                    log_callback(
+                        f"제목 캐시: 적중 {cache_info['hits']:,}회 / 미적중 {cache_info['misses']:,}회"
+                    )
+                
+                # 빈 값/유의어 미일치 행 수는 행마다가 아니라 실행마다 한 번만 보고
+                # (free_text는 속성 컬럼을 쓰지 않으므로 제외)
+                if backend != 'free_text':
+                    with timed_stage(stats, 'column_stats'):
+                        column_stats = collect_column_stats(
+                            df, df_indices, col_selection, synonym_dict, plan
+                        )
+                    column_stats.report(log_callback)
+                
+                # 변경사항 저장 (워크북은 저장 작업이 닫음)
+                save_job = _save_job(wb, file_path, sheet_name, updates, output_path)
+                wb = None
+                if save_handler is not None:
+                    save_handler(save_job)
+                else:
+                    with timed_stage(stats, 'save_workbook'):
+                        save_job(log=log_callback)
+                
+            finally:
+                if wb:
+                    wb.close()
         
         if log_callback:
-            log_callback("\n완료!")
+            log_callback("\n완료!" if save_handler is None else "\n제목 생성 완료! 백그라운드에서 저장합니다.")
+        
+        return stats
             
     except Exception as e:
         print(f"\n=== 오류 발생 ===\n{str(e)}")
@@ -0,0 +1,238 @@
+"""
+xlsx 셀 패치 모듈 (바뀐 셀만 시트 XML에 직접 써 넣기)
+
+openpyxl로 저장하면 워크북 전체(유의어 시트 포함)를 읽고 모든 시트를 다시 직렬화한다.
+이 모듈은 대상 시트 XML에서 바뀐 셀이 있는 행만 고쳐 쓰고, 나머지 파트는 내용을 그대로 복사한다.
+
+    - 새 값은 인라인 문자열(t="inlineStr")로 써서 sharedStrings.xml은 건드리지 않는다.
+    - 기존 셀의 스타일(s)은 유지하고, 시트 크기(dimension)는 새 셀을 포함하도록 넓힌다.
+    - 새 zip은 같은 폴더의 임시 파일에 쓴 뒤 os.replace로 바꾼다. (save_worker.atomic_write)
+
+수식이 있는 셀을 덮어쓰거나 '='로 시작하는 값처럼 openpyxl 저장과 결과가 달라지는 경우는
+PatchError를 발생시키며, 호출 측에서 openpyxl 저장으로 대신한다.
+"""
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.utils.cell import get_column_letter, range_boundaries
+
+from save_worker import atomic_write
+from xlsx_reader import XlsxReader, _column_index
+
+
+class PatchError(Exception):
+    """셀 패치로 저장할 수 없는 시트/값"""
+
+
+_ATTR_R = re.compile(r'(?<![\w:])r="([A-Z]*)(\d*)"')
+_ATTR_ROW = re.compile(r'(?<![\w:])r="(\d+)"')
+_ATTR_S = re.compile(r'(?<![\w:])s="(\d+)"')
+_ATTR_SPANS = re.compile(r'\s+spans="[^"]*"')
+
+
+def _cell_xml(prefix, reference, value, style=''):
+    """인라인 문자열 셀 XML (빈 값이면 값 없는 셀)"""
+    if value is None or value == '':
+        return f'<{prefix}c r="{reference}"{style}/>'
+    value = str(value)
+    if value.startswith('=') or ILLEGAL_CHARACTERS_RE.search(value):
+        raise PatchError(f"{reference}: 인라인 문자열로 쓸 수 없는 값")
+    return (
+        f'<{prefix}c r="{reference}"{style} t="inlineStr"><{prefix}is>'
+        f'<{prefix}t xml:space="preserve">{escape(value)}</{prefix}t></{prefix}is></{prefix}c>'
+    )
+
+
+def _patch_row(prefix, row_idx, start_tag, inner, cells):
+    """
+    행 하나의 셀 교체/추가
+
+    Args:
+        prefix: 네임스페이스 접두사 ('' 또는 'x:')
+        row_idx: 행 번호
+        start_tag: 행 시작 태그 ('<row ...>', 닫힌 태그도 '>'로 끝나게 넘김)
+        inner: 행 안의 XML
+        cells: {열 번호: 값}
+
+    Returns:
+        str: 고친 행 XML
+    """
+    cell_pattern = re.compile(
+        rf'<{prefix}c\b([^>]*?)(?:/>|>(.*?)</{prefix}c>)', re.DOTALL
+    )
+    pending = sorted(cells.items())
+    pieces = []
+    pos = 0
+    last_end = 0
+    for match in cell_pattern.finditer(inner):
+        reference = _ATTR_R.search(match.group(1))
+        if reference is None or not reference.group(1):
+            raise PatchError(f"{row_idx}행: 셀 주소가 없는 셀")
+        col_idx = _column_index(reference.group(1))
+
+        # 이 셀보다 앞 열의 새 셀 삽입
+        while pending and pending[0][0] < col_idx:
+            new_col, value = pending.pop(0)
+            pieces.append(inner[pos:match.start()])
+            pieces.append(_cell_xml(prefix, f"{get_column_letter(new_col)}{row_idx}", value))
+            pos = match.start()
+
+        if pending and pending[0][0] == col_idx:
+            _, value = pending.pop(0)
+            if match.group(2) and f'<{prefix}f' in match.group(2):
+                raise PatchError(f"{reference.group(1)}{row_idx}: 수식 셀")
+            style = _ATTR_S.search(match.group(1))
+            pieces.append(inner[pos:match.start()])
+            pieces.append(_cell_xml(
+                prefix, f"{reference.group(1)}{row_idx}", value,
+                f' s="{style.group(1)}"' if style else ''
+            ))
+            pos = match.end()
+        last_end = match.end()
+
+    # 마지막 셀 뒤에 남은 새 셀 추가 (행 확장 요소(extLst)보다 앞)
+    if pending:
+        pieces.append(inner[pos:last_end])
+        for new_col, value in pending:
+            pieces.append(_cell_xml(prefix, f"{get_column_letter(new_col)}{row_idx}", value))
+        pos = last_end
+    pieces.append(inner[pos:])
+
+    # 열 범위 힌트(spans)는 새 셀이 들어가면 맞지 않을 수 있으므로 제거 (선택 속성)
+    start_tag = _ATTR_SPANS.sub('', start_tag)
+    return f"{start_tag}{''.join(pieces)}</{prefix}row>"
+
+
+def _patch_dimension(xml, prefix, max_row, max_col):
+    """시트 크기(dimension)를 새 셀까지 넓히기"""
+    pattern = re.compile(rf'(<{prefix}dimension\b[^>]*?\bref=")([^"]*)(")')
+    match = pattern.search(xml)
+    if match is None:
+        return xml
+    try:
+        min_col, min_row, old_col, old_row = range_boundaries(match.group(2))
+    except ValueError:
+        return xml
+    min_col, min_row = min_col or 1, min_row or 1
+    new_col, new_row = max(old_col or 1, max_col), max(old_row or 1, max_row)
+    ref = f"{get_column_letter(min_col)}{min_row}:{get_column_letter(new_col)}{new_row}"
+    return xml[:match.start(2)] + ref + xml[match.end(2):]
+
+
+def patch_sheet_xml(xml, updates):
+    """
+    시트 XML에 셀 값 써 넣기
+
+    Args:
+        xml: 시트 XML 문자열
+        updates: {(행 번호, 열 번호): 값} (1부터)
+
+    Returns:
+        str: 고친 시트 XML
+    """
+    if not updates:
+        return xml
+    by_row = {}
+    for (row_idx, col_idx), value in updates.items():
+        by_row.setdefault(row_idx, {})[col_idx] = value
+    target_rows = sorted(by_row)
+
+    sheet_data = re.search(r'<(\w+:)?sheetData\b[^>]*?(/?)>', xml)
+    if sheet_data is None:
+        raise PatchError("sheetData가 없는 시트")
+    prefix = sheet_data.group(1) or ''
+    if sheet_data.group(2):
+        # 빈 시트 (<sheetData/>)
+        head = xml[:sheet_data.start()] + f'<{prefix}sheetData>'
+        body, tail = '', f'</{prefix}sheetData>' + xml[sheet_data.end():]
+    else:
+        end = xml.index(f'</{prefix}sheetData>', sheet_data.end())
+        head, body, tail = xml[:sheet_data.end()], xml[sheet_data.end():end], xml[end:]
+
+    row_pattern = re.compile(rf'<{prefix}row\b([^>]*?)(/?)>')
+    row_end = f'</{prefix}row>'
+    pieces = []
+    pos = 0
+    next_target = 0
+    for match in row_pattern.finditer(body):
+        if match.start() < pos:
+            continue  # 앞 행 안에서 찾은 것 (행 안에 row 태그는 없지만 안전하게 건너뜀)
+        number = _ATTR_ROW.search(match.group(1))
+        if number is None:
+            raise PatchError("행 번호(r)가 없는 행")
+        row_idx = int(number.group(1))
+        end = match.end() if match.group(2) else body.index(row_end, match.end()) + len(row_end)
+
+        # 이 행보다 앞의 새 행 삽입
+        while next_target < len(target_rows) and target_rows[next_target] < row_idx:
+            new_row = target_rows[next_target]
+            pieces.append(body[pos:match.start()])
+            pieces.append(_patch_row(prefix, new_row, f'<{prefix}row r="{new_row}">', '', by_row[new_row]))
+            pos = match.start()
+            next_target += 1
+
+        if next_target < len(target_rows) and target_rows[next_target] == row_idx:
+            if match.group(2):
+                start_tag, inner = match.group(0)[:-2].rstrip() + '>', ''
+            else:
+                start_tag, inner = match.group(0), body[match.end():end - len(row_end)]
+            pieces.append(body[pos:match.start()])
+            pieces.append(_patch_row(prefix, row_idx, start_tag, inner, by_row[row_idx]))
+            pos = end
+            next_target += 1
+            if next_target == len(target_rows):
+                break
+
+    pieces.append(body[pos:])
+    for new_row in target_rows[next_target:]:
+        pieces.append(_patch_row(prefix, new_row, f'<{prefix}row r="{new_row}">', '', by_row[new_row]))
+
+    head = _patch_dimension(
+        head, prefix, target_rows[-1], max(col_idx for _, col_idx in updates)
+    )
+    return head + ''.join(pieces) + tail
+
+
+def patch_cells(path, sheet_name, updates, output=None, progress=None, cancelled=None):
+    """
+    엑셀 파일의 셀 값만 바꿔 저장
+
+    대상 시트 XML만 고치고 다른 파트는 내용을 그대로 복사한다.
+    (save_worker.atomic_write로 임시 파일에 쓴 뒤 교체)
+
+    Args:
+        path: 엑셀 파일 경로
+        sheet_name: 셀을 바꿀 시트 이름
+        updates: {(행 번호, 열 번호): 값} (1부터)
+        output: 저장할 경로 (None이면 path에 덮어씀)
+        progress: progress(쓴 바이트 수, 쓴 파트 수) 콜백
+        cancelled: 취소 여부 함수
+
+    Returns:
+        int: 바꾼 셀 수
+
+    Raises:
+        PatchError: 셀 패치로 저장할 수 없는 경우 (openpyxl 저장으로 대신해야 함)
+        SaveCancelled: 취소됨 (원본 파일은 그대로)
+    """
+    with XlsxReader(path) as reader:
+        if sheet_name not in reader.sheetnames:
+            raise KeyError(f"시트를 찾을 수 없습니다: {sheet_name}")
+        part = reader.sheet_part(sheet_name)
+
+    def write(archive):
+        # 원본은 교체 전에 닫아야 함 (Windows에서는 열린 파일을 바꿀 수 없음)
+        with zipfile.ZipFile(path) as source:
+            for info in source.infolist():
+                data = source.read(info)
+                if info.filename == part:
+                    # 고친 시트는 빠른 압축 수준으로 (큰 시트에서 저장 시간 대부분이 압축)
+                    data = patch_sheet_xml(data.decode('utf-8'), updates).encode('utf-8')
+                    archive.writestr(info, data, compresslevel=1)
+                else:
+                    archive.writestr(info, data)
+
+    atomic_write(output or path, write, progress, cancelled)
+    return len(updates)
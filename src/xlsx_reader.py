@@ -0,0 +1,341 @@
+"""
+xlsx 스트리밍 읽기 모듈 (openpyxl 없이 시트 XML을 직접 읽음)
+
+openpyxl은 읽기 전용 모드에서도 셀마다 값을 변환하는 파서 객체를 거치고, 일반 모드에서는
+사용하지 않는 시트까지 모두 셀 객체로 만든다. 이 모듈은 xlsx(zip)에서
+
+    xl/workbook.xml (시트 목록) → sharedStrings.xml (한 번만) → 요청한 시트 XML만 iterparse
+
+순서로 필요한 부분만 읽고, 상품 시트는 행 객체 없이 바로 컬럼 리스트에 값을 넣는다.
+값 변환(공유 문자열, 숫자, 불리언, 날짜 서식)은 openpyxl의 values_only 읽기와 같다.
+(수식은 저장된 계산 값만 읽음. 시트 크기(dimension)는 열 수를 맞출 때만 쓰고 행을 자르지는 않음)
+"""
+import posixpath
+import zipfile
+from xml.etree.ElementTree import iterparse, parse
+
+from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format, is_timedelta_format
+from openpyxl.utils.cell import column_index_from_string, range_boundaries
+from openpyxl.utils.datetime import (
+    CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900, from_excel, from_ISO8601
+)
+import pandas as pd
+
+_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+_DOC_REL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+
+_ROW, _CELL, _VALUE = _MAIN + 'row', _MAIN + 'c', _MAIN + 'v'
+_TEXT, _RUN, _INLINE = _MAIN + 't', _MAIN + 'r', _MAIN + 'is'
+_STRING_ITEM, _DIMENSION = _MAIN + 'si', _MAIN + 'dimension'
+
+
+def _rich_text(element):
+    """<si>/<is> 요소의 글자 (서식 조각 포함, 발음 표기(rPh) 제외)"""
+    if element is None:
+        return None
+    snippets = []
+    for child in element:
+        if child.tag == _TEXT:
+            snippets.append(child.text or '')
+        elif child.tag == _RUN:
+            snippets.append(child.findtext(_TEXT) or '')
+    return ''.join(snippets)
+
+
+def _cast_number(value):
+    """숫자 문자열을 int/float로 변환 (openpyxl과 같은 규칙)"""
+    if '.' in value or 'E' in value or 'e' in value:
+        return float(value)
+    return int(value)
+
+
+def _column_index(reference, _cache={}):
+    """셀 주소('AB12')의 열 번호 (1부터, 열 문자별로 캐시)"""
+    letters = reference.rstrip('0123456789')
+    col_idx = _cache.get(letters)
+    if col_idx is None:
+        col_idx = _cache[letters] = column_index_from_string(letters)
+    return col_idx
+
+
+class XlsxReader:
+    """
+    xlsx 스트리밍 읽기 (SheetReader와 같은 sheetnames/iter_rows/read_frame 제공)
+
+        with XlsxReader(path) as reader:
+            df = reader.read_frame(reader.sheetnames[0])
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._zip = zipfile.ZipFile(path)
+        try:
+            self._read_workbook()
+        except Exception:
+            self._zip.close()
+            raise
+        self._strings = None
+        self._styles = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """zip 파일 닫기"""
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+
+    def _relationships(self, part):
+        """파트의 관계 {Id: (Type, 전체 경로)}"""
+        folder, name = posixpath.split(part)
+        rels_path = posixpath.join(folder, '_rels', name + '.rels')
+        if rels_path not in self._zip.namelist():
+            return {}
+        with self._zip.open(rels_path) as source:
+            root = parse(source).getroot()
+        result = {}
+        for rel in root.iter(_REL + 'Relationship'):
+            target = rel.get('Target')
+            if target.startswith('/'):
+                path = target.lstrip('/')
+            else:
+                path = posixpath.normpath(posixpath.join(folder, target))
+            result[rel.get('Id')] = (rel.get('Type', ''), path)
+        return result
+
+    def _read_workbook(self):
+        """시트 이름 → 시트 XML 경로, 공유 문자열/스타일 경로, 날짜 기준(1900/1904)"""
+        workbook_part = 'xl/workbook.xml'
+        for rel_type, path in self._relationships('').values():
+            if rel_type.endswith('/officeDocument'):
+                workbook_part = path
+        rels = self._relationships(workbook_part)
+        self._workbook_part = workbook_part
+
+        with self._zip.open(workbook_part) as source:
+            root = parse(source).getroot()
+        self._sheet_parts = {}
+        for sheet in root.iter(_MAIN + 'sheet'):
+            self._sheet_parts[sheet.get('name')] = rels[sheet.get(_DOC_REL + 'id')][1]
+
+        properties = root.find(_MAIN + 'workbookPr')
+        date1904 = properties is not None and properties.get('date1904') in ('1', 'true')
+        self._epoch = CALENDAR_MAC_1904 if date1904 else CALENDAR_WINDOWS_1900
+
+        self._strings_part = self._styles_part = None
+        for rel_type, path in rels.values():
+            if rel_type.endswith('/sharedStrings'):
+                self._strings_part = path
+            elif rel_type.endswith('/styles'):
+                self._styles_part = path
+
+    @property
+    def sheetnames(self):
+        """시트 이름 목록"""
+        return list(self._sheet_parts)
+
+    def sheet_part(self, sheet_name):
+        """시트 XML의 zip 안 경로"""
+        return self._sheet_parts[sheet_name]
+
+    def value_parts(self, sheet_names):
+        """
+        시트 값을 읽을 때 쓰는 파트 경로 (워크북, 공유 문자열, 스타일, 시트 XML)
+
+        Args:
+            sheet_names: 시트 이름 목록 (없는 시트는 건너뜀)
+
+        Returns:
+            list: zip 안 경로 목록
+        """
+        parts = [self._workbook_part, self._strings_part, self._styles_part]
+        parts += [self._sheet_parts[name] for name in sheet_names if name in self._sheet_parts]
+        return [part for part in parts if part is not None]
+
+    def open_part(self, part):
+        """zip 안 파트를 바이너리 파일 객체로 열기"""
+        return self._zip.open(part)
+
+    @property
+    def shared_strings(self):
+        """공유 문자열 표 (처음 사용할 때 한 번만 읽음)"""
+        if self._strings is None:
+            strings = []
+            if self._strings_part is not None:
+                with self._zip.open(self._strings_part) as source:
+                    for _, element in iterparse(source):
+                        if element.tag == _STRING_ITEM:
+                            strings.append(_rich_text(element).replace('x005F_', ''))
+                            element.clear()
+            self._strings = strings
+        return self._strings
+
+    @property
+    def date_styles(self):
+        """날짜 서식 스타일 번호, 시간 간격 서식 스타일 번호 (처음 사용할 때 한 번만 읽음)"""
+        if self._styles is None:
+            date_styles, timedelta_styles = set(), set()
+            if self._styles_part is not None:
+                with self._zip.open(self._styles_part) as source:
+                    root = parse(source).getroot()
+                custom = {
+                    int(fmt.get('numFmtId')): fmt.get('formatCode')
+                    for fmt in root.iter(_MAIN + 'numFmt')
+                }
+                cell_xfs = root.find(_MAIN + 'cellXfs')
+                for style_id, xf in enumerate(cell_xfs if cell_xfs is not None else ()):
+                    fmt_id = int(xf.get('numFmtId', 0))
+                    fmt = custom.get(fmt_id) or BUILTIN_FORMATS.get(fmt_id, 'General')
+                    if is_date_format(fmt):
+                        date_styles.add(style_id)
+                    if is_timedelta_format(fmt):
+                        timedelta_styles.add(style_id)
+            self._styles = (date_styles, timedelta_styles)
+        return self._styles
+
+    def _cell_value(self, cell):
+        """<c> 요소의 값 (openpyxl values_only와 같은 형식, 공유/인라인 문자열은 _parse_rows에서 처리)"""
+        data_type = cell.get('t', 'n')
+        value = cell.findtext(_VALUE) or None
+        if value is None:
+            return None
+        if data_type == 'n':
+            value = _cast_number(value)
+            style_id = int(cell.get('s', 0))
+            date_styles, timedelta_styles = self.date_styles
+            if style_id in date_styles:
+                try:
+                    return from_excel(value, self._epoch, timedelta=style_id in timedelta_styles)
+                except (OverflowError, ValueError):
+                    return '#VALUE!'
+            return value
+        if data_type == 'b':
+            return bool(int(value))
+        if data_type == 'd':
+            return from_ISO8601(value)
+        # str(수식 문자열 결과), e(오류 값)
+        return value
+
+    def _parse_rows(self, sheet_name):
+        """
+        시트의 행을 순서대로 읽기
+
+        Yields:
+            tuple: (행 번호, [(열 번호, 값), ...]) — 값이 없는 셀도 포함, 행 번호는 1부터
+        """
+        part = self.sheet_part(sheet_name)
+        strings = self.shared_strings
+        cell_value = self._cell_value
+        row_idx = 0
+        with self._zip.open(part) as source:
+            # 셀은 행이 끝날 때 한꺼번에 처리 (가장 많은 공유/인라인 문자열은 바로 변환)
+            for _, element in iterparse(source):
+                if element.tag != _ROW:
+                    continue
+                number = element.get('r')
+                row_idx = int(number) if number else row_idx + 1
+                cells = []
+                col_idx = 0
+                for cell in element:
+                    if cell.tag != _CELL:
+                        continue
+                    reference = cell.get('r')
+                    col_idx = _column_index(reference) if reference else col_idx + 1
+                    data_type = cell.get('t')
+                    if data_type == 's':
+                        text = cell.findtext(_VALUE)
+                        value = strings[int(text)] if text else None
+                    elif data_type == 'inlineStr':
+                        value = _rich_text(cell.find(_INLINE))
+                    else:
+                        value = cell_value(cell)
+                    cells.append((col_idx, value))
+                yield row_idx, cells
+                element.clear()
+
+    def sheet_width(self, sheet_name):
+        """시트 크기(dimension)에 기록된 열 수 (없으면 None)"""
+        part = self.sheet_part(sheet_name)
+        with self._zip.open(part) as source:
+            for _, element in iterparse(source, events=('start',)):
+                if element.tag == _DIMENSION:
+                    _, _, max_col, _ = range_boundaries(element.get('ref'))
+                    return max_col
+                if element.tag == _MAIN + 'sheetData':
+                    return None
+        return None
+
+    def iter_rows(self, sheet_name):
+        """
+        시트의 행 값 튜플 (openpyxl 읽기 전용 iter_rows(values_only=True)와 같음)
+
+        중간에 빠진 행은 빈 행으로 채우고, 시트 크기에 열 수가 있으면 그 길이로 맞춘다.
+        """
+        width = self.sheet_width(sheet_name)
+        empty = (None,) * width if width else ()
+        expected = 1
+        for row_idx, cells in self._parse_rows(sheet_name):
+            while expected < row_idx:
+                yield empty
+                expected += 1
+            expected = row_idx + 1
+            row_width = width or (cells[-1][0] if cells else 0)
+            values = [None] * row_width
+            for col_idx, value in cells:
+                if col_idx <= row_width:
+                    values[col_idx - 1] = value
+            yield tuple(values)
+
+    def read_frame(self, sheet_name):
+        """
+        시트를 문자열 DataFrame으로 읽기 (SheetReader.read_frame과 같은 결과)
+
+        행 튜플을 만들지 않고 셀 값을 바로 컬럼 리스트에 넣는다.
+
+        Args:
+            sheet_name: 읽을 시트 이름
+
+        Returns:
+            DataFrame: 모든 값이 문자열인 DataFrame
+        """
+        width = self.sheet_width(sheet_name) or 0
+        headers = []
+        columns = []
+        data_rows = row_idx = 0
+        for row_idx, cells in self._parse_rows(sheet_name):
+            if row_idx == 1:
+                for col_idx, value in cells:
+                    if col_idx > len(headers):
+                        headers.extend([None] * (col_idx - len(headers)))
+                    headers[col_idx - 1] = value
+                continue
+
+            # 빠진 행까지 포함한 데이터 행 수 (값이 없는 칸은 마지막에 ''로 채움)
+            data_rows = row_idx - 1
+            for col_idx, value in cells:
+                while len(columns) < col_idx:
+                    columns.append([])
+                column = columns[col_idx - 1]
+                if len(column) < data_rows - 1:
+                    column.extend([''] * (data_rows - 1 - len(column)))
+                column.append('' if value is None else str(value))
+
+        # 행이 하나도 없으면 시트 크기와 관계없이 빈 DataFrame (openpyxl도 행을 돌려주지 않음)
+        if row_idx == 0:
+            width = 0
+        width = max(width, len(headers), len(columns))
+        headers += [None] * (width - len(headers))
+        columns += [[] for _ in range(width - len(columns))]
+        for column in columns:
+            if len(column) < data_rows:
+                column.extend([''] * (data_rows - len(column)))
+
+        # 헤더가 중복/None이어도 위치대로 컬럼 생성
+        df = pd.DataFrame(dict(enumerate(columns)), columns=range(width))
+        df.columns = headers
+        return df
@@ -0,0 +1,147 @@
+"""
+제목 생성 백엔드 계약 테스트
+
+등록된 모든 백엔드가 같은 입력에 대해 reference 백엔드와 바이트 단위로 같은 제목을 만드는지 검증한다.
+"""
+import gc
+import weakref
+
+import pandas as pd
+import pytest
+
+from title_generator import (
+    available_backends, get_backend, build_synonym_index, compact_synonym_index, iter_title_chunks
+)
+
+SYNONYMS = {
+    '브랜드': {
+        'NBA': ['엔비에이', 'N.B.A', '[S] 엔바'],
+        'adidas Originals': ['아디다스오리지널', 'ADIDAS^ORIGINALS'],
+        'nike': '나이키',
+        'NIKE ': ['중복 키는 무시'],
+    },
+    '색상': {'블랙': ['검정색', '흑색', '블랙&화이트', '']},
+    '패턴': {'무지': ['무지', '솔리드(단색)', '플레인']},
+    '소재': {'면': ['코튼 (in', '면', '폴리 혼방']},
+    '카테고리': {'맨투맨': ['맨투맨', '스웨트셔츠', '크루넥 유니섹스']},
+}
+
+ROWS = pd.DataFrame([
+    {'브랜드': 'NBA', '색상': '블랙', '패턴': '무지', '소재': '면', '카테고리': '맨투맨'},
+    {'브랜드': ' nba ', '색상': '블랙', '패턴': '', '소재': None, '카테고리': '맨투맨(오버핏)'},
+    {'브랜드': 'adidas   ORIGINALS', '색상': '', '패턴': '스트라이프', '소재': '면', '카테고리': 'out) 셔츠'},
+    {'브랜드': 'Nike', '색상': '블랙', '패턴': '무지', '소재': '폴리', '카테고리': '[A] 후드'},
+    {'브랜드': 'ＮＢＡ', '색상': '네이비, 블랙', '패턴': '무지', '소재': '면', '카테고리': '맨투맨'},
+    {'브랜드': '없는브랜드', '색상': None, '패턴': None, '소재': None, '카테고리': None},
+    {'브랜드': 'NBA', '색상': '블랙', '패턴': '무지', '소재': '면', '카테고리': '맨투맨'},
+    {'브랜드': 12345, '색상': '블랙', '패턴': '무지', '소재': '면', '카테고리': '맨투맨'},
+    # 괄호가 조각 경계를 넘는 경우 (미리 정리한 유의어 대신 원본으로 정리해야 같은 결과)
+    {'브랜드': '(in', '색상': '블랙', '패턴': '무지', '소재': '면', '카테고리': 'out)'},
+])
+
+CASES = [
+    # (선택 컬럼, 버전 수, 시드, 템플릿)
+    (['브랜드', '색상', '패턴', '소재', '카테고리'], 12, None, None),
+    (['브랜드', '카테고리'], 5, None, None),
+    (['브랜드', '색상', '패턴', '소재', '카테고리'], 6, 42, None),
+    (['브랜드', '색상', '카테고리', '소재'], 7, None, '{브랜드} {색상} {카테고리} - {소재}'),
+    (['브랜드', '색상', '카테고리'], 4, 3, '[{브랜드}] {카테고리}/{색상}'),
+]
+
+OPTIONS = {'workers': 2, 'chunk_size': 3, 'min_rows': 0}
+
+@pytest.fixture(scope='module')
+def dictionaries():
+    return {
+        'raw': SYNONYMS,
+        'index': build_synonym_index(SYNONYMS),
+        'pre_clean': build_synonym_index(SYNONYMS, pre_clean=True),
+        'compact': compact_synonym_index(build_synonym_index(SYNONYMS, pre_clean=True)),
+    }
+
+@pytest.fixture(scope='module')
+def group_index():
+    return build_synonym_index(SYNONYMS, pre_clean=True, groups=True)
+
+def test_registry():
+    """기본 백엔드가 모두 등록되어 있는지 테스트"""
+    assert {'reference', 'indexed', 'vectorized', 'parallel'} <= set(available_backends())
+    assert callable(get_backend())
+    with pytest.raises(ValueError):
+        get_backend('없는백엔드')
+
+@pytest.mark.parametrize('backend', ['indexed', 'vectorized', 'parallel'])
+@pytest.mark.parametrize('case', range(len(CASES)))
+def test_backend_matches_reference(backend, case, dictionaries):
+    """모든 백엔드가 reference와 같은 제목을 만드는지 테스트"""
+    col_selection, version_count, sample_seed, template = CASES[case]
+    rows = list(range(len(ROWS)))
+    expected = get_backend('reference')(
+        ROWS, rows, col_selection, SYNONYMS, version_count,
+        sample_seed=sample_seed, template=template
+    )
+
+    for name, synonym_dict in dictionaries.items():
+        actual = get_backend(backend)(
+            ROWS, rows, col_selection, synonym_dict, version_count,
+            sample_seed=sample_seed, template=template, **OPTIONS
+        )
+        assert actual == expected, f"{backend} ({name} 사전)"
+
+    # 행 순서를 바꾸고 일부만 선택해도 같은 결과
+    subset = [6, 2, 0, 5]
+    assert get_backend(backend)(
+        ROWS, subset, col_selection, dictionaries['pre_clean'], version_count,
+        sample_seed=sample_seed, template=template, **OPTIONS
+    ) == [expected[row] for row in subset]
+
+@pytest.mark.parametrize('backend', ['vectorized', 'parallel'])
+def test_group_index_matches_reference(backend, group_index):
+    """그룹 역색인도 모든 백엔드에서 같은 제목을 만드는지 테스트 (reference는 색인 그대로 사용)"""
+    # 원본 대신 유의어가 들어 있는 행 추가
+    frame = pd.concat([ROWS, pd.DataFrame([
+        {'브랜드': 'n.b.a', '색상': '흑색', '패턴': '플레인', '소재': '폴리 혼방', '카테고리': '스웨트셔츠'},
+    ])], ignore_index=True)
+    col_selection = ['브랜드', '색상', '패턴', '소재', '카테고리']
+    rows = list(range(len(frame)))
+    expected = get_backend('reference')(frame, rows, col_selection, group_index, 6)
+    assert get_backend(backend)(frame, rows, col_selection, group_index, 6, **OPTIONS) == expected
+    assert expected[-1][0].startswith('엔비에이 검정색 ')
+
+@pytest.mark.parametrize('backend', ['reference', 'vectorized', 'parallel', 'free_text'])
+def test_iter_title_chunks(backend, dictionaries):
+    """청크 단위 결과를 이으면 백엔드를 한 번 호출한 결과와 같은지 테스트"""
+    frame = ROWS.assign(상품명=ROWS['브랜드'].astype(str) + ' 블랙 맨투맨')
+    col_selection, version_count, sample_seed, template = CASES[2]
+    rows = [6, 2, 0, 5, 8, 1, 3]
+    options = dict(sample_seed=sample_seed, template=template, **OPTIONS)
+    expected = get_backend(backend)(
+        frame, rows, col_selection, dictionaries['pre_clean'], version_count, **options
+    )
+
+    chunks = list(iter_title_chunks(
+        backend, frame, rows, col_selection, dictionaries['pre_clean'], version_count, **options
+    ))
+    assert [chunk_rows for chunk_rows, _ in chunks] == [rows[:3], rows[3:6], rows[6:]]
+    assert [titles for _, chunk in chunks for titles in chunk] == expected
+
+def test_backends_do_not_keep_dictionaries():
+    """백엔드가 원본 사전의 제자리 수정을 반영하고 색인을 붙잡아 두지 않는지 테스트"""
+    frame = pd.DataFrame([{'색상': '화이트', '상품명': '화이트 맨투맨'}])
+    colors = {'블랙': ['BLACK'], '네이비': ['NAVY']}
+    synonyms = {'색상': colors}
+    assert get_backend('indexed')(frame, [0], ['색상'], synonyms, 1) == [['화이트']]
+    assert get_backend('free_text')(frame, [0], ['색상'], synonyms, 1) == [['화이트 맨투맨']]
+
+    # 항목 수가 같게 키를 바꿔도 새 사전 기준
+    del colors['네이비']
+    colors['화이트'] = ['WHITE']
+    assert get_backend('indexed')(frame, [0], ['색상'], synonyms, 1) == [['WHITE']]
+    assert get_backend('free_text')(frame, [0], ['색상'], synonyms, 1) == [['WHITE 맨투맨']]
+
+    index = build_synonym_index(synonyms)
+    assert get_backend('free_text')(frame, [0], ['색상'], index, 1) == [['WHITE 맨투맨']]
+    index_ref = weakref.ref(index)
+    del index
+    gc.collect()
+    assert index_ref() is None
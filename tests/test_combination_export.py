@@ -0,0 +1,102 @@
+"""
+전체 조합 생성 및 내보내기 테스트
+"""
+import csv
+import json
+import os
+
+import pandas as pd
+
+from title_generator import (
+    create_title_combination, iter_title_combinations, export_title_combinations
+)
+from title_generator.version_calc import calculate_version_indices, iter_version_indices
+
+TEST_SYNONYMS = {
+    '브랜드': {'NBA': ['엔비에이', 'N.B.A', '엔바']},
+    '색상': {'블랙': ['검정색', '흑색']},
+    '카테고리': {'맨투맨': ['맨투맨', '스웨트셔츠', '크루넥', '무지 티']}
+}
+COL_SELECTION = ['브랜드', '색상', '카테고리']
+
+def test_iter_version_indices_matches_decoding():
+    """순차 생성 결과가 인덱스 분해 결과와 같은지 테스트"""
+    ordered_lists = [['a', 'b', 'c'], ['x'], ['1', '2'], ['p', 'q', 'r', 's']]
+
+    result = [(idx, list(indices)) for idx, indices in iter_version_indices(ordered_lists)]
+
+    assert len(result) == 24
+    for idx, indices in result:
+        assert indices == calculate_version_indices(ordered_lists, idx)[0]
+
+def test_iter_version_indices_slices():
+    """offset/cap 구간을 이어 붙이면 전체와 같은지 테스트"""
+    ordered_lists = [['a', 'b', 'c'], ['1', '2'], ['p', 'q', 'r', 's']]
+    full = [(idx, list(indices)) for idx, indices in iter_version_indices(ordered_lists)]
+
+    sliced = []
+    for offset in range(0, 30, 5):
+        sliced += [(idx, list(indices)) for idx, indices in iter_version_indices(ordered_lists, offset, 5)]
+
+    assert sliced == full
+    assert list(iter_version_indices(ordered_lists, 24)) == []
+    assert [(idx, list(i)) for idx, i in iter_version_indices([])] == [(0, [])]
+
+def test_iter_title_combinations():
+    """전체 조합 제목이 버전별 생성 결과와 같은지 테스트"""
+    row = pd.Series({'브랜드': 'NBA', '색상': '블랙', '패턴': '스트라이프', '카테고리': '맨투맨'})
+
+    titles = list(iter_title_combinations(row, COL_SELECTION, TEST_SYNONYMS))
+
+    assert [idx for idx, _ in titles] == list(range(24))
+    for idx, title in titles:
+        assert title == create_title_combination(row, COL_SELECTION, TEST_SYNONYMS, idx)[0]
+
+    assert list(iter_title_combinations(row, COL_SELECTION, TEST_SYNONYMS, 22, 10)) == titles[22:]
+
+def test_export_csv_and_resume():
+    """CSV 내보내기 및 구간별 이어쓰기 테스트"""
+    test_file = "test_combinations.csv"
+    rows = [(0, {'브랜드': 'NBA', '색상': '블랙'}), (1, {'브랜드': '없는브랜드'})]
+
+    try:
+        assert export_title_combinations(rows, COL_SELECTION, TEST_SYNONYMS, test_file, cap=4) == 5
+        assert export_title_combinations(
+            rows, COL_SELECTION, TEST_SYNONYMS, test_file, offset=4, cap=4, append=True
+        ) == 2
+
+        with open(test_file, encoding='utf-8', newline='') as f:
+            records = list(csv.reader(f))
+
+        assert records[0] == ['row', 'combination', 'title']
+        assert records[1:] == [
+            ['0', '0', '엔비에이 검정색'],
+            ['0', '1', 'N.B.A 검정색'],
+            ['0', '2', '엔바 검정색'],
+            ['0', '3', '엔비에이 흑색'],
+            ['1', '0', '없는브랜드'],
+            ['0', '4', 'N.B.A 흑색'],
+            ['0', '5', '엔바 흑색'],
+        ]
+    finally:
+        if os.path.exists(test_file):
+            os.remove(test_file)
+
+def test_export_jsonl():
+    """JSONL 내보내기 테스트"""
+    test_file = "test_combinations.jsonl"
+    df = pd.DataFrame({'브랜드': ['NBA'], '색상': ['블랙'], '카테고리': ['맨투맨']})
+
+    try:
+        written = export_title_combinations(df.iterrows(), COL_SELECTION, TEST_SYNONYMS, test_file)
+        assert written == 24
+
+        with open(test_file, encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+
+        assert len(records) == 24
+        assert records[0] == {'row': 0, 'combination': 0, 'title': '엔비에이 검정색 맨투맨'}
+        assert records[-1]['title'] == '엔바 흑색 티'  # "무지"는 정리됨
+    finally:
+        if os.path.exists(test_file):
+            os.remove(test_file)
@@ -0,0 +1,153 @@
+"""
+압축 유의어 색인 테스트
+"""
+import gc
+import pickle
+import weakref
+
+import pandas as pd
+
+from title_generator import (
+    build_synonym_index, compact_synonym_index, CompactSynonymIndex, StringTable, SynonymIds,
+    create_title_combinations, generate_title_matrix
+)
+from title_generator.synonym_index import (
+    PrecleanedSynonyms, CleanedSynonyms, is_precleaned, raw_synonyms
+)
+from title_generator.synonym_matcher import find_synonyms
+from title_generator.parallel import _dispatch_dictionary
+
+TEST_SYNONYMS = {
+    '브랜드': {
+        'NBA': ['엔비에이', 'N.B.A', '[S] 엔바'],
+        'Nike': ['나이키', 'NIKE'],
+        'NIKE ': ['중복 키는 무시'],
+    },
+    '색상': {
+        '블랙': ['검정색', '흑색', '블랙'],
+        '검정': ['블랙', '검정색'],
+        '네이비': ['곤색', '네이비', '']
+    },
+    '카테고리': {'맨투맨': ['맨투맨', '스웨트셔츠', '나이키']},
+}
+
+VALUES = ['nba', ' NIKE ', '블랙', '흑색', '검정', '곤색', '네이비', '맨투맨', '스웨트셔츠', '없는값', '']
+
+def test_string_table():
+    """문자열 표 테스트"""
+    table = StringTable(['블랙', '흑색', '블랙'])
+
+    assert len(table) == 2
+    assert table.intern('흑색') == 1
+    assert table.intern_all(['블랙', '곤색']) == (0, 2)
+    assert table.get_id('없는값') is None
+    assert table.decode([2, 0]) == ('곤색', '블랙')
+
+    restored = pickle.loads(pickle.dumps(table))
+    assert restored.strings == table.strings
+    assert restored.get_id('곤색') == 2
+
+def test_lookup_matches_index():
+    """압축 색인의 조회 결과가 SynonymIndex와 같은지 테스트"""
+    for options in ({}, {'pre_clean': True}, {'groups': True}, {'pre_clean': True, 'groups': True}):
+        index = build_synonym_index(TEST_SYNONYMS, **options)
+        compact = compact_synonym_index(index)
+
+        assert isinstance(compact, CompactSynonymIndex)
+        assert compact.revision == index.revision
+        assert compact.grouped == index.grouped
+        for category in index:
+            assert compact[category].items() == list(index[category].items())
+            for value in VALUES:
+                expected = index[category].lookup(value)
+                actual = compact[category].lookup(value)
+                assert actual == expected
+                assert type(actual) is type(expected)
+                assert getattr(actual, 'raw', None) == getattr(expected, 'raw', None)
+                assert compact[category].group_id(value) == index[category].group_id(value)
+
+                # 제목 엔진은 같은 내용의 ID 목록을 받음
+                ids = find_synonyms(value, compact[category])
+                assert isinstance(ids, SynonymIds) == bool(expected)
+                assert tuple(ids) == expected
+                assert tuple(raw_synonyms(ids)) == tuple(raw_synonyms(expected))
+                assert is_precleaned(ids) == is_precleaned(expected)
+
+    pre = compact_synonym_index(build_synonym_index(TEST_SYNONYMS, pre_clean=True))
+    assert isinstance(pre['색상'].lookup('블랙'), PrecleanedSynonyms)
+    assert type(pre['브랜드'].lookup('nba')) is CleanedSynonyms
+    assert pre['브랜드'].lookup('nba').raw == ('엔비에이', 'N.B.A', '[S] 엔바')
+
+def test_engine_uses_ids():
+    """제목 엔진이 유의어 튜플을 만들지 않고 ID 목록으로 같은 제목을 만드는지 테스트"""
+    index = build_synonym_index(TEST_SYNONYMS, pre_clean=True, groups=True)
+    compact = compact_synonym_index(index)
+    df = pd.DataFrame([
+        {'브랜드': 'nba', '색상': '흑색', '카테고리': '맨투맨'},
+        {'브랜드': 'Nike', '색상': '네이비', '카테고리': '스웨트셔츠'},
+    ])
+    col_selection = ['브랜드', '색상', '카테고리']
+
+    expected = generate_title_matrix(df, range(len(df)), col_selection, index, 8)
+    assert generate_title_matrix(df, range(len(df)), col_selection, compact, 8) == expected
+    assert [
+        create_title_combinations(df.iloc[row], col_selection, compact, 8)[0]
+        for row in range(len(df))
+    ] == expected
+    # 조회한 목록을 문자열 튜플로 변환해 두지 않음
+    assert all(not category._decoded for category in compact.values())
+
+    # 조회 결과는 배열을 복사하지 않은 ID 구간
+    ids = find_synonyms('검정', compact['색상'])
+    assert isinstance(ids.ids, memoryview)
+    assert [compact.table[string_id] for string_id in ids.ids] == ['블랙', '검정색']
+
+def test_shared_strings_and_pickle():
+    """문자열은 한 번만 보관하고 피클이 작은지 테스트"""
+    index = build_synonym_index(TEST_SYNONYMS, pre_clean=True, groups=True)
+    compact = compact_synonym_index(index)
+
+    # 여러 항목/카테고리에 나오는 문자열도 하나의 ID
+    assert compact.table.strings.count('블랙') == 1
+    assert compact.table.strings.count('나이키') == 1
+    # 같은 색인은 다시 압축하지 않음
+    assert compact_synonym_index(index) is compact
+    assert compact_synonym_index(compact) is compact
+
+    restored = pickle.loads(pickle.dumps(compact))
+    assert restored.clean_report is None and restored.source is None
+    assert restored['색상'].lookup('흑색') == compact['색상'].lookup('흑색')
+
+    # 병렬 생성은 색인을 압축해서 작업 프로세스로 전달
+    assert _dispatch_dictionary(index) is compact
+    assert _dispatch_dictionary(TEST_SYNONYMS) is TEST_SYNONYMS
+
+def test_compacting_does_not_keep_index_alive():
+    """압축 후 원래 색인과 원본 사전을 붙잡아 두지 않는지 테스트"""
+    source = {category: dict(entries) for category, entries in TEST_SYNONYMS.items()}
+    index = build_synonym_index(source, pre_clean=True, groups=True)
+    compact = compact_synonym_index(index)
+    assert compact.source is None
+
+    # 원본 사전은 색인의 source로만 남아 있으므로 색인이 사라지면 함께 사라짐
+    index_ref = weakref.ref(index)
+    del index, source
+    gc.collect()
+    assert index_ref() is None
+    # 압축 색인은 그대로 사용
+    assert compact['색상'].lookup('검정') == ('블랙', '검정색')
+
+def test_pickle_size():
+    """중복 문자열이 많은 큰 사전의 피클 크기 테스트"""
+    synonyms = {
+        category: {
+            f"{category}{i}": [f"{category}{i}", '블랙 컬러', '검정색', f"변형{i % 50}"]
+            for i in range(2000)
+        }
+        for category in ('색상', '패턴', '소재')
+    }
+    index = build_synonym_index(synonyms, pre_clean=True, groups=True)
+    compact = compact_synonym_index(index)
+
+    assert len(pickle.dumps(compact)) * 3 < len(pickle.dumps(index))
+    assert pickle.loads(pickle.dumps(compact))['소재'].lookup('소재7') == index['소재'].lookup('소재7')
@@ -0,0 +1,59 @@
+"""
+실행 단위 진단/로깅 테스트
+"""
+import logging
+
+import pandas as pd
+
+from title_generator import create_title_combination, collect_column_stats, build_synonym_index
+
+TEST_SYNONYMS = {
+    '브랜드': {'NBA': ['엔비에이', 'N.B.A']},
+    '패턴': {'무지': ['솔리드']}
+}
+COL_SELECTION = ['브랜드', '색상', '패턴', '소재', '카테고리']
+
+def test_collect_column_stats():
+    """컬럼별 빈 값/유의어 미일치 행 수 집계 테스트"""
+    df = pd.DataFrame([
+        {'브랜드': 'NBA', '색상': '블랙', '패턴': '무지', '카테고리': '맨투맨'},
+        {'브랜드': ' nba ', '색상': '', '패턴': None, '카테고리': '맨투맨'},
+        {'브랜드': '없는브랜드', '색상': '  ', '패턴': '스트라이프', '카테고리': '맨투맨'},
+        {'브랜드': '없는브랜드', '색상': '블랙', '패턴': '', '카테고리': '셔츠'},
+    ])
+
+    for synonyms in [TEST_SYNONYMS, build_synonym_index(TEST_SYNONYMS)]:
+        stats = collect_column_stats(df, [0, 1, 2, 3], COL_SELECTION, synonyms)
+
+        assert stats.rows == 4
+        assert stats.empty == {'브랜드': 0, '색상': 2, '패턴': 2, '소재': 4, '카테고리': 0}
+        # 선택된 유의어 컬럼만 미일치 집계 (' nba '는 일치)
+        assert stats.unmatched == {'브랜드': 2, '패턴': 1}
+
+    stats = collect_column_stats(df, [0], COL_SELECTION, TEST_SYNONYMS)
+    assert stats.lines() == ['빈 소재: 1행']
+
+def test_report_once_per_run(caplog):
+    """집계 결과가 한 번만 보고되는지 테스트"""
+    df = pd.DataFrame([{'브랜드': 'NBA', '패턴': ''} for _ in range(1000)])
+    messages = []
+
+    with caplog.at_level(logging.INFO, logger='title_generator'):
+        collect_column_stats(df, range(1000), COL_SELECTION, TEST_SYNONYMS).report(messages.append)
+
+    assert len(messages) == 1
+    assert '빈 패턴: 1,000행' in messages[0]
+    assert [record.getMessage() for record in caplog.records] == messages
+
+def test_no_output_when_debug_disabled(capsys, caplog):
+    """기본 설정에서 행 처리 중 아무것도 출력하지 않는지 테스트"""
+    row = {'브랜드': 'NBA', '색상': '', '카테고리': '맨투맨'}
+
+    with caplog.at_level(logging.INFO, logger='title_generator'):
+        create_title_combination(row, ['브랜드'], TEST_SYNONYMS, 0)
+    assert capsys.readouterr().out == ''
+    assert caplog.records == []
+
+    with caplog.at_level(logging.DEBUG, logger='title_generator'):
+        create_title_combination(row, ['브랜드'], TEST_SYNONYMS, 0)
+    assert any('processed_data' in record.getMessage() for record in caplog.records)
@@ -0,0 +1,157 @@
+"""
+엑셀 읽기 테스트
+"""
+import datetime
+import os
+import zipfile
+
+import openpyxl
+import pytest
+
+from excel_io import SheetReader, open_workbook, read_sheet_frame
+from synonyms_manager import load_synonym_dict_from_sheets
+from xlsx_reader import XlsxReader
+
+def legacy_read(path, sheet_name):
+    """기존 방식 (수식 보존 워크북에서 헤더, 값만 워크북에서 데이터를 읽음)"""
+    wb = openpyxl.load_workbook(path)
+    wb_values = openpyxl.load_workbook(path, data_only=True)
+    try:
+        headers = [cell.value for cell in wb[sheet_name][1]]
+        data = [
+            [str(cell.value) if cell.value is not None else '' for cell in row]
+            for row in wb_values[sheet_name].iter_rows(min_row=2)
+        ]
+        return headers, data
+    finally:
+        wb.close()
+        wb_values.close()
+
+def test_read_sheet_frame():
+    """읽기 전용 한 번 읽기가 기존 방식과 같은 DataFrame인지 테스트"""
+    test_file = "test_excel_io.xlsx"
+    try:
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = '상품'
+        ws.append(['상품코드', '브랜드', '색상', '상품명'])
+        ws.append(['P001', 'NBA', '블랙', 'NBA 블랙'])
+        ws.append([1002, None, '네이비', '=B3&C3'])
+        ws.append(['P003', 'Nike', None, None, '헤더 밖 값'])
+        other = wb.create_sheet('유의어')
+        other.append(['검정', '블랙'])
+        wb.save(test_file)
+
+        df, sheet_name = read_sheet_frame(test_file)
+        assert sheet_name == '상품'
+        headers, data = legacy_read(test_file, '상품')
+        assert list(df.columns) == headers == ['상품코드', '브랜드', '색상', '상품명', None]
+        assert df.values.tolist() == data
+        # 숫자는 문자열로, 빈 셀과 계산 값이 저장되지 않은 수식은 ''
+        assert df.values.tolist()[1] == ['1002', '', '네이비', '', '']
+
+        # 시트 목록 확인 후 같은 워크북에서 다른 시트 읽기
+        with SheetReader(test_file) as reader:
+            assert reader.sheetnames == ['상품', '유의어']
+            synonyms = reader.read_frame('유의어')
+        assert list(synonyms.columns) == ['검정', '블랙']
+        assert synonyms.empty
+
+    finally:
+        if os.path.exists(test_file):
+            os.remove(test_file)
+
+def make_workbook(path):
+    """여러 값 형식(날짜/불리언/수식/빈 행/헤더 밖 값)이 있는 상품 시트와 유의어 시트"""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = '상품'
+    ws.append(['상품코드', '브랜드', None, '상품명'])
+    ws.append([1, 2.5, True, '=A2+B2'])
+    ws.append([datetime.datetime(2024, 1, 2, 3, 4), 'NBA', None, None, '헤더 밖 값'])
+    ws['B6'] = '빈 행 다음'
+    ws['C7'] = datetime.time(3, 4)
+    ws['A8'] = 1e-5
+    synonyms = wb.create_sheet('색상')
+    synonyms.append(['원본', '유의어1', '유의어2', '유의어3', 'GPT 유의어'])
+    synonyms.append(['검정, 블랙', '흑색', None, 7, '차콜블랙, 흑색'])
+    synonyms.append([None, '무시'])
+    synonyms.append(['네이비', 'NAVY'])
+    wb.save(path)
+
+# 직접 만든 xlsx (시트 크기/셀 주소 없음, 인라인 문자열, 서식 문자열, 저장된 수식 값, 1904 날짜 기준)
+RAW_PARTS = {
+    '[Content_Types].xml': '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/sharedStrings.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+        '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        '</Types>',
+    '_rels/.rels': '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>',
+    'xl/workbook.xml': '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<workbookPr date1904="1"/><sheets><sheet name="상품" sheetId="1" r:id="rId1"/></sheets></workbook>',
+    'xl/_rels/workbook.xml.rels': '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="/xl/worksheets/sheet1.xml"/>'
+        '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" Target="sharedStrings.xml"/>'
+        '<Relationship Id="rId3" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+        '</Relationships>',
+    'xl/sharedStrings.xml': '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<si><t>상품코드</t></si>'
+        '<si><r><t>NB</t></r><r><rPr><b/></rPr><t>A</t></r><rPh sb="0" eb="3"><t>엔비에이</t></rPh></si>'
+        '<si><t xml:space="preserve"> 블랙 </t></si>'
+        '</sst>',
+    'xl/styles.xml': '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<numFmts count="1"><numFmt numFmtId="164" formatCode="yyyy-mm-dd"/></numFmts>'
+        '<cellXfs count="2"><xf numFmtId="0"/><xf numFmtId="164"/></cellXfs></styleSheet>',
+    'xl/worksheets/sheet1.xml': '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+        '<row><c t="s"><v>0</v></c><c t="inlineStr"><is><t>브랜드</t></is></c></row>'
+        '<row><c t="s"><v>1</v></c><c t="s"><v>2</v></c><c t="str"><f>A2&amp;B2</f><v>NBA 블랙 </v></c></row>'
+        '<row r="4"><c r="B4" s="1"><v>100</v></c><c r="D4" t="b"><v>0</v></c><c r="E4" t="e"><v>#N/A</v></c></row>'
+        '</sheetData></worksheet>',
+}
+
+# 직접 만든 스타일에는 기본 셀 스타일이 없어 openpyxl이 경고함
+@pytest.mark.filterwarnings('ignore:Workbook contains no default style')
+def test_xml_engine_matches_openpyxl():
+    """xml 엔진이 openpyxl 읽기 전용 모드와 같은 값을 읽는지 테스트"""
+    test_file = "test_xml_engine.xlsx"
+    raw_file = "test_xml_engine_raw.xlsx"
+    try:
+        make_workbook(test_file)
+        with zipfile.ZipFile(raw_file, 'w') as archive:
+            for name, xml in RAW_PARTS.items():
+                archive.writestr(name, xml)
+
+        for path in (test_file, raw_file):
+            with SheetReader(path) as expected, XlsxReader(path) as reader:
+                assert reader.sheetnames == expected.sheetnames
+                for sheet_name in expected.sheetnames:
+                    assert list(reader.iter_rows(sheet_name)) == [tuple(row) for row in expected.iter_rows(sheet_name)]
+                    df, expected_df = reader.read_frame(sheet_name), expected.read_frame(sheet_name)
+                    assert list(df.columns) == list(expected_df.columns)
+                    assert df.equals(expected_df)
+
+        df, _ = read_sheet_frame(raw_file, engine='xml')
+        assert df.values.tolist() == [
+            ['NBA', ' 블랙 ', 'NBA 블랙 ', '', ''],
+            ['', '', '', '', ''],
+            ['', '1904-04-10 00:00:00', '', 'False', '#N/A'],
+        ]
+
+        # 유의어 사전도 엔진과 관계없이 같음
+        expected = load_synonym_dict_from_sheets(test_file, engine='openpyxl')
+        assert expected['색상'] == {'검정': ['블랙', '흑색', '7', '차콜블랙'], '네이비': ['NAVY']}
+        assert load_synonym_dict_from_sheets(test_file, engine='xml') == expected
+
+        with pytest.raises(ValueError):
+            open_workbook(test_file, engine='없는엔진')
+
+    finally:
+        for path in (test_file, raw_file):
+            if os.path.exists(path):
+                os.remove(path)
@@ -0,0 +1,123 @@
+"""
+상품 시트 DataFrame 인코딩 테스트
+"""
+import pandas as pd
+import pytest
+
+from frame_encoding import encode_frame, ensure_writable, frame_memory, format_memory, ARROW_STRING
+from title_generator import (
+    generate_title_matrix, collect_column_stats, build_synonym_index, get_backend, PipelineStats
+)
+
+TEST_SYNONYMS = {
+    '브랜드': {'NBA': ['엔비에이', 'N.B.A'], 'Nike': ['나이키', 'NIKE']},
+    '색상': {'블랙': ['검정색', '흑색']},
+    '카테고리': {'맨투맨': ['맨투맨', '스웨트셔츠']},
+}
+COL_SELECTION = ['브랜드', '색상', '패턴', '소재', '카테고리']
+
+def make_frame(repeat=1):
+    """엑셀에서 읽은 것과 같은 문자열 DataFrame"""
+    rows = [
+        ['P001', 'NBA', '블랙', '무지', '', '맨투맨', 'NBA 블랙 맨투맨', ''],
+        ['P002', ' nba ', '블랙', '', '면', '맨투맨', 'NBA 맨투맨', ''],
+        ['P003', 'Nike', '네이비', '[S] 체크', '면', '셔츠', '나이키 셔츠', ''],
+        ['P004', '없는브랜드', '', '무지', '', '맨투맨(in&out)', '', ''],
+    ] * repeat
+    return pd.DataFrame(rows, columns=['상품코드', '브랜드', '색상', '패턴', '소재', '카테고리', '상품명', '상품명_1'])
+
+def test_encode_frame():
+    """속성 컬럼 카테고리형 변환 테스트"""
+    df = make_frame()
+    encoded = encode_frame(df)
+
+    for column in COL_SELECTION:
+        assert isinstance(encoded[column].dtype, pd.CategoricalDtype)
+    expected_text = object if ARROW_STRING is None else ARROW_STRING
+    assert encoded['상품명'].dtype == expected_text
+    # 값과 원본은 그대로
+    assert encoded.astype(object).equals(df)
+    assert df['브랜드'].dtype == object
+
+    # 제목 열에는 새 값을 쓸 수 있음
+    encoded.loc[2, '상품명_1'] = '새 제목'
+    assert encoded.loc[2, '상품명_1'] == '새 제목'
+
+def test_memory_report():
+    """반복이 많은 시트의 메모리 절감 테스트"""
+    df = make_frame(repeat=500)
+    before, after = frame_memory(df), frame_memory(encode_frame(df))
+
+    assert after * 2 < before
+    assert format_memory(4 * 2**20, 2**20) == "메모리 사용량: 4.0MB → 1.0MB (4.0배 절감)"
+
+def test_titles_and_stats_unchanged():
+    """카테고리 코드로 생성해도 제목과 진단 결과가 같은지 테스트"""
+    df = make_frame(repeat=3)
+    encoded = encode_frame(df)
+    # 일부 행만 선택 (쓰이지 않는 카테고리 포함)
+    rows = [4, 0, 5, 6, 11]
+
+    for synonyms in (TEST_SYNONYMS, build_synonym_index(TEST_SYNONYMS, pre_clean=True)):
+        for template in (None, '{브랜드} {색상} {카테고리} - {소재}'):
+            expected = generate_title_matrix(df, rows, COL_SELECTION, synonyms, 5, template=template)
+            assert generate_title_matrix(
+                encoded, rows, COL_SELECTION, synonyms, 5, template=template
+            ) == expected
+
+        expected_stats = collect_column_stats(df, rows, COL_SELECTION, synonyms)
+        actual_stats = collect_column_stats(encoded, rows, COL_SELECTION, synonyms)
+        assert actual_stats.empty == expected_stats.empty
+        assert actual_stats.unmatched == expected_stats.unmatched
+
+def test_unused_categories_not_matched():
+    """선택한 행에 없는 카테고리 값은 유의어를 찾지 않는지 테스트"""
+    df = make_frame(repeat=3)
+    encoded = encode_frame(df)
+    rows = [0, 4]  # P001, P001 - 브랜드/카테고리 값이 하나씩
+
+    plain, categorical = PipelineStats(), PipelineStats()
+    expected = generate_title_matrix(df, rows, COL_SELECTION, TEST_SYNONYMS, 3, stats=plain)
+    assert generate_title_matrix(
+        encoded, rows, COL_SELECTION, TEST_SYNONYMS, 3, stats=categorical
+    ) == expected
+    assert categorical.stages['find_synonyms'][1] == plain.stages['find_synonyms'][1]
+
+def test_title_columns_writable():
+    """카테고리형 컬럼도 제목 열로 쓸 수 있는지 테스트"""
+    df = make_frame()
+    encoded = encode_frame(df, category_columns=COL_SELECTION + ['상품명_1'])
+    assert not isinstance(encoded['상품명_1'].dtype, pd.CategoricalDtype)
+
+    # 속성 컬럼 자리가 상품명_N이 된 경우
+    encoded = encoded.rename(columns={'소재': '상품명_2'})
+    col = encoded.columns.get_loc('상품명_2')
+    ensure_writable(encoded, col)
+    assert encoded['상품명_2'].dtype == object
+    encoded.iloc[[0, 2], col] = ['제목 A', '제목 B']
+    assert encoded['상품명_2'].tolist() == ['제목 A', '면', '제목 B', '']
+    # 다른 컬럼은 그대로
+    assert isinstance(encoded['브랜드'].dtype, pd.CategoricalDtype)
+
+def test_arrow_text_columns():
+    """pyarrow가 있으면 텍스트 컬럼을 Arrow 문자열로 바꾸고 결과는 같은지 테스트"""
+    pytest.importorskip('pyarrow')
+    df = make_frame(repeat=50)
+    encoded = encode_frame(df, text_dtype=pd.StringDtype('pyarrow'))
+
+    for column in ['상품코드', '상품명', '상품명_1']:
+        assert encoded[column].dtype == pd.StringDtype('pyarrow')
+    assert isinstance(encoded['브랜드'].dtype, pd.CategoricalDtype)
+    assert encoded.astype(object).equals(df)
+    assert frame_memory(encoded) < frame_memory(encode_frame(df, text_dtype=None))
+
+    # 상품명 컬럼을 읽는 free_text 백엔드도 같은 결과
+    rows = [0, 2, 3, 6]
+    free_text = get_backend('free_text')
+    assert free_text(encoded, rows, COL_SELECTION, TEST_SYNONYMS, 3) == \
+        free_text(df, rows, COL_SELECTION, TEST_SYNONYMS, 3)
+
+    # 제목 열에 여러 행을 한 번에 쓸 수 있음
+    col = encoded.columns.get_loc('상품명_1')
+    encoded.iloc[rows, col] = ['제목 A', '제목 B', '', '제목 D']
+    assert encoded['상품명_1'].iloc[rows].tolist() == ['제목 A', '제목 B', '', '제목 D']
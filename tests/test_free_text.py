@@ -0,0 +1,85 @@
+"""
+자유 텍스트 유의어 치환 테스트
+"""
+import re
+
+import pandas as pd
+
+from title_generator import FreeTextReplacer, build_synonym_index, get_backend
+
+TEST_SYNONYMS = {
+    '브랜드': {'NIKE': ['나이키'], 'adidas Originals': ['아디다스오리지널']},
+    '색상': {'검정': ['블랙', '흑색'], '검정색': ['블랙컬러']},
+    '카테고리': {'맨투맨': ['스웨트셔츠', '크루넥'], '티': ['티셔츠']},
+}
+
+def legacy_replace(text, entries):
+    """test/step2_replace의 항목별 정규식 치환 (첫 번째 유의어)"""
+    for original_word, syn_list in entries.items():
+        text = re.sub(r'\b' + re.escape(original_word) + r'\b', syn_list[0], text)
+    return text
+
+def test_leftmost_longest():
+    """겹치는 일치 중 가장 왼쪽·가장 긴 단어 선택 테스트"""
+    replacer = FreeTextReplacer.from_synonym_dict(TEST_SYNONYMS)
+
+    assert replacer.replace('검정색 맨투맨') == '블랙컬러 스웨트셔츠'
+    assert replacer.replace('검정 맨투맨', 1) == '흑색 스웨트셔츠'
+    # 여러 단어로 된 원본은 공백 수/대소문자/전각 문자와 관계없이 일치
+    assert replacer.replace('ＡＤＩＤＡＳ   originals 티') == '아디다스오리지널 티셔츠'
+
+def test_hangul_boundaries():
+    """한글 단어 경계 테스트"""
+    replacer = FreeTextReplacer.from_synonym_dict(TEST_SYNONYMS)
+
+    # 한글 단어 안의 일부는 치환하지 않음
+    assert replacer.replace('검정티셔츠') == '검정티셔츠'
+    assert replacer.replace('맨투맨티') == '맨투맨티'
+    # 글자 종류가 바뀌는 곳은 경계 (\b로는 일치하지 않던 경우)
+    assert replacer.replace('NIKE맨투맨') == '나이키스웨트셔츠'
+    assert legacy_replace('NIKE맨투맨', {'NIKE': ['나이키']}) == 'NIKE맨투맨'
+    assert replacer.replace('[NIKE]검정/티') == '[나이키]블랙/티셔츠'
+    # 영문 단어 안의 일부는 치환하지 않음 (한글 뒤 숫자는 경계)
+    assert replacer.replace('NIKES 검정이') == 'NIKES 검정이'
+    assert replacer.replace('검정2XL') == '블랙2XL'
+
+def test_matches_legacy_on_spaced_words():
+    """공백으로 구분된 상품명은 기존 정규식 치환과 같은 결과인지 테스트"""
+    entries = {'NIKE': ['나이키'], '검정': ['블랙'], '맨투맨': ['스웨트셔츠']}
+    replacer = FreeTextReplacer(entries)
+
+    for text in ['NIKE 검정 맨투맨', '검정 NIKE', '없는 단어', '맨투맨, 검정 (NIKE)']:
+        assert replacer.replace(text) == legacy_replace(text, entries)
+
+def test_versions_and_repeated_words():
+    """버전별 유의어 선택과 반복 단어 테스트"""
+    replacer = FreeTextReplacer.from_synonym_dict(TEST_SYNONYMS)
+
+    titles, total = replacer.title_combinations('검정 맨투맨 검정', 5)
+    # 같은 단어는 같은 유의어 자리 (2 × 2 조합)
+    assert total == 4
+    assert titles == [
+        '블랙 스웨트셔츠 블랙', '흑색 스웨트셔츠 흑색',
+        '블랙 크루넥 블랙', '흑색 크루넥 흑색', '블랙 스웨트셔츠 블랙'
+    ]
+
+    sampled, _ = replacer.title_combinations('검정 맨투맨', 4, sample_seed=0)
+    assert sorted(sampled) == sorted(title.rsplit(' ', 1)[0] for title in titles[:4])
+    assert replacer.title_combinations('검정 맨투맨', 4, sample_seed=0)[0] == sampled
+
+def test_free_text_backend():
+    """free_text 백엔드 테스트 (상품명 컬럼만 있는 시트)"""
+    df = pd.DataFrame({'상품명': ['[S] NIKE 검정 맨투맨', None, '검정 티', '[S] NIKE 검정 맨투맨']})
+    backend = get_backend('free_text')
+
+    titles = backend(df, [3, 1, 2], ['색상', '카테고리'], TEST_SYNONYMS, 2)
+    assert titles == [
+        ['NIKE 블랙 스웨트셔츠', 'NIKE 흑색 스웨트셔츠'],
+        ['', ''],
+        ['블랙 티셔츠', '흑색 티셔츠'],
+    ]
+
+    # 컴파일된 색인(미리 정리 포함)도 같은 결과
+    for synonym_dict in (build_synonym_index(TEST_SYNONYMS),
+                         build_synonym_index(TEST_SYNONYMS, pre_clean=True)):
+        assert backend(df, [3, 1, 2], ['색상', '카테고리'], synonym_dict, 2) == titles
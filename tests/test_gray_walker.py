@@ -0,0 +1,66 @@
+"""
+그레이 코드 순서 제목 생성 테스트
+"""
+import pandas as pd
+
+from title_generator import (
+    create_title_combination, create_title_combinations, iter_gray_title_combinations
+)
+from title_generator.version_calc import calculate_version_indices, iter_gray_changes
+
+TEST_SYNONYMS = {
+    '브랜드': {'NBA': ['엔비에이', 'N.B.A', '엔바']},
+    '색상': {'블랙': ['검정색', '흑색']},
+    '패턴': {'무지': ['솔리드']},
+    '카테고리': {'맨투맨': ['맨투맨', '스웨트셔츠', '크루넥', '무지 티']}
+}
+COL_SELECTION = ['브랜드', '색상', '패턴', '카테고리']
+
+def test_gray_changes_visit_all_once():
+    """모든 조합을 한 번씩 방문하고 한 번에 한 자리만 ±1 바뀌는지 테스트"""
+    radices = [3, 1, 2, 4]
+    digits = [0] * len(radices)
+    seen = {tuple(digits)}
+
+    for pos, value in iter_gray_changes(radices):
+        assert abs(value - digits[pos]) == 1
+        assert radices[pos] > 1
+        digits[pos] = value
+        seen.add(tuple(digits))
+
+    assert len(seen) == 24
+    assert list(iter_gray_changes([1, 1])) == []
+    assert list(iter_gray_changes([])) == []
+
+def test_gray_titles_cover_all_combinations():
+    """그레이 순서 제목이 버전 인덱스 기준 제목과 일치하는지 테스트"""
+    row = pd.Series({'브랜드': 'NBA', '색상': '블랙', '패턴': '무지', '카테고리': '맨투맨', '소재': '면'})
+
+    walked = list(iter_gray_title_combinations(row, COL_SELECTION, TEST_SYNONYMS))
+
+    assert sorted(idx for idx, _ in walked) == list(range(24))
+    for idx, title in walked:
+        assert title == create_title_combination(row, COL_SELECTION, TEST_SYNONYMS, idx)[0]
+
+    # 연속된 조합은 유의어 한 자리만 다름
+    ordered_lists = [['a'] * 3, ['a'] * 2, ['a'], ['a'] * 4]
+    for (prev, _), (curr, _) in zip(walked, walked[1:]):
+        prev_indices = calculate_version_indices(ordered_lists, prev)[0]
+        curr_indices = calculate_version_indices(ordered_lists, curr)[0]
+        assert sum(a != b for a, b in zip(prev_indices, curr_indices)) == 1
+
+    assert list(iter_gray_title_combinations(row, COL_SELECTION, TEST_SYNONYMS, cap=5)) == walked[:5]
+
+def test_batch_gray_order():
+    """일괄 생성의 그레이 코드 순서 옵션 테스트"""
+    row = {'브랜드': 'NBA', '색상': '블랙'}
+
+    titles, total = create_title_combinations(row, COL_SELECTION, TEST_SYNONYMS, 8, order='gray')
+
+    assert total == 6
+    assert titles[:4] == ['엔비에이 검정색', 'N.B.A 검정색', '엔바 검정색', '엔바 흑색']
+    assert titles[6:] == titles[:2]  # 조합 수를 넘으면 순환
+    assert len(set(titles)) == 6
+
+    # 유의어가 없는 행
+    assert create_title_combinations({'브랜드': 'X'}, COL_SELECTION, TEST_SYNONYMS, 2, order='gray') == (['X', 'X'], 1)
@@ -0,0 +1,143 @@
+"""
+병렬 제목 생성 테스트
+"""
+import pandas as pd
+
+from text_cleaner import get_stopwords, set_stopwords
+from title_generator import (
+    generate_title_matrix, generate_titles_parallel, iter_titles_parallel, build_synonym_index,
+    resolve_worker_count, PipelineStats
+)
+from title_generator import parallel
+
+TEST_SYNONYMS = {
+    '브랜드': {'NBA': ['엔비에이', 'N.B.A', '엔바'], 'Nike': ['나이키', 'NIKE']},
+    '색상': {'블랙': ['검정색', '흑색']},
+    '카테고리': {'맨투맨': ['맨투맨', '스웨트셔츠', '크루넥 티셔츠']}
+}
+COL_SELECTION = ['브랜드', '색상', '패턴', '소재', '카테고리']
+
+def _make_frame(count):
+    brands = ['NBA', 'Nike', '[S] 없는브랜드', None]
+    colors = ['블랙', '', '화이트']
+    return pd.DataFrame([
+        {
+            '브랜드': brands[i % len(brands)],
+            '색상': colors[i % len(colors)],
+            '소재': '면' if i % 2 else '폴리',
+            '카테고리': '맨투맨',
+            '상품명': f'상품 {i}'
+        }
+        for i in range(count)
+    ])
+
+def test_parallel_matches_in_process():
+    """여러 프로세스로 나눠 생성한 결과가 행 순서까지 같은지 테스트"""
+    df = _make_frame(50)
+    rows = list(range(49, -1, -3))
+    index = build_synonym_index(TEST_SYNONYMS, pre_clean=True)
+
+    for synonyms in [TEST_SYNONYMS, index]:
+        expected = generate_title_matrix(df, rows, COL_SELECTION, synonyms, 5)
+        actual = generate_titles_parallel(
+            df, rows, COL_SELECTION, synonyms, 5, workers=2, chunk_size=4, min_rows=0
+        )
+        assert actual == expected
+
+    # 무작위 추출과 템플릿도 같은 결과
+    expected = generate_title_matrix(
+        df, rows, COL_SELECTION, index, 4, sample_seed=7, template='{카테고리} - {브랜드}'
+    )
+    assert generate_titles_parallel(
+        df, rows, COL_SELECTION, index, 4, sample_seed=7, template='{카테고리} - {브랜드}',
+        workers=2, chunk_size=4, min_rows=0
+    ) == expected
+
+def test_parallel_ships_stopwords():
+    """현재 불필요한 단어 목록이 작업 프로세스에도 적용되는지 테스트"""
+    original = get_stopwords()
+    try:
+        set_stopwords(['맨투맨'])
+        df = _make_frame(12)
+        rows = list(range(12))
+        expected = generate_title_matrix(df, rows, COL_SELECTION, TEST_SYNONYMS, 3)
+        assert generate_titles_parallel(
+            df, rows, COL_SELECTION, TEST_SYNONYMS, 3, workers=2, chunk_size=3, min_rows=0
+        ) == expected
+    finally:
+        set_stopwords(original)
+
+def test_small_selection_runs_in_process(monkeypatch):
+    """선택 행이 적으면 프로세스 풀을 만들지 않는지 테스트"""
+    def fail(*args, **kwargs):
+        raise AssertionError("프로세스 풀을 사용하면 안 됨")
+
+    monkeypatch.setattr(parallel, 'ProcessPoolExecutor', fail)
+    df = _make_frame(10)
+    rows = list(range(10))
+    expected = generate_title_matrix(df, rows, COL_SELECTION, TEST_SYNONYMS, 2)
+
+    assert generate_titles_parallel(df, rows, COL_SELECTION, TEST_SYNONYMS, 2, workers=4) == expected
+    assert generate_titles_parallel(
+        df, rows, COL_SELECTION, TEST_SYNONYMS, 2, workers=1, min_rows=0
+    ) == expected
+    assert generate_titles_parallel(df, [], COL_SELECTION, TEST_SYNONYMS, 2, min_rows=0) == []
+
+def test_pool_uses_spawn(monkeypatch):
+    """GUI 프로세스에서 fork하지 않도록 spawn으로 작업 프로세스를 시작하는지 테스트"""
+    contexts = []
+
+    class RecordingExecutor(parallel.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            contexts.append(kwargs.get('mp_context'))
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(parallel, 'ProcessPoolExecutor', RecordingExecutor)
+    df = _make_frame(8)
+    rows = list(range(8))
+    assert generate_titles_parallel(
+        df, rows, COL_SELECTION, TEST_SYNONYMS, 2, workers=2, chunk_size=4, min_rows=0
+    ) == generate_title_matrix(df, rows, COL_SELECTION, TEST_SYNONYMS, 2)
+    assert [context.get_start_method() for context in contexts] == ['spawn']
+
+def test_iter_resumes_after_worker_failure(monkeypatch):
+    """작업 프로세스가 중간에 실패하면 남은 청크만 현재 프로세스에서 이어서 생성하는지 테스트"""
+    class FailingExecutor:
+        """첫 청크만 생성하고 실패하는 가짜 프로세스 풀 (현재 프로세스에서 실행)"""
+        def __init__(self, max_workers, mp_context, initializer, initargs):
+            initializer(*initargs)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+        def map(self, func, chunks):
+            yield func(chunks[0])
+            raise RuntimeError("작업 프로세스 종료")
+
+    monkeypatch.setattr(parallel, 'ProcessPoolExecutor', FailingExecutor)
+    df = _make_frame(10)
+    rows = list(range(9, -1, -1))
+    stats = PipelineStats()
+
+    chunks = list(iter_titles_parallel(
+        df, rows, COL_SELECTION, TEST_SYNONYMS, 2, workers=2, chunk_size=4, min_rows=0, stats=stats
+    ))
+    assert [chunk_rows for chunk_rows, _ in chunks] == [rows[:4], rows[4:8], rows[8:]]
+    assert [title for _, titles in chunks for title in titles] == \
+        generate_title_matrix(df, rows, COL_SELECTION, TEST_SYNONYMS, 2)
+    # 실패한 청크는 한 번만 기록 (현재 프로세스에서 청크별로 생성한 것과 같은 호출 수)
+    in_process = PipelineStats()
+    list(iter_titles_parallel(
+        df, rows, COL_SELECTION, TEST_SYNONYMS, 2, workers=1, chunk_size=4, stats=in_process
+    ))
+    assert {name: calls for name, (_, calls) in stats.stages.items()} == \
+        {name: calls for name, (_, calls) in in_process.stages.items()}
+
+def test_resolve_worker_count():
+    """프로세스 수 결정 테스트"""
+    assert resolve_worker_count(3) == 3
+    assert resolve_worker_count(0) == 1
+    assert resolve_worker_count() >= 1
@@ -0,0 +1,109 @@
+"""
+단계별 시간 측정 테스트
+"""
+import os
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+import title_generator
+from title_generator import (
+    create_title_combinations, generate_title_matrix, generate_titles_parallel, PipelineStats
+)
+from title_generator.template import TitlePlan
+from transform import generate_titles
+
+TEST_SYNONYMS = {
+    '브랜드': {'NBA': ['엔비에이', 'N.B.A']},
+    '색상': {'블랙': ['검정색', '흑색']}
+}
+COL_SELECTION = ['브랜드', '색상']
+
+def test_stats_counts_stages():
+    """stats 인자로 단계별 호출 횟수를 집계하고 모듈 함수는 바꾸지 않는지 테스트"""
+    original_prepare = title_generator.prepare_data
+    original_render = TitlePlan.render
+    row = {'브랜드': 'NBA', '색상': '블랙', '카테고리': '맨투맨'}
+    stats = PipelineStats()
+
+    expected = create_title_combinations(row, COL_SELECTION, TEST_SYNONYMS, 3)
+    assert create_title_combinations(row, COL_SELECTION, TEST_SYNONYMS, 3, stats=stats) == expected
+    create_title_combinations(row, COL_SELECTION, TEST_SYNONYMS, 3, stats=stats)
+
+    assert stats.stages['prepare_data'][1] == 2
+    assert stats.stages['find_synonyms'][1] == 4
+    assert stats.stages['calculate_version_indices'][1] == 6
+    assert stats.stages['render'][1] == 6
+    assert stats.stages['clean_text'][1] == 6
+    # 전역 함수를 바꾸지 않음 (다른 스레드의 실행과 무관)
+    assert title_generator.prepare_data is original_prepare
+    assert TitlePlan.render is original_render
+
+def test_stats_from_matrix_and_workers():
+    """고유 조합 생성과 병렬 생성 작업 프로세스의 단계도 기록하는지 테스트"""
+    df = pd.DataFrame({
+        '브랜드': ['NBA', 'NBA', '없는브랜드', 'NBA'],
+        '색상': ['블랙', '', '블랙', '블랙'],
+    })
+    rows = list(range(len(df)))
+    expected = generate_title_matrix(df, rows, COL_SELECTION, TEST_SYNONYMS, 2)
+
+    stats = PipelineStats()
+    assert generate_title_matrix(df, rows, COL_SELECTION, TEST_SYNONYMS, 2, stats=stats) == expected
+    # 빈 값이 아닌 고유 값마다 한 번 매칭하고 고유 조합의 제목만 조립
+    assert stats.stages['find_synonyms'][1] == 3
+    assert stats.stages['calculate_version_indices'][1] == 1
+    assert stats.stages['render'][1] == 6
+
+    stats = PipelineStats()
+    assert generate_titles_parallel(
+        df, rows, COL_SELECTION, TEST_SYNONYMS, 2,
+        workers=2, chunk_size=2, min_rows=0, stats=stats
+    ) == expected
+    # 청크마다 작업 프로세스에서 기록한 통계를 합침 (청크별 고유 조합 2개씩)
+    assert stats.stages['render'][1] == 8
+    assert stats.stages['clean_text'][1] == 8
+
+def test_generate_titles_returns_stats():
+    """generate_titles가 통계를 반환하는지 테스트"""
+    test_file = "test_profiling.xlsx"
+    df = pd.DataFrame({
+        '브랜드': ['NBA', 'NBA', '없는브랜드'],
+        '색상': ['블랙', '', '블랙'],
+        '카테고리': ['맨투맨', '셔츠', '맨투맨'],
+    }, dtype=str)
+    df.to_excel(test_file, index=False)
+
+    try:
+        model = MagicMock()
+        model._df = df.copy()
+        model.update_cell = lambda r, c, v: None
+        options = dict(
+            file_path=test_file, sheet_name='Sheet1', col_selection=COL_SELECTION,
+            synonym_dict=TEST_SYNONYMS, selected_rows=[0, 1, 2], version_count=2,
+            progress_callback=None, log_callback=None, model=model
+        )
+
+        assert generate_titles(**options) is None
+
+        stats = generate_titles(**options, collect_stats=True)
+        assert stats.rows == 3
+        assert stats.titles == 6
+        for stage in ['load_workbook', 'generate', 'prepare_data', 'clean_text',
+                      'write_cells', 'save_workbook']:
+            assert stage in stats.stages
+        assert stats.rows_per_sec > 0
+        assert stats.lines()[0].startswith('처리 통계: 3행 / 제목 6개')
+        assert set(stats.as_dict()) == {
+            'stages', 'rows', 'titles', 'elapsed', 'rows_per_sec', 'titles_per_sec'
+        }
+
+        # 백그라운드 저장으로 넘기면 저장 시간은 저장 작업 쪽에서 더함
+        jobs = []
+        stats = generate_titles(**options, collect_stats=True, save_handler=jobs.append)
+        assert 'save_workbook' not in stats.stages
+        assert len(jobs) == 1
+        jobs[0]()
+    finally:
+        if os.path.exists(test_file):
+            os.remove(test_file)
@@ -0,0 +1,73 @@
+"""
+무작위 조합 추출 테스트
+"""
+import pandas as pd
+
+from title_generator import create_title_combination, create_title_combinations, generate_title_matrix
+from title_generator.version_calc import sample_version_indices
+
+TEST_SYNONYMS = {
+    '브랜드': {'NBA': ['엔비에이', 'N.B.A', '엔바'], 'Nike': ['나이키', 'NIKE']},
+    '색상': {'블랙': ['검정색', '흑색', '먹색', '블랙']},
+    '카테고리': {'맨투맨': ['맨투맨', '스웨트셔츠', '크루넥']}
+}
+COL_SELECTION = ['브랜드', '색상', '카테고리']
+
+def test_sample_distinct_and_reproducible():
+    """서로 다른 인덱스를 뽑고 같은 시드면 같은 결과인지 테스트"""
+    sampled = sample_version_indices(100, 10, seed=42)
+
+    assert len(sampled) == len(set(sampled)) == 10
+    assert all(0 <= idx < 100 for idx in sampled)
+    assert sample_version_indices(100, 10, seed=42) == sampled
+    assert sample_version_indices(100, 10, seed=43) != sampled
+
+    # 조합 수보다 많이 요청하면 전체 조합
+    assert sorted(sample_version_indices(5, 10, seed=1)) == [0, 1, 2, 3, 4]
+    assert sample_version_indices(5, 0, seed=1) == []
+
+def test_sample_huge_space():
+    """조합 수가 매우 커도 나열 없이 추출하는지 테스트"""
+    total = 50 ** 5 * 10 ** 6
+    sampled = sample_version_indices(total, 10, seed=7)
+
+    assert len(set(sampled)) == 10
+    assert all(0 <= idx < total for idx in sampled)
+
+def test_sampled_titles():
+    """무작위 추출 제목이 해당 버전 인덱스 제목과 같고 서로 다른지 테스트"""
+    row = pd.Series({'브랜드': 'NBA', '색상': '블랙', '카테고리': '맨투맨'})
+
+    titles, total = create_title_combinations(row, COL_SELECTION, TEST_SYNONYMS, 10, sample_seed=0)
+
+    assert total == 36
+    assert len(set(titles)) == 10
+    all_titles = [create_title_combination(row, COL_SELECTION, TEST_SYNONYMS, i)[0] for i in range(36)]
+    assert set(titles) <= set(all_titles)
+
+    # 행별로 재현 가능하고, 시드가 다르면 다른 조합
+    assert create_title_combinations(row, COL_SELECTION, TEST_SYNONYMS, 10, sample_seed=0)[0] == titles
+    assert create_title_combinations(row, COL_SELECTION, TEST_SYNONYMS, 10, sample_seed=1)[0] != titles
+
+    # 조합 수보다 많이 요청하면 순환
+    small_row = {'브랜드': 'Nike'}
+    titles, total = create_title_combinations(small_row, COL_SELECTION, TEST_SYNONYMS, 5, sample_seed=0)
+    assert total == 2
+    assert set(titles) == {'나이키', 'NIKE'}
+    assert titles[2:4] == titles[0:2]
+
+def test_vectorized_sampling_matches_rows():
+    """DataFrame 단위 생성의 무작위 추출이 행 단위 결과와 같은지 테스트"""
+    df = pd.DataFrame({
+        '브랜드': ['NBA', 'Nike', 'NBA', None],
+        '색상': ['블랙', '블랙', '블랙', '블랙'],
+        '카테고리': ['맨투맨', '맨투맨', '셔츠', '맨투맨'],
+    })
+
+    matrix = generate_title_matrix(df, [0, 1, 2, 3], COL_SELECTION, TEST_SYNONYMS, 6, sample_seed=3)
+
+    for pos, titles in enumerate(matrix):
+        expected, _ = create_title_combinations(
+            df.iloc[pos], COL_SELECTION, TEST_SYNONYMS, 6, sample_seed=3
+        )
+        assert titles == expected
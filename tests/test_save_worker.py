@@ -0,0 +1,106 @@
+"""
+원자적 저장 테스트
+"""
+import os
+from unittest.mock import MagicMock
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from save_worker import SaveCancelled, atomic_write, save_workbook_atomic
+from transform import generate_titles
+
+def temp_files():
+    """현재 폴더에 남은 임시 xlsx 파일"""
+    return [name for name in os.listdir('.') if name.startswith('tmp') and name.endswith('.xlsx')]
+
+def make_workbook(path, value):
+    wb = openpyxl.Workbook()
+    wb.active['A1'] = value
+    wb.create_sheet('브랜드')['A1'] = '원본'
+    wb.save(path)
+
+def read_value(path):
+    wb = openpyxl.load_workbook(path)
+    try:
+        return wb.active['A1'].value
+    finally:
+        wb.close()
+
+def test_save_workbook_atomic():
+    """원자적 저장과 진행 상황/취소 테스트"""
+    test_file = "test_atomic_save.xlsx"
+    try:
+        make_workbook(test_file, '원본 값')
+        os.chmod(test_file, 0o644)
+
+        wb = openpyxl.load_workbook(test_file)
+        wb.active['A1'] = '새 값'
+
+        # 쓰는 도중 취소하면 원본 그대로
+        reports = []
+        with pytest.raises(SaveCancelled):
+            save_workbook_atomic(
+                wb, test_file, lambda size, parts: reports.append((size, parts)),
+                cancelled=lambda: len(reports) >= 3
+            )
+        assert read_value(test_file) == '원본 값'
+        assert temp_files() == []
+
+        # 쓰는 중에 실패해도 원본 그대로
+        def broken(archive):
+            archive.writestr('a.xml', 'a')
+            raise OSError('디스크 가득 참')
+        with pytest.raises(OSError):
+            atomic_write(test_file, broken)
+        assert read_value(test_file) == '원본 값'
+        assert temp_files() == []
+
+        # 파트마다 쓴 바이트 수/파트 수를 알림
+        reports.clear()
+        size = save_workbook_atomic(wb, test_file, lambda size, parts: reports.append((size, parts)))
+        wb.close()
+        assert read_value(test_file) == '새 값'
+        assert [parts for _, parts in reports] == list(range(1, len(reports) + 1))
+        assert reports[-1][0] <= size == os.path.getsize(test_file)
+        assert os.stat(test_file).st_mode & 0o777 == 0o644
+
+    finally:
+        if os.path.exists(test_file):
+            os.remove(test_file)
+
+@pytest.mark.parametrize('save_mode', ['openpyxl', 'patch'])
+def test_generate_titles_save_handler(save_mode):
+    """save_handler로 넘긴 저장 작업을 나중에 실행/취소 테스트"""
+    test_file = f"test_save_handler_{save_mode}.xlsx"
+    data_df = pd.DataFrame({'브랜드': ['나이키'], '상품명_1': ['']}, dtype=str)
+    data_df.to_excel(test_file, sheet_name='Sheet1', index=False)
+    try:
+        mock_model = MagicMock()
+        mock_model._df = data_df.copy()
+        mock_model.update_cell = lambda r, c, v: None
+        jobs = []
+
+        def run():
+            generate_titles(
+                test_file, 'Sheet1', ['브랜드'], {'브랜드': {'나이키': ['NIKE']}}, [0], 1,
+                None, None, mock_model, save_mode=save_mode, save_handler=jobs.append
+            )
+
+        # 취소하면 원본 그대로
+        run()
+        with pytest.raises(SaveCancelled):
+            jobs.pop()(cancelled=lambda: True)
+        assert pd.read_excel(test_file)['상품명_1'].isna().all()
+
+        # 저장 작업을 실행해야 파일이 바뀜
+        run()
+        assert pd.read_excel(test_file)['상품명_1'].isna().all()
+        jobs.pop()()
+        assert pd.read_excel(test_file)['상품명_1'].tolist() == ['NIKE']
+        assert temp_files() == []
+
+    finally:
+        if os.path.exists(test_file):
+            os.remove(test_file)
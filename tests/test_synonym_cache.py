@@ -0,0 +1,154 @@
+"""
+유의어 사전 캐시 테스트
+"""
+import os
+import shutil
+
+import openpyxl
+
+import synonym_cache
+import synonyms_manager
+from synonyms_manager import load_synonym_dict_from_sheets
+from text_cleaner import get_stopwords, set_stopwords
+from title_generator.config import SYNONYM_CACHE_DIR
+from title_generator.compact_index import CompactSynonymIndex
+from title_generator.synonym_index import dictionary_revision
+from xlsx_patch import patch_cells
+
+CACHE_DIR = "test_synonym_cache_dir"
+
+def make_workbook(path):
+    """상품 시트와 유의어 시트가 있는 워크북"""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = '상품'
+    ws.append(['브랜드', '색상', '상품명'])
+    ws.append(['NBA', '검정', 'NBA 검정'])
+    colors = wb.create_sheet('색상')
+    colors.append(['원본', '유의어1', '유의어2'])
+    colors.append(['검정', '블랙', '[S] 흑색'])
+    colors.append(['네이비', 'NAVY'])
+    brands = wb.create_sheet('브랜드')
+    brands.append(['원본', '유의어1'])
+    brands.append(['NBA', '엔비에이'])
+    wb.save(path)
+    wb.close()
+
+def load(path):
+    """앱과 같은 옵션으로 캐시를 사용해 로드"""
+    return load_synonym_dict_from_sheets(
+        path, compiled=True, pre_clean=True, groups=True, compact=True, cache_dir=CACHE_DIR
+    )
+
+def forbid_workbook(monkeypatch):
+    """워크북을 다시 읽으면 실패하도록 설정"""
+    def fail(*args, **kwargs):
+        raise AssertionError("캐시 적중 시 워크북을 읽으면 안 됨")
+
+    monkeypatch.setattr(synonyms_manager, 'open_workbook', fail)
+
+def test_cache_hit_skips_workbook(monkeypatch):
+    """같은 워크북을 다시 열면 워크북을 읽지 않고 같은 사전을 불러오는지 테스트"""
+    test_file = "test_synonym_cache.xlsx"
+    try:
+        make_workbook(test_file)
+        first = load(test_file)
+        assert isinstance(first, CompactSynonymIndex)
+        assert first.clean_report['modified']
+        assert os.listdir(CACHE_DIR)
+
+        # 수정 시각이 같으면 시트 해시도 계산하지 않음
+        forbid_workbook(monkeypatch)
+        monkeypatch.setattr(synonym_cache, 'sheets_digest', lambda *args: 1 / 0)
+        second = load(test_file)
+        assert second is not first
+        assert dict(second.items()).keys() == dict(first.items()).keys()
+        assert second['색상'].lookup('NAVY') == first['색상'].lookup('NAVY')
+        assert second['브랜드'].lookup('nba') == first['브랜드'].lookup('nba')
+        # 정리 기록은 유지하고, 리비전은 새로 부여 (이전 사전 기준 제목 캐시 무효화)
+        assert second.clean_report == first.clean_report
+        assert second.revision != first.revision
+        assert dictionary_revision(second) == second.revision
+
+        # 옵션이 다르면 다른 캐시 항목
+        monkeypatch.undo()
+        raw = load_synonym_dict_from_sheets(test_file, cache_dir=CACHE_DIR)
+        assert raw['색상'] == {'검정': ['블랙', '[S] 흑색'], '네이비': ['NAVY']}
+        assert len(os.listdir(CACHE_DIR)) == 2
+        forbid_workbook(monkeypatch)
+        assert load_synonym_dict_from_sheets(test_file, cache_dir=CACHE_DIR) == raw
+
+    finally:
+        if os.path.exists(test_file):
+            os.remove(test_file)
+        shutil.rmtree(CACHE_DIR, ignore_errors=True)
+
+def test_cache_invalidation(monkeypatch):
+    """유의어 시트 내용이 바뀌었을 때만 캐시를 다시 만드는지 테스트"""
+    test_file = "test_synonym_cache_edit.xlsx"
+    try:
+        make_workbook(test_file)
+        first = load(test_file)
+
+        # 제목 셀만 패치 저장하면 수정 시각은 바뀌지만 유의어 시트는 그대로
+        patch_cells(test_file, '상품', {(2, 3): 'NBA 블랙'})
+        os.utime(test_file, ns=(0, os.stat(test_file).st_mtime_ns + 10 ** 9))
+        with monkeypatch.context() as patch:
+            forbid_workbook(patch)
+            assert load(test_file)['색상'].lookup('블랙') == first['색상'].lookup('블랙')
+            # 갱신한 수정 시각으로는 해시 없이 적중
+            patch.setattr(synonym_cache, 'sheets_digest', lambda *args: 1 / 0)
+            load(test_file)
+
+        # 유의어 시트를 고치면 다시 읽음
+        wb = openpyxl.load_workbook(test_file)
+        wb['색상'].append(['빨강', 'RED'])
+        wb.save(test_file)
+        wb.close()
+        edited = load(test_file)
+        assert '빨강' in edited['색상']
+        assert '빨강' not in first['색상']
+
+        # 깨진 캐시 파일은 미적중으로 처리하고 다시 저장
+        for name in os.listdir(CACHE_DIR):
+            with open(os.path.join(CACHE_DIR, name), 'wb') as f:
+                f.write(b'broken')
+        assert '빨강' in load(test_file)['색상']
+        forbid_workbook(monkeypatch)
+        assert '빨강' in load(test_file)['색상']
+
+    finally:
+        if os.path.exists(test_file):
+            os.remove(test_file)
+        shutil.rmtree(CACHE_DIR, ignore_errors=True)
+
+def test_cache_stopwords(monkeypatch):
+    """불필요한 단어 목록이 바뀌면 미리 정리한 사전을 캐시에서 쓰지 않는지 테스트"""
+    test_file = "test_synonym_cache_stopwords.xlsx"
+    original = get_stopwords()
+    try:
+        make_workbook(test_file)
+        first = load(test_file)
+        assert first['색상'].lookup('검정') == ('블랙', '흑색')
+
+        set_stopwords(['블랙'])
+        changed = load(test_file)
+        assert changed['색상'].lookup('검정') == ('', '흑색')
+        assert ('색상', '검정', '블랙') in changed.clean_report['emptied']
+        assert len(os.listdir(CACHE_DIR)) == 2
+
+        # 원래 목록으로 돌아오면 처음 캐시 항목 사용
+        set_stopwords(original)
+        forbid_workbook(monkeypatch)
+        assert load(test_file).clean_report == first.clean_report
+
+    finally:
+        set_stopwords(original)
+        if os.path.exists(test_file):
+            os.remove(test_file)
+        shutil.rmtree(CACHE_DIR, ignore_errors=True)
+
+def test_cache_dir_outside_cwd():
+    """기본 캐시 폴더가 작업 폴더가 아닌 사용자별 폴더인지 테스트"""
+    assert os.path.isabs(SYNONYM_CACHE_DIR)
+    assert not SYNONYM_CACHE_DIR.startswith(os.getcwd() + os.sep)
@@ -0,0 +1,265 @@
+"""
+유의어 색인 테스트
+"""
+import pandas as pd
+import openpyxl
+import os
+import pickle
+
+from title_generator import create_title_combination, build_synonym_index, normalize_key
+from title_generator.synonym_index import SynonymIndex, CategoryIndex, PrecleanedSynonyms
+from title_generator.synonym_matcher import find_synonyms
+from title_generator.compact_index import compact_synonym_index
+from title_generator.vectorized import generate_title_matrix
+from text_cleaner import get_stopwords, set_stopwords
+from synonyms_manager import load_synonym_dict_from_sheets
+
+TEST_SYNONYMS = {
+    '브랜드': {
+        'NBA': ['엔비에이', 'N.B.A', '엔바'],
+        'adidas Originals': ['아디다스오리지널', 'ADIDAS ORIGINALS'],
+        'nike': '나이키'
+    },
+    '색상': {
+        '블랙': ['검정색', '흑색', '먹색']
+    },
+    '카테고리': {
+        '맨투맨': ['맨투맨', '스웨트셔츠', '크루넥']
+    }
+}
+
+def test_normalize_key():
+    """정규화 규칙 테스트 (대소문자, 공백, 전각 문자)"""
+    assert normalize_key(' Nike ') == 'nike'
+    assert normalize_key('adidas   Originals') == 'adidas originals'
+    assert normalize_key('ＮＢＡ') == 'nba'  # 전각 → 반각 (NFKC)
+    assert normalize_key('STRASSE') == normalize_key('straße')  # casefold
+
+def test_build_index_structure():
+    """색인 구조 테스트"""
+    index = build_synonym_index(TEST_SYNONYMS)
+
+    assert isinstance(index, SynonymIndex)
+    assert isinstance(index['브랜드'], CategoryIndex)
+    assert index['브랜드']['nba'] == ('엔비에이', 'N.B.A', '엔바')
+    assert index['브랜드']['nike'] == ('나이키',)  # 문자열 값은 튜플로 변환
+    assert index.source is TEST_SYNONYMS
+
+    # 이미 컴파일된 색인은 그대로 반환
+    assert build_synonym_index(index) is index
+
+def test_first_duplicate_key_wins():
+    """정규화 결과가 같은 키는 먼저 나온 항목 사용"""
+    index = build_synonym_index({'브랜드': {'Nike': ['나이키'], 'NIKE ': ['NIKE']}})
+    assert find_synonyms('nike', index['브랜드']) == ('나이키',)
+
+def test_index_lookup():
+    """색인 조회 테스트"""
+    index = build_synonym_index(TEST_SYNONYMS)
+
+    assert find_synonyms(' nba ', index['브랜드']) == ('엔비에이', 'N.B.A', '엔바')
+    assert find_synonyms('ADIDAS   originals', index['브랜드'])[0] == '아디다스오리지널'
+    assert find_synonyms('없는브랜드', index['브랜드']) == ()
+
+def test_dict_lookup_follows_edits():
+    """원본 사전을 제자리에서 고쳐도 조회 결과가 바로 바뀌는지 테스트"""
+    colors = {'블랙': ['BLACK'], '네이비': ['NAVY']}
+    assert find_synonyms('블랙', colors) == ['BLACK']
+
+    # 항목 수가 같게 키 하나를 바꿔도 새 키로 조회
+    del colors['네이비']
+    colors['화이트'] = ['WHITE']
+    assert find_synonyms('화이트', colors) == ['WHITE']
+    assert find_synonyms('네이비', colors) == []
+
+def test_index_matches_dict_titles():
+    """색인과 일반 사전의 생성 결과가 같은지 테스트"""
+    index = build_synonym_index(TEST_SYNONYMS)
+    col_selection = ['브랜드', '색상', '패턴', '소재', '카테고리']
+    rows = [
+        pd.Series({'브랜드': 'NBA', '색상': '블랙', '카테고리': '맨투맨'}),
+        pd.Series({'브랜드': ' adidas originals ', '색상': '블랙', '카테고리': '맨투맨'}),
+        pd.Series({'브랜드': '없는브랜드', '색상': '블랙', '소재': '면'}),
+        {'브랜드': 'Nike', '색상': '', '카테고리': '맨투맨'},
+    ]
+
+    for row in rows:
+        for version in range(12):
+            expected = create_title_combination(row, col_selection, TEST_SYNONYMS, version)
+            actual = create_title_combination(row, col_selection, index, version)
+            assert actual == expected, f"Version {version}: {actual} != {expected}"
+
+def test_load_compiled_dict():
+    """시트에서 색인으로 바로 로드하는지 테스트"""
+    test_file = "test_synonym_index.xlsx"
+
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = '브랜드'
+    ws.append(['원본', '유의어1', '유의어2'])
+    ws.append(['Nike', '나이키', 'NIKE'])
+    wb.save(test_file)
+
+    try:
+        index = load_synonym_dict_from_sheets(test_file, compiled=True)
+        assert isinstance(index, SynonymIndex)
+        assert index['브랜드'].lookup(' NIKE ') == ('나이키', 'NIKE')
+
+        # 기본값은 기존과 같은 일반 사전
+        raw = load_synonym_dict_from_sheets(test_file)
+        assert raw == {'브랜드': {'Nike': ['나이키', 'NIKE']}}
+    finally:
+        if os.path.exists(test_file):
+            os.remove(test_file)
+
+def test_pre_clean_report():
+    """미리 정리한 사전과 정리 기록 테스트"""
+    synonyms = {
+        '브랜드': {'Nike': ['[S] 나이키', 'NIKE']},
+        '패턴': {'무지': ['무지', '솔리드(단색)']},
+        '소재': {'면': ['코튼 (in', '면']},
+        '색상': {'블랙': ['검정^', '블랙']},
+    }
+    index = build_synonym_index(synonyms, pre_clean=True)
+
+    assert index['브랜드']['nike'] == ('나이키', 'NIKE')
+    assert index['패턴']['무지'] == ('', '솔리드')  # 비워진 유의어도 순서 유지
+    assert index.clean_report['modified'] == [
+        ('브랜드', 'Nike', '[S] 나이키', '나이키'),
+        ('패턴', '무지', '무지', ''),
+        ('패턴', '무지', '솔리드(단색)', '솔리드'),
+        ('색상', '블랙', '검정^', '검정'),
+    ]
+    assert index.clean_report['emptied'] == [('패턴', '무지', '무지')]
+
+    # 원본에 괄호가 있던 목록은 제목 전체 정리가 필요 (제목은 정리 전 원본으로 생성)
+    assert isinstance(index['색상']['블랙'], PrecleanedSynonyms)
+    assert not isinstance(index['브랜드']['nike'], PrecleanedSynonyms)
+    assert not isinstance(index['소재']['면'], PrecleanedSynonyms)
+    assert index['브랜드']['nike'].raw == ('[S] 나이키', 'NIKE')
+
+    # 정리하지 않은 색인은 기록 없음, 정리 요청 시 다시 컴파일
+    plain = build_synonym_index(synonyms)
+    assert plain.clean_report is None
+    assert build_synonym_index(plain, pre_clean=True)['브랜드']['nike'] == ('나이키', 'NIKE')
+
+def test_pre_clean_titles_match():
+    """미리 정리한 사전으로 만든 제목이 기존 결과와 같은지 테스트"""
+    synonyms = {
+        '브랜드': {'Nike': ['[S] 나이키', 'NIKE^', '나이키 유니섹스']},
+        '색상': {'블랙': ['검정색', '블랙&화이트']},
+        '패턴': {'무지': ['무지', '솔리드(단색)']},
+        '소재': {'면': ['코튼 (in', '면']},
+    }
+    index = build_synonym_index(synonyms, pre_clean=True)
+    col_selection = ['브랜드', '색상', '패턴', '소재', '카테고리']
+    rows = [
+        {'브랜드': 'Nike', '색상': '블랙', '패턴': '무지', '카테고리': '맨투맨'},
+        {'브랜드': 'Nike', '색상': '블랙', '패턴': '무지', '카테고리': '맨투맨(오버핏)'},
+        {'브랜드': 'Nike', '소재': '면', '카테고리': 'out) 셔츠'},
+        {'브랜드': '[A] 없는브랜드', '색상': '블랙'},
+    ]
+
+    for row in rows:
+        for version in range(13):
+            expected = create_title_combination(row, col_selection, synonyms, version)
+            assert create_title_combination(row, col_selection, index, version) == expected
+
+def test_pre_clean_stopword_changes():
+    """불필요한 단어 목록이 바뀌거나 여러 단어로 된 경우에도 기존 결과와 같은지 테스트"""
+    synonyms = {'색상': {'검정': ['블랙', '흑색']}, '패턴': {'민무늬': ['무지', '솔리드']}}
+    col_selection = ['색상', '패턴']
+    rows = [{'색상': '검정', '패턴': '민무늬', '카테고리': '맨투맨'}]
+    df = pd.DataFrame(rows)
+    original = get_stopwords()
+    try:
+        index = build_synonym_index(synonyms, pre_clean=True)
+        compact = compact_synonym_index(index)
+        assert isinstance(index['색상']['검정'], PrecleanedSynonyms)
+        assert pickle.loads(pickle.dumps(compact)).stopwords == tuple(original)
+
+        # 사전을 정리한 뒤 목록 변경, 여러 단어로 된 불필요한 단어
+        for stopwords in (['블랙'], ['블랙 무지'], ['검정 블랙', '솔리드']):
+            set_stopwords(stopwords)
+            expected = [
+                create_title_combination(rows[0], col_selection, synonyms, version)[0]
+                for version in range(4)
+            ]
+            for synonym_dict in (index, compact, build_synonym_index(synonyms, pre_clean=True)):
+                assert [
+                    create_title_combination(rows[0], col_selection, synonym_dict, version)[0]
+                    for version in range(4)
+                ] == expected
+                assert generate_title_matrix(df, [0], col_selection, synonym_dict, 4) == [expected]
+        assert expected[0] == '블랙 무지 맨투맨'
+
+        set_stopwords(['블랙 무지'])
+        assert create_title_combination(rows[0], col_selection, index, 0)[0] == '맨투맨'
+        # 다시 정리하면 지금 목록 기준 (여러 단어면 조각 단위로 정리를 생략하지 않음)
+        rebuilt = build_synonym_index(index, pre_clean=True)
+        assert rebuilt is not index
+        assert not isinstance(rebuilt['색상']['검정'], PrecleanedSynonyms)
+
+    finally:
+        set_stopwords(original)
+
+def test_group_index():
+    """유의어로도 조회되는 그룹 역색인 테스트"""
+    synonyms = {
+        '색상': {
+            '블랙': ['검정색', '흑색'],
+            '검정': ['블랙', 'BLACK'],       # 원본이 다른 항목의 유의어 → 같은 그룹
+            '먹색': ['흑색', '차콜'],         # 유의어가 겹침 → 같은 그룹
+            '화이트': ['흰색', '백색'],
+        }
+    }
+    index = build_synonym_index(synonyms, groups=True)
+    colors = index['색상']
+
+    # 원본 키는 기존과 같은 결과 (원본 키 우선)
+    assert colors.lookup('블랙') == ('검정색', '흑색')
+    assert colors.lookup('검정') == ('블랙', 'BLACK')
+
+    # 유의어로 조회하면 합쳐진 그룹의 유의어 (정규화 기준 중복 제거)
+    group = ('검정색', '흑색', '블랙', 'BLACK', '차콜')
+    assert colors.lookup(' 검정색 ') == group
+    assert colors.lookup('ＢＬＡＣＫ') == group
+    assert colors.lookup('차콜') == group
+    assert colors.lookup('백색') == ('흰색', '백색')
+    assert colors.lookup('없는색') == ()
+
+    assert colors.group_id('차콜') == colors.group_id('블랙') == 0
+    assert colors.group_id('흰색') == 1
+    assert colors.groups[0][0] == '블랙'  # 먼저 나온 항목이 대표 원본
+
+    # 그룹 색인이 아니면 유의어로 조회되지 않음
+    assert build_synonym_index(synonyms)['색상'].lookup('검정색') == ()
+
+    # 제목 생성에 그대로 사용
+    row = {'색상': '흑색', '카테고리': '맨투맨'}
+    assert create_title_combination(row, ['색상'], index, 4) == ('차콜 맨투맨', 5)
+
+    # 미리 정리와 함께 사용하고, 프로세스로 넘길 수 있도록 피클 가능
+    pre = build_synonym_index(index, pre_clean=True)
+    assert pre.grouped and pre.clean_report is not None
+    assert pickle.loads(pickle.dumps(pre))['색상'].lookup('차콜') == group
+
+def test_load_group_index():
+    """시트에서 그룹 역색인으로 로드하는지 테스트"""
+    test_file = "test_synonym_groups.xlsx"
+
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = '색상'
+    ws.append(['원본', '유의어1', '유의어2'])
+    ws.append(['블랙', '검정색', '흑색'])
+    ws.append(['먹색', '흑색', '차콜'])
+    wb.save(test_file)
+
+    try:
+        index = load_synonym_dict_from_sheets(test_file, groups=True)
+        assert isinstance(index, SynonymIndex) and index.grouped
+        assert index['색상'].lookup('검정색') == ('검정색', '흑색', '차콜')
+    finally:
+        if os.path.exists(test_file):
+            os.remove(test_file)
@@ -0,0 +1,145 @@
+"""
+제목 템플릿 테스트
+"""
+import pandas as pd
+import pytest
+
+from title_generator import (
+    create_title_combination, create_title_combinations, iter_gray_title_combinations,
+    generate_title_matrix, build_synonym_index, compile_template, get_title_plan, TitleCache
+)
+from title_generator.config import ORDERED_COLUMNS, TITLE_TEMPLATES
+from title_generator.result_builder import generate_result
+
+TEST_SYNONYMS = {
+    '브랜드': {'NBA': ['엔비에이', 'N.B.A']},
+    '색상': {'블랙': ['검정색', '흑색']},
+    '카테고리': {'맨투맨': ['맨투맨', '스웨트셔츠', '무지 티']}
+}
+COL_SELECTION = ['브랜드', '색상', '패턴', '소재', '카테고리']
+MARKET_TEMPLATE = '{브랜드} {색상} {카테고리} - {소재}'
+
+def test_compile_template_plan():
+    """슬롯 계획 구조 테스트"""
+    plan = compile_template('[{브랜드}] {색상} {카테고리} - {소재}')
+
+    assert plan.columns == ('브랜드', '색상', '카테고리', '소재')
+    assert plan.slots == [
+        ('open', '['), ('column', '브랜드'), ('close', ']'), ('separator', ' '), ('column', '색상'),
+        ('separator', ' '), ('column', '카테고리'), ('separator', ' - '), ('column', '소재')
+    ]
+    assert plan.column_kinds(COL_SELECTION, TEST_SYNONYMS) == {
+        '브랜드': 'synonym', '색상': 'synonym', '카테고리': 'synonym', '소재': 'static'
+    }
+    assert not plan.clean_safe
+    assert not compile_template(MARKET_TEMPLATE).clean_safe
+    assert compile_template(TITLE_TEMPLATES['default']).clean_safe
+
+    # 같은 템플릿은 한 번만 컴파일
+    assert compile_template(MARKET_TEMPLATE) is get_title_plan(MARKET_TEMPLATE)
+
+def test_invalid_templates():
+    """잘못된 템플릿 테스트"""
+    for template in ['브랜드만', '{브랜드} {}', '{브랜드} {브랜드}', '{브랜드} {색상',
+                     '({브랜드} {색상})', '[{브랜드})', '(신상) {브랜드}', '{브랜드}) {색상}']:
+        with pytest.raises(ValueError):
+            compile_template(template)
+
+def test_render_skips_empty_values():
+    """빈 값과 그 구분자는 건너뛰는지 테스트"""
+    plan = compile_template(MARKET_TEMPLATE)
+
+    assert plan.render(['NBA', '블랙', '맨투맨', '면']) == 'NBA 블랙 맨투맨 - 면'
+    assert plan.render(['NBA', '', '맨투맨', '']) == 'NBA 맨투맨'
+    assert plan.render(['', '', '', '면']) == '면'
+
+    # 자리표시자를 감싼 괄호는 값이 비면 함께 빠짐
+    plan = compile_template('[{브랜드}] {카테고리}/{색상}')
+    assert plan.render(['NBA', '맨투맨', '블랙']) == '[NBA] 맨투맨/블랙'
+    assert plan.render(['', '맨투맨', '블랙']) == '맨투맨/블랙'
+    plan = compile_template('{브랜드} ({색상}) {카테고리}')
+    assert plan.render(['NBA', '', '맨투맨']) == 'NBA 맨투맨'
+    assert plan.render(['', '블랙', '맨투맨']) == '(블랙) 맨투맨'
+
+    # 고정 문구는 그대로 두고 값만 정리 (정리로 비워진 값은 괄호와 함께 빠짐)
+    assert plan.render_title(['[S] NBA', '무지', '맨투맨(오버핏)']) == 'NBA 맨투맨'
+    assert compile_template('{브랜드} - {색상}').render_title(['NBA^', '블랙&']) == 'NBA - 블랙'
+
+def test_default_template_matches_generate_result():
+    """기본 템플릿이 기존 컬럼 순서 결합과 같은지 테스트"""
+    plan = get_title_plan()
+    assert plan.columns == tuple(ORDERED_COLUMNS)
+    assert plan is get_title_plan(TITLE_TEMPLATES['default'])
+
+    values = ['NBA', '', '무지', '면', '맨투맨']
+    fixed_values = dict(zip(ORDERED_COLUMNS, values))
+    assert plan.render(values) == generate_result(ORDERED_COLUMNS, [], [], [], fixed_values)
+
+def test_market_template_titles():
+    """마켓별 템플릿으로 제목을 생성하는지 테스트"""
+    row = pd.Series({'브랜드': 'NBA', '색상': '블랙', '소재': '면', '카테고리': '맨투맨'})
+
+    titles, total = create_title_combinations(
+        row, COL_SELECTION, TEST_SYNONYMS, 3, template=MARKET_TEMPLATE
+    )
+    assert total == 12
+    assert titles == ['엔비에이 검정색 맨투맨 - 면', 'N.B.A 검정색 맨투맨 - 면', '엔비에이 흑색 맨투맨 - 면']
+
+    # 조합 순서는 템플릿의 컬럼 순서를 따름
+    for version, title in enumerate(titles):
+        assert create_title_combination(
+            row, COL_SELECTION, TEST_SYNONYMS, version, template=MARKET_TEMPLATE
+        ) == (title, 12)
+
+    # 템플릿에 없는 컬럼(패턴)은 제목에 들어가지 않음
+    row['패턴'] = '스트라이프'
+    assert create_title_combination(
+        row, COL_SELECTION, TEST_SYNONYMS, 0, template=MARKET_TEMPLATE
+    )[0] == '엔비에이 검정색 맨투맨 - 면'
+
+    # 잘못된 템플릿은 에러 결과
+    title, total = create_title_combination(row, COL_SELECTION, TEST_SYNONYMS, 0, template='{}')
+    assert title.startswith('ERROR: ') and total == 0
+
+def test_template_engines_match():
+    """행 단위/그레이/DataFrame/캐시 경로가 같은 결과를 내는지 테스트"""
+    index = build_synonym_index(TEST_SYNONYMS, pre_clean=True)
+    df = pd.DataFrame([
+        {'브랜드': 'NBA', '색상': '블랙', '소재': '면', '카테고리': '맨투맨'},
+        {'브랜드': 'NBA', '색상': '', '소재': '폴리', '카테고리': '맨투맨'},
+        {'브랜드': '[S] NBA', '색상': '블랙', '소재': None, '카테고리': '맨투맨(오버핏)'},
+        {'브랜드': '', '색상': '블랙', '소재': '면', '카테고리': '맨투맨'},
+    ])
+    rows = list(range(len(df)))
+    cache = TitleCache()
+    bracket_titles = {
+        '[{브랜드}] {카테고리}/{색상}': [
+            '[엔비에이] 맨투맨/검정색', '[엔비에이] 맨투맨', '[NBA] 맨투맨/검정색', '맨투맨/검정색'
+        ],
+        '{브랜드} ({색상}) {카테고리}': [
+            '엔비에이 (검정색) 맨투맨', '엔비에이 맨투맨', 'NBA (검정색) 맨투맨', '(검정색) 맨투맨'
+        ],
+    }
+
+    for template in [None, MARKET_TEMPLATE, *bracket_titles]:
+        for synonyms in [TEST_SYNONYMS, index]:
+            expected = [
+                create_title_combinations(df.iloc[row], COL_SELECTION, synonyms, 8,
+                                          template=template)[0]
+                for row in rows
+            ]
+            if template in bracket_titles:
+                assert [titles[0] for titles in expected] == bracket_titles[template]
+            assert generate_title_matrix(
+                df, rows, COL_SELECTION, synonyms, 8, template=template
+            ) == expected
+
+            for row in rows:
+                assert cache.title_combinations(
+                    df.iloc[row], COL_SELECTION, synonyms, 8, template=template
+                )[0] == expected[row]
+
+            gray = dict(iter_gray_title_combinations(
+                df.iloc[0], COL_SELECTION, synonyms, template=template
+            ))
+            assert [gray[version] for version in range(8)] == expected[0]
@@ -0,0 +1,41 @@
+"""
+텍스트 정리 테스트
+"""
+from text_cleaner import TextCleaner, clean_text, set_stopwords, get_stopwords, DEFAULT_STOPWORDS
+
+def test_clean_text_rules():
+    """괄호, 특수문자, 불필요한 단어, 공백 정리 테스트"""
+    cases = [
+        ('[S] 더엣지 블랙', '더엣지 블랙'),
+        ('맨투맨(in&out)  셔츠', '맨투맨 셔츠'),
+        ('화이트&블랙^, 면', '화이트 블랙 면'),
+        ('ADIDAS 블랙 무지 폴리 맨투맨', 'ADIDAS 블랙 맨투맨'),
+        ('체크 셔츠', '체크 셔츠'),  # "체크"는 제거하지 않음
+        ('폴리에스터 무지개', '폴리에스터 무지개'),  # 단어 일부는 유지
+        ('  \t앞뒤   공백\n ', '앞뒤 공백'),
+        ('(a[b)c]d) 남음', '남음'),  # 대괄호를 먼저 지우는 순서 유지
+        ('(a[b)c] 남음', '(a 남음'),
+        ('', ''),
+    ]
+
+    for text, expected in cases:
+        assert clean_text(text) == expected, f"{text!r}: {clean_text(text)!r} != {expected!r}"
+
+def test_custom_stopwords():
+    """불필요한 단어 목록 설정 테스트"""
+    cleaner = TextCleaner(['체크', ''])
+    assert cleaner.stopwords == ('체크',)
+    assert cleaner('체크 무지 셔츠') == '무지 셔츠'
+    assert TextCleaner([])('무지 [S] 셔츠') == '무지 셔츠'
+
+def test_set_default_stopwords():
+    """기본 정리기의 단어 목록 변경 테스트"""
+    try:
+        set_stopwords(['셔츠'])
+        assert get_stopwords() == ['셔츠']
+        assert clean_text('무지 셔츠') == '무지'
+    finally:
+        set_stopwords(None)
+
+    assert get_stopwords() == DEFAULT_STOPWORDS
+    assert clean_text('무지 셔츠') == '셔츠'
@@ -0,0 +1,118 @@
+"""
+제목 캐시 테스트
+"""
+import pandas as pd
+import openpyxl
+import os
+
+from title_generator import (
+    TitleCache, build_synonym_index, create_title_combination, create_title_combinations
+)
+from synonyms_manager import load_synonym_dict_from_sheets
+from text_cleaner import get_stopwords, set_stopwords
+
+TEST_SYNONYMS = {
+    '브랜드': {'NBA': ['엔비에이', 'N.B.A', '엔바']},
+    '색상': {'블랙': ['검정색', '흑색']}
+}
+
+def test_cache_hits_for_same_attributes():
+    """속성 값이 같은 행은 캐시에서 가져오는지 테스트"""
+    cache = TitleCache()
+    row_a = pd.Series({'유의어': 'a', '브랜드': 'NBA', '색상': '블랙'})
+    row_b = pd.Series({'유의어': 'b', '브랜드': ' NBA ', '색상': '블랙'})  # 전처리 후 동일
+
+    first = cache.title_combination(row_a, ['브랜드', '색상'], TEST_SYNONYMS, 1)
+    second = cache.title_combination(row_b, ['브랜드', '색상'], TEST_SYNONYMS, 1)
+
+    assert first == second == create_title_combination(row_a, ['브랜드', '색상'], TEST_SYNONYMS, 1)
+    assert cache.info() == {'hits': 1, 'misses': 1, 'size': 1, 'maxsize': cache.maxsize}
+
+    # 선택 컬럼이나 버전이 다르면 다른 키
+    cache.title_combination(row_a, ['브랜드'], TEST_SYNONYMS, 1)
+    cache.title_combination(row_a, ['브랜드', '색상'], TEST_SYNONYMS, 2)
+    assert cache.info()['misses'] == 3
+
+def test_batch_cache():
+    """여러 버전 일괄 생성 캐시 테스트"""
+    cache = TitleCache()
+    row = {'브랜드': 'NBA', '색상': '블랙'}
+
+    expected = create_title_combinations(row, ['브랜드', '색상'], TEST_SYNONYMS, 4)
+    assert cache.title_combinations(row, ['브랜드', '색상'], TEST_SYNONYMS, 4) == expected
+    assert cache.title_combinations(row, ['브랜드', '색상'], TEST_SYNONYMS, 4) == expected
+    assert cache.hits == 4
+
+    # 캐시된 버전은 단건 조회에서도 사용
+    assert cache.title_combination(row, ['브랜드', '색상'], TEST_SYNONYMS, 3) == (expected[0][3], 6)
+    assert cache.hits == 5
+
+def test_lru_eviction():
+    """최대 크기를 넘으면 가장 오래된 항목부터 제거"""
+    cache = TitleCache(maxsize=2)
+    rows = [{'브랜드': name} for name in ('A', 'B', 'C')]
+
+    for row in rows:
+        cache.title_combination(row, ['브랜드'], TEST_SYNONYMS, 0)
+    assert len(cache) == 2
+
+    cache.title_combination(rows[2], ['브랜드'], TEST_SYNONYMS, 0)
+    cache.title_combination(rows[0], ['브랜드'], TEST_SYNONYMS, 0)
+    assert cache.hits == 1
+    assert cache.misses == 4
+
+def test_errors_not_cached():
+    """에러 결과는 캐시하지 않음"""
+    cache = TitleCache()
+    invalid_dict = {'브랜드': 'Nike'}
+
+    title, total = cache.title_combination({'브랜드': 'Nike'}, ['브랜드'], invalid_dict, 0)
+    assert title.startswith("ERROR:") and total == 0
+    assert len(cache) == 0
+
+def test_invalidated_on_new_dictionary():
+    """사전이 바뀌거나 다시 로드되면 캐시를 비우는지 테스트"""
+    cache = TitleCache()
+    row = {'브랜드': 'NBA', '색상': '블랙'}
+
+    index = build_synonym_index(TEST_SYNONYMS)
+    assert cache.title_combination(row, ['브랜드'], index, 0)[0] == '엔비에이 블랙'
+
+    # 다른 사전 객체
+    other = build_synonym_index({'브랜드': {'NBA': ['농구']}})
+    assert cache.title_combination(row, ['브랜드'], other, 0)[0] == '농구 블랙'
+    assert cache.hits == 0
+
+    # 같은 일반 사전이라도 사전을 다시 로드하면 무효화
+    cache.title_combination(row, ['브랜드'], TEST_SYNONYMS, 0)
+    test_file = "test_title_cache.xlsx"
+    wb = openpyxl.Workbook()
+    wb.active.title = '브랜드'
+    wb.save(test_file)
+    try:
+        load_synonym_dict_from_sheets(test_file)
+    finally:
+        if os.path.exists(test_file):
+            os.remove(test_file)
+
+    cache.title_combination(row, ['브랜드'], TEST_SYNONYMS, 0)
+    assert cache.hits == 0
+    assert len(cache) == 1
+
+def test_invalidated_on_stopwords_change():
+    """불필요한 단어 목록이 바뀌면 캐시를 비우는지 테스트"""
+    cache = TitleCache()
+    row = {'브랜드': 'NIKE', '패턴': '무지'}
+    original = get_stopwords()
+    try:
+        assert cache.title_combinations(row, [], TEST_SYNONYMS, 1)[0] == ['NIKE']
+
+        set_stopwords(['NIKE'])
+        expected = create_title_combinations(row, [], TEST_SYNONYMS, 1)[0]
+        assert expected == ['무지']
+        assert cache.title_combinations(row, [], TEST_SYNONYMS, 1)[0] == expected
+        assert cache.title_combination(row, [], TEST_SYNONYMS, 0)[0] == '무지'
+        assert cache.hits == 1
+
+    finally:
+        set_stopwords(original)
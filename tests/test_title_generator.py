@@ -8,7 +8,7 @@ from pathlib import Path
 # src 디렉토리를 Python 경로에 추가
 sys.path.append(str(Path(__file__).parent.parent))
 
-from src.title_generator import create_title_combination
+from src.title_generator import create_title_combination, create_title_combinations
 from src.title_generator.config import ORDERED_COLUMNS
 import pandas as pd
 
@@ -408,5 +408,45 @@ def test_empty_values():
         assert '  ' not in result, "불필요한 공백이 있음"
         assert result.count(' ') <= 2, f"잘못된 공백 처리: {result}"
 
+def test_batch_versions_match_single():
+    """한 번에 생성한 버전들이 개별 생성 결과와 같은지 테스트"""
+    row = pd.Series({
+        '브랜드': 'NBA',
+        '색상': '블랙',
+        '패턴': '무지',
+        '카테고리': '맨투맨'
+    })
+    
+    synonym_dict = {
+        '브랜드': {'NBA': ['엔비에이', 'N.B.A', '엔바']},
+        '색상': {'블랙': ['검정색', '흑색']},
+        '카테고리': {'맨투맨': ['맨투맨', '스웨트셔츠', '크루넥']}
+    }
+    
+    col_selection = ['브랜드', '색상', '카테고리']
+    
+    titles, total = create_title_combinations(row, col_selection, synonym_dict, 10)
+    
+    assert total == 18
+    assert len(titles) == 10
+    for version, title in enumerate(titles):
+        expected, _ = create_title_combination(row, col_selection, synonym_dict, version)
+        assert title == expected, f"Version {version}: Expected '{expected}' but got '{title}'"
+    
+    # 버전 인덱스 목록으로 요청
+    titles, _ = create_title_combinations(row, col_selection, synonym_dict, [17, 18])
+    assert titles[0] == create_title_combination(row, col_selection, synonym_dict, 17)[0]
+    assert titles[1] == create_title_combination(row, col_selection, synonym_dict, 0)[0]  # 순환
+
+def test_batch_versions_error():
+    """잘못된 사전이면 모든 버전이 에러를 반환하는지 테스트"""
+    row = {'브랜드': 'Nike'}
+    
+    titles, total = create_title_combinations(row, ['브랜드'], {'브랜드': 'Nike'}, 3)
+    
+    assert total == 0
+    assert len(titles) == 3
+    assert all(title.startswith("ERROR:") for title in titles)
+
 if __name__ == '__main__':
     pytest.main([__file__]) 
\ No newline at end of file
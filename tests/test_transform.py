@@ -3,6 +3,7 @@ import openpyxl
 import os
 from transform import generate_titles
 from unittest.mock import MagicMock
+import pytest
 
 def test_preserve_sheets():
     """다른 시트 보존 테스트"""
@@ -242,4 +243,174 @@ def test_edge_cases():
         
     finally:
         if os.path.exists(test_file):
-            os.remove(test_file) 
\ No newline at end of file
+            os.remove(test_file) 
+
+
+def test_output_workbook():
+    """새 출력 워크북 쓰기 테스트 (원본 파일은 그대로)"""
+    test_file = "test_output_source.xlsx"
+    output_file = "test_output_result.xlsx"
+
+    data_df = pd.DataFrame({
+        '상품코드': ['P1', 'P2', 'P3'],
+        '브랜드': ['아디다스', '나이키', '푸마'],
+        '색상': ['블랙', '화이트', '레드'],
+        '상품명_1': ['', '기존 제목', ''],
+    }, dtype=str)
+    data_df.to_excel(test_file, sheet_name='Sheet1', index=False)
+    with open(test_file, 'rb') as f:
+        original = f.read()
+
+    try:
+        mock_model = MagicMock()
+        mock_model._df = data_df.copy()
+        mock_model.update_cell = lambda r, c, v: None
+
+        generate_titles(
+            file_path=test_file,
+            sheet_name='Sheet1',
+            col_selection=['브랜드', '색상'],
+            synonym_dict={'브랜드': {'아디다스': ['ADIDAS'], '나이키': ['NIKE']}},
+            selected_rows=[2, 0, 1],
+            version_count=2,
+            progress_callback=None,
+            log_callback=None,
+            model=mock_model,
+            overwrite=False,
+            output_path=output_file,
+            output_sheet='결과'
+        )
+
+        with open(test_file, 'rb') as f:
+            assert f.read() == original, "원본 파일이 변경됨"
+
+        wb = openpyxl.load_workbook(output_file)
+        assert wb.sheetnames == ['결과']
+        rows = [list(row) for row in wb['결과'].iter_rows(values_only=True)]
+        wb.close()
+
+        # 헤더 + 선택 행 순서, 상품명_2는 M열(13번째)에 생기고 사이 빈 열은 헤더 없음
+        assert rows[0][:4] == ['상품코드', '브랜드', '색상', '상품명_1']
+        assert rows[0][4:12] == [None] * 8 and rows[0][12] == '상품명_2'
+        assert [row[0] for row in rows[1:]] == ['P3', 'P1', 'P2']
+        assert rows[1][3] == '푸마 레드'
+        assert rows[2][3] == 'ADIDAS 블랙'
+        assert rows[3][3] == '기존 제목'  # 덮어쓰기 안 함
+        assert rows[3][12] == 'NIKE 화이트'
+
+        with pytest.raises(Exception):
+            generate_titles(
+                test_file, 'Sheet1', ['브랜드'], {}, [0], 1, None, None, mock_model,
+                output_path=test_file
+            )
+
+    finally:
+        for path in (test_file, output_file):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def test_backend_bulk_write():
+    """백엔드 결과를 컬럼 단위로 쓴 결과가 행별 처리와 같은지 테스트"""
+    data_df = pd.DataFrame({
+        '브랜드': ['아디다스', '나이키', '푸마', '아디다스'],
+        '색상': ['블랙', '화이트', '레드', ''],
+        '상품명_1': ['', '기존 제목', '', ''],
+    }, dtype=str)
+    synonym_dict = {
+        '브랜드': {'아디다스': ['ADIDAS', '아디'], '나이키': ['NIKE']},
+        '색상': {'블랙': ['BLACK']}
+    }
+    results = {}
+    try:
+        for backend in (None, 'indexed'):
+            test_file = f"test_bulk_{backend}.xlsx"
+            data_df.to_excel(test_file, sheet_name='Sheet1', index=False)
+            mock_model = MagicMock()
+            mock_model._df = data_df.copy()
+            mock_model.update_cell = lambda r, c, v: None
+
+            generate_titles(
+                test_file, 'Sheet1', ['브랜드', '색상'], synonym_dict, [3, 0, 1], 2,
+                None, None, mock_model, overwrite=False, backend=backend, save_mode='patch'
+            )
+            wb = openpyxl.load_workbook(test_file)
+            results[backend] = [list(row) for row in wb['Sheet1'].iter_rows(values_only=True)]
+            wb.close()
+            if backend is not None:
+                # 모델도 컬럼마다 한 번에 갱신
+                calls = {args[1]: (args[0], args[2]) for args, _ in mock_model.update_cells.call_args_list}
+                assert calls[2] == ([3, 0], ['ADIDAS', 'ADIDAS BLACK'])
+
+        assert results['indexed'] == results[None]
+        assert results[None][2][2] == '기존 제목'
+        assert results[None][2][12] == 'NIKE 화이트'
+
+    finally:
+        for backend in (None, 'indexed'):
+            if os.path.exists(f"test_bulk_{backend}.xlsx"):
+                os.remove(f"test_bulk_{backend}.xlsx")
+
+
+def test_output_written_per_chunk(monkeypatch):
+    """백엔드 청크가 끝날 때마다 출력 행을 쓰고, 행별 오류가 나도 행이 빠지지 않는지 테스트"""
+    import transform
+    from title_generator import iter_title_chunks
+
+    test_file = "test_chunk_source.xlsx"
+    output_file = "test_chunk_result.xlsx"
+    data_df = pd.DataFrame({
+        '상품코드': ['P1', 'P2', 'P3'],
+        '브랜드': ['아디다스', '나이키', '푸마'],
+        '상품명_1': ['', '', ''],
+    }, dtype=str)
+    data_df.to_excel(test_file, sheet_name='Sheet1', index=False)
+    synonym_dict = {'브랜드': {'아디다스': ['ADIDAS'], '나이키': ['NIKE']}}
+    written_before_chunk = []
+
+    def small_chunks(*args, **kwargs):
+        for chunk in iter_title_chunks(*args, chunk_size=2, **kwargs):
+            yield chunk
+            written_before_chunk.append(mock_model.update_cells.call_count)
+
+    try:
+        monkeypatch.setattr(transform, 'iter_title_chunks', small_chunks)
+        mock_model = MagicMock()
+        mock_model._df = data_df.copy()
+        progress = []
+
+        generate_titles(
+            test_file, 'Sheet1', ['브랜드'], synonym_dict, [2, 0, 1], 1,
+            lambda done, total: progress.append((done, total)), None, mock_model,
+            backend='vectorized', output_path=output_file
+        )
+        # 다음 청크를 만들기 전에 이전 청크를 이미 씀
+        assert written_before_chunk == [1, 2]
+        assert progress == [(2, 3), (3, 3)]
+        wb = openpyxl.load_workbook(output_file)
+        rows = [list(row)[:3] for row in wb.active.iter_rows(min_row=2, values_only=True)]
+        wb.close()
+        assert rows == [['P3', '푸마', '푸마'], ['P1', '아디다스', 'ADIDAS'], ['P2', '나이키', 'NIKE']]
+
+        # 행별 처리에서 오류가 난 행은 원본 그대로 씀
+        def fail_p1(row, col, value):
+            if row == 0:
+                raise RuntimeError("셀 갱신 실패")
+
+        mock_model.update_cell = fail_p1
+        os.remove(output_file)
+        generate_titles(
+            test_file, 'Sheet1', ['브랜드'], synonym_dict, [2, 0, 1], 1,
+            None, None, mock_model, output_path=output_file
+        )
+        wb = openpyxl.load_workbook(output_file)
+        rows = [list(row)[:3] for row in wb.active.iter_rows(min_row=2, values_only=True)]
+        wb.close()
+        assert [row[0] for row in rows] == ['P3', 'P1', 'P2']
+        assert rows[0][2] == '푸마' and rows[2][2] == 'NIKE'
+        assert rows[1][:2] == ['P1', '아디다스']
+
+    finally:
+        for path in (test_file, output_file):
+            if os.path.exists(path):
+                os.remove(path)
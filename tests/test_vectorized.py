@@ -0,0 +1,85 @@
+"""
+DataFrame 단위 제목 생성 테스트
+"""
+import pandas as pd
+
+from title_generator import create_title_combinations, generate_title_matrix, build_synonym_index
+
+TEST_SYNONYMS = {
+    '브랜드': {
+        'NBA': ['엔비에이', 'N.B.A', '엔바'],
+        'Nike': ['나이키', 'NIKE']
+    },
+    '색상': {
+        '블랙': ['검정색', '흑색', '먹색'],
+        '네이비': ['곤색', '']
+    },
+    '패턴': {
+        '무지': ['무지', '솔리드']
+    },
+    '카테고리': {
+        '맨투맨': ['맨투맨', '스웨트셔츠', '크루넥']
+    }
+}
+
+def make_frame():
+    """중복 조합과 빈 값/결측값이 섞인 테스트 데이터"""
+    return pd.DataFrame({
+        '유의어': [''] * 8,
+        '브랜드': ['NBA', 'nba ', 'Nike', 'NBA', '없는브랜드', None, 'Nike', 'NBA'],
+        '색상': ['블랙', '블랙', '네이비', '블랙', '', '블랙', float('nan'), '블랙'],
+        '패턴': ['무지', '무지', '[S] 체크', '무지', '무지', '', '무지', '무지'],
+        '카테고리': ['맨투맨', '맨투맨', '맨투맨(in&out)', '맨투맨', '셔츠', '맨투맨', '맨투맨', '맨투맨'],
+    })
+
+def test_matches_row_by_row():
+    """행 단위 생성과 결과가 같은지 테스트"""
+    df = make_frame()
+    col_selection = ['브랜드', '색상', '패턴', '카테고리']
+    rows = [7, 0, 1, 2, 3, 4, 5, 6]
+
+    for synonym_dict in (TEST_SYNONYMS, build_synonym_index(TEST_SYNONYMS)):
+        for version_count in (1, 5, 10):
+            matrix = generate_title_matrix(df, rows, col_selection, synonym_dict, version_count)
+
+            assert len(matrix) == len(rows)
+            for titles, df_idx in zip(matrix, rows):
+                expected, _ = create_title_combinations(
+                    df.iloc[df_idx], col_selection, synonym_dict, version_count
+                )
+                assert titles == expected, f"행 {df_idx}: {titles} != {expected}"
+
+def test_missing_columns():
+    """속성 컬럼이 없는 경우 테스트"""
+    df = pd.DataFrame({'브랜드': ['NBA', 'Nike'], '카테고리': ['맨투맨', '셔츠']})
+
+    matrix = generate_title_matrix(df, [0, 1], ['브랜드'], TEST_SYNONYMS, 2)
+
+    assert matrix == [['엔비에이 맨투맨', 'N.B.A 맨투맨'], ['나이키 셔츠', 'NIKE 셔츠']]
+
+def test_invalid_dict_returns_errors():
+    """잘못된 사전 형식은 행 단위 생성과 같은 에러를 반환"""
+    df = pd.DataFrame({'브랜드': ['Nike', ''], '색상': ['블랙', '블랙']})
+    invalid_dict = {'브랜드': 'Nike', '색상': {'블랙': ['검정']}}
+
+    matrix = generate_title_matrix(df, [0, 1], ['브랜드', '색상'], invalid_dict, 2)
+
+    assert matrix[0] == create_title_combinations(df.iloc[0], ['브랜드', '색상'], invalid_dict, 2)[0]
+    assert matrix[0][0].startswith("ERROR:")
+    assert matrix[1] == ['검정', '검정']  # 빈 브랜드는 매칭하지 않으므로 정상 처리
+
+def test_empty_rows():
+    """처리할 행이 없는 경우"""
+    assert generate_title_matrix(make_frame(), [], ['브랜드'], TEST_SYNONYMS, 3) == []
+
+def test_all_missing_column():
+    """선택한 행에서 결측값뿐인 컬럼이 있어도 행 단위 생성과 같은지 테스트"""
+    df = make_frame()
+    rows = [5, 6]  # 브랜드 None, 색상 NaN
+    for col_selection in (['브랜드', '색상'], ['색상']):
+        matrix = generate_title_matrix(df, rows, col_selection, TEST_SYNONYMS, 3)
+        assert matrix == [
+            create_title_combinations(df.iloc[row], col_selection, TEST_SYNONYMS, 3)[0] for row in rows
+        ]
+    assert generate_title_matrix(df, [5], ['브랜드'], TEST_SYNONYMS, 2) == \
+        [create_title_combinations(df.iloc[5], ['브랜드'], TEST_SYNONYMS, 2)[0]]
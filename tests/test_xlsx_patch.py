@@ -0,0 +1,146 @@
+"""
+xlsx 셀 패치 저장 테스트
+"""
+import os
+import shutil
+import zipfile
+from unittest.mock import MagicMock
+
+import openpyxl
+import pandas as pd
+import pytest
+from openpyxl.styles import Font
+
+from excel_io import SheetReader
+from transform import generate_titles
+from xlsx_patch import PatchError, patch_cells
+from xlsx_reader import XlsxReader
+
+UPDATES = {
+    (2, 3): 'NBA <블랙> & 화이트',  # 스타일 있는 기존 셀 교체
+    (2, 5): '새 셀',                # 행 끝 뒤에 추가
+    (3, 1): '앞에 추가',             # 기존 셀 앞에 추가
+    (3, 2): '',                      # 빈 값
+    (5, 2): '빈 행에 추가',           # 중간에 없는 행
+    (9, 4): '  공백 유지 ',           # 마지막 행 뒤에 추가
+}
+
+def make_workbook(path):
+    """상품 시트(스타일/빈 행 포함)와 유의어 시트"""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = 'Sheet1'
+    ws.append(['상품코드', '브랜드', '상품명_1'])
+    ws.append(['P001', 'NBA', '기존 제목'])
+    ws.append([None, 'Nike', None])
+    ws.append(['P004', '=B2&B3', '수식'])
+    ws['C2'].font = Font(bold=True)
+    synonyms = wb.create_sheet('브랜드')
+    synonyms.append(['원본', '유의어1'])
+    synonyms.append(['NBA', '엔비에이'])
+    wb.save(path)
+
+def sheet_values(path):
+    """시트별 전체 값 (openpyxl 일반 모드)"""
+    wb = openpyxl.load_workbook(path)
+    try:
+        return {ws.title: [list(row) for row in ws.iter_rows(values_only=True)] for ws in wb}
+    finally:
+        wb.close()
+
+def test_patch_matches_openpyxl_save():
+    """셀 패치 결과가 openpyxl 저장과 같은 값인지 테스트"""
+    test_file = "test_patch.xlsx"
+    expected_file = "test_patch_expected.xlsx"
+    try:
+        make_workbook(test_file)
+        shutil.copyfile(test_file, expected_file)
+        wb = openpyxl.load_workbook(expected_file)
+        for (row, column), value in UPDATES.items():
+            wb['Sheet1'].cell(row=row, column=column, value=value)
+        wb.save(expected_file)
+        wb.close()
+
+        with zipfile.ZipFile(test_file) as archive:
+            before = {name: archive.read(name) for name in archive.namelist()}
+        assert patch_cells(test_file, 'Sheet1', UPDATES) == len(UPDATES)
+
+        assert sheet_values(test_file) == sheet_values(expected_file)
+        # 읽기 전용/xml 엔진도 시트 크기(dimension)까지 읽음
+        with SheetReader(test_file) as reader, XlsxReader(test_file) as xml_reader:
+            rows = [tuple(row) for row in reader.iter_rows('Sheet1')]
+            assert rows[8] == (None, None, None, '  공백 유지 ', None)
+            assert list(xml_reader.iter_rows('Sheet1')) == rows
+
+        # 스타일 유지
+        wb = openpyxl.load_workbook(test_file)
+        assert wb['Sheet1']['C2'].font.bold
+        wb.close()
+
+        # 대상 시트 외의 파트는 내용 그대로
+        with zipfile.ZipFile(test_file) as archive:
+            after = {name: archive.read(name) for name in archive.namelist()}
+        changed = [name for name in before if before[name] != after[name]]
+        assert changed == ['xl/worksheets/sheet1.xml']
+        assert list(after) == list(before)
+
+    finally:
+        for path in (test_file, expected_file):
+            if os.path.exists(path):
+                os.remove(path)
+
+def test_patch_formula_cell():
+    """수식 셀은 패치하지 않고 원본 파일 유지 테스트"""
+    test_file = "test_patch_formula.xlsx"
+    try:
+        make_workbook(test_file)
+        with open(test_file, 'rb') as f:
+            original = f.read()
+
+        for updates in ({(4, 2): '새 값'}, {(2, 2): '=SUM(A1)'}):
+            with pytest.raises(PatchError):
+                patch_cells(test_file, 'Sheet1', updates)
+            with open(test_file, 'rb') as f:
+                assert f.read() == original
+        # 임시 파일이 남지 않음
+        assert not [name for name in os.listdir('.') if name.startswith('tmp') and name.endswith('.xlsx')]
+
+    finally:
+        if os.path.exists(test_file):
+            os.remove(test_file)
+
+def test_generate_titles_patch_mode():
+    """generate_titles의 패치 저장이 openpyxl 저장과 같은 결과인지 테스트"""
+    data_df = pd.DataFrame({
+        '유의어': ['', '', ''],
+        '브랜드': ['아디다스', '나이키', '푸마'],
+        '색상': ['블랙', '화이트', '레드'],
+        '상품명_1': ['', '', ''],
+    }, dtype=str)
+    synonym_dict = {
+        '브랜드': {'아디다스': ['ADIDAS'], '나이키': ['NIKE', '나이키']},
+        '색상': {'블랙': ['BLACK'], '화이트': ['WHITE']},
+    }
+    files = {'openpyxl': "test_save_openpyxl.xlsx", 'patch': "test_save_patch.xlsx"}
+    try:
+        for save_mode, path in files.items():
+            with pd.ExcelWriter(path) as writer:
+                data_df.to_excel(writer, sheet_name='Sheet1', index=False)
+                pd.DataFrame({'원본': ['아디다스'], '유의어': ['ADIDAS']}).to_excel(
+                    writer, sheet_name='브랜드', index=False
+                )
+            mock_model = MagicMock()
+            mock_model._df = data_df.copy()
+            mock_model.update_cell = lambda r, c, v: None
+            generate_titles(
+                path, 'Sheet1', ['브랜드', '색상'], synonym_dict, [0, 1], 2,
+                None, None, mock_model, save_mode=save_mode
+            )
+
+        assert sheet_values(files['patch']) == sheet_values(files['openpyxl'])
+        assert sheet_values(files['patch'])['Sheet1'][1][:4] == [None, '아디다스', '블랙', 'ADIDAS BLACK']
+
+    finally:
+        for path in files.values():
+            if os.path.exists(path):
+                os.remove(path)